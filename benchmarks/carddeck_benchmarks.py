@@ -0,0 +1,177 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+Benchmarks for the Card and Deck hot paths.
+
+Every benchmark times its statement against the same input each call: the
+sort benchmarks sort a shuffled 8-deck shoe (restoring the shuffled order
+from a snapshot before each in-place sort), and the reset benchmarks pick
+PICKS_BEFORE_RESET cards before resetting, so there's something to undo.
+
+Run with ``scripts.benchmark()`` or
+``python -m benchmarks.carddeck_benchmarks``. Results are written as JSON,
+so runs can be compared across releases.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+import tmt_carddeck
+from tmt_carddeck.card import Card
+from tmt_carddeck.deck import Deck, PackedDeck, standard_deck
+from tmt_carddeck.shoe import Shoe
+
+SHOE_DECKS = 8
+SHUFFLE_SEED = 1
+PICKS_BEFORE_RESET = 10
+
+
+def _shoe():
+    """Return the cards of an 8-deck shoe, in order."""
+    return [the_card for _ in range(SHOE_DECKS) for the_card in standard_deck()]
+
+
+def _shuffled_shoe():
+    """Return the cards of an 8-deck shoe, in a fixed shuffled order."""
+    the_cards = _shoe()
+    random.Random(SHUFFLE_SEED).shuffle(the_cards)
+    return the_cards
+
+
+def _shuffled_deck(deck_class):
+    """
+    Return a setup function for sorting: it creates a shuffled shoe of
+    deck_class, and returns it with a snapshot of the shuffled order.
+    """
+
+    def setup():
+        the_deck = deck_class(_shoe())
+        the_deck.shuffle(seed=SHUFFLE_SEED)
+        return the_deck, the_deck.snapshot()
+
+    return setup
+
+
+def _sort_shuffled(state):
+    """Restore a deck's shuffled order, then sort it."""
+    the_deck, shuffled = state
+    the_deck.restore(shuffled)
+    the_deck.sort()
+
+
+def _pick_and_reset(the_deck):
+    """Pick a few cards from a deck, then reset it."""
+    the_deck.pick_many(PICKS_BEFORE_RESET)
+    the_deck.reset_deck()
+
+
+def _pick_until_empty(the_deck):
+    """Pick every card from a deck, then reset it."""
+    for _ in range(len(the_deck)):
+        the_deck.pick()
+    the_deck.reset_deck()
+
+
+def _iterate(the_deck):
+    """Walk through every card in a deck."""
+    for _ in the_deck:
+        pass
+
+
+def _benchmarks():
+    """
+    Return a list of (name, setup, statement) tuples. setup() returns the
+    argument passed to statement().
+    """
+    return [
+        ("card_construction", lambda: None, lambda _: Card("A", "S")),
+        ("standard_deck", lambda: None, lambda _: standard_deck()),
+        ("card_int", lambda: Card("Q", "H"), int),
+        ("sort_shoe", _shuffled_shoe, sorted),
+        ("deck_sort_shoe", _shuffled_deck(Deck), _sort_shuffled),
+        ("packed_deck_sort_shoe", _shuffled_deck(PackedDeck), _sort_shuffled),
+        ("hash_shoe_into_set", _shoe, set),
+        ("pick_until_empty", standard_deck, _pick_until_empty),
+        ("reset_deck", standard_deck, _pick_and_reset),
+        ("shoe_reset", lambda: Shoe(num_decks=SHOE_DECKS), _pick_and_reset),
+        ("iterate_deck", standard_deck, _iterate),
+    ]
+
+
+def run_benchmark(name, setup, statement, repeat=5, min_time=0.2):
+    """
+    Time one benchmark and measure its peak memory.
+
+    Returns:
+        A dict with the best time per call (seconds), calls per second, the
+        number of calls per timing run, and the peak memory allocated by one
+        call (bytes).
+    """
+    argument = setup()
+    timer = timeit.Timer(lambda: statement(argument))
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    statement(argument)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "seconds_per_call": best,
+        "calls_per_second": 1.0 / best if best else None,
+        "calls_per_run": number,
+        "peak_memory_bytes": peak_bytes,
+    }
+
+
+def run_all(repeat=5, min_time=0.2, only=None):
+    """Run the benchmarks and return the JSON-ready report."""
+    results = [
+        run_benchmark(name, setup, statement, repeat=repeat, min_time=min_time)
+        for name, setup, statement in _benchmarks()
+        if not only or name in only
+    ]
+    return {
+        "package_version": tmt_carddeck.__version__,
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "benchmarks": results,
+    }
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", "-o", help="write the JSON report here instead of stdout")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum seconds per timing run"
+    )
+    parser.add_argument("only", nargs="*", help="names of the benchmarks to run (default: all)")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(
+        run_all(repeat=args.repeat, min_time=args.min_time, only=args.only), indent=2
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
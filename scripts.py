@@ -22,6 +22,20 @@ def test():
     )
 
 
+def benchmark():
+    """Run the Card and Deck benchmarks and print a JSON report"""
+    subprocess.run(
+        [
+            "poetry",
+            "run",
+            "python",
+            "-m",
+            "benchmarks.carddeck_benchmarks",
+        ],
+        check=True,
+    )
+
+
 def black():
     """Run black on the source and test files"""
     subprocess.run(["poetry", "run", "black", "tmt_carddeck", "tests"], check=True)
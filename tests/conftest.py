@@ -6,10 +6,24 @@
 
 import pytest  # pylint:disable=unused-import
 
+from tmt_carddeck import eval as hand_eval
 from tmt_carddeck.card import Card
 from tmt_carddeck.deck import Deck
 
 
+@pytest.fixture(autouse=True, scope="session")
+def eval_cache_home(tmp_path_factory):
+    """
+    Keep the shared evaluator's table cache out of the real cache
+    directory, and start and finish with no shared evaluator.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        hand_eval._SHARED_EVALUATORS.clear()  # pylint:disable=protected-access
+        yield
+        hand_eval._SHARED_EVALUATORS.clear()  # pylint:disable=protected-access
+
+
 @pytest.fixture
 def starter_deck() -> Deck:
     """Return a starter deck for testing."""
@@ -6,13 +6,17 @@
 CircuitPython Card Deck Library
 """
 
+import pickle
+
 import pytest  # pylint:disable=unused-import
 
-from tmt_carddeck.card import Card
+from tmt_carddeck import card as card_module
+from tmt_carddeck.card import Card, parse_cards
 from tmt_carddeck.constants import FACE_DOWN, FACE_UP, ROTATION_0, ROTATION_180
+from tmt_carddeck.deck import standard_deck
 
 
-# pylint:disable=no-self-use,missing-function-docstring
+# pylint:disable=no-self-use,missing-function-docstring,protected-access
 
 
 class TestCard:
@@ -70,6 +74,69 @@ class TestCard:
         assert int(Card("A", "S")) == 52
         assert int(Card("*")) == 53
         assert int(Card(rank=2, suit="F", is_joker=True)) == 162
+        assert int(Card(None, None)) == 0
+
+    def test_sort_with_blank_and_joker(self):
+        the_cards = [Card("*", "*"), Card("A", "S"), Card(None, None), Card(2, "C")]
+        assert [str(the_card) for the_card in sorted(the_cards)] == [
+            "NoneNone",
+            "2C",
+            "AS",
+            "*",
+        ]
+
+    def test_sort_key(self):
+        cards = [Card("A", "C"), Card(2, "S"), Card(None, None), Card("*", "*"), Card(2, "C")]
+        assert sorted(cards, key=Card.sort_key) == sorted(cards)
+        assert sorted(cards, key=lambda the_card: the_card.sort_key("rank")) == [
+            Card(None, None),
+            Card(2, "C"),
+            Card(2, "S"),
+            Card("A", "C"),
+            Card("*", "*"),
+        ]
+        assert Card(2, "S").sort_key("suit") > Card("A", "H").sort_key("suit")
+        with pytest.raises(ValueError):
+            Card(2, "S").sort_key("color")
+
+    def test_from_string(self):
+        assert Card.from_string("AS") == Card("A", "S")
+        assert Card.from_string("10h") == Card(10, "H")
+        assert Card.from_string("NoneNone") == Card(None, None)
+        assert Card.from_string("*") == Card("*", "*")
+        assert Card.from_string("*R") == Card("*", "R")
+        assert Card.from_string("*as") == Card("A", "S", is_joker=True)
+        assert Card.from_string(" 10h ") == Card(10, "H")
+        assert Card.from_string("AS") is not Card.from_string("AS")
+        for the_card in standard_deck():
+            assert Card.from_string(str(the_card)) == the_card
+        for card_string in ("", "X", "1S", "AZ", "*xyz", "*PP", "**", "*AR S"):
+            with pytest.raises(ValueError):
+                Card.from_string(card_string)
+
+    def test_parsing_doesnt_grow_caches(self):
+        parse_cards("AS ks *R")
+        sizes = (len(card_module._STRING_FACES), len(card_module._FACE_CACHE))
+        parse_cards("as aS  As   AS ks kS  *r *R *b")
+        for card_string in ("*xyz", "*" + "Q" * 20, "  zz  "):
+            with pytest.raises(ValueError):
+                Card.from_string(card_string)
+        assert (len(card_module._STRING_FACES), len(card_module._FACE_CACHE)) == sizes
+        Card(" w ", "w", is_joker=True)
+        Card("w", " w", is_joker=True)
+        assert len(card_module._FACE_CACHE) == sizes[1] + 1
+
+    def test_parse_cards(self):
+        assert parse_cards("AS KD 10H *") == [
+            Card("A", "S"),
+            Card("K", "D"),
+            Card(10, "H"),
+            Card("*", "*"),
+        ]
+        assert parse_cards("2c,3c", separator=",") == [Card(2, "C"), Card(3, "C")]
+        assert not parse_cards("  ")
+        with pytest.raises(ValueError):
+            parse_cards("AS QQ")
 
     def test_card_equality(self):
         card_one = Card(3, "C")
@@ -104,12 +171,25 @@ class TestCard:
         assert repr(Card("*")) == "*"
 
     def test_dunder_hash(self):
-        assert hash(Card("A", "D")) == 69697
-        assert hash(Card(5, "S")) == 85045
-        assert hash(Card("*")) == 42
-        assert hash(Card(rank="*", suit="R")) == 84010
-        assert hash(Card(rank=3, suit="*")) == 43059
-        assert hash(Card(rank=10, suit="F", is_joker=True)) == 71777
+        assert hash(Card("A", "D")) == Card("A", "D").face_code
+        assert hash(Card(5, "S")) == Card(5, "S").face_code
+        assert hash(Card(None, None)) == 0
+        assert hash(Card("*", "*")) == 53
+        assert hash(Card("*")) == hash(("*", None))
+        assert hash(Card(rank="*", suit="R")) == hash(("*", "R"))
+        assert hash(Card(rank=10, suit="F", is_joker=True)) == hash(("10", "F"))
+
+    def test_hash_is_collision_free(self):
+        the_cards = list(standard_deck())
+        assert len({hash(the_card) for the_card in the_cards}) == len(the_cards)
+        assert len({Card(10, "S"), Card("A", "C"), Card("*", "a"), Card("*", "A")}) == 4
+
+    def test_hash_matches_equality(self):
+        reordered = Card("A", "S", rank_order=["A", "K"], suit_order=["S", "H"])
+        assert reordered == Card("A", "S")
+        assert hash(reordered) == hash(Card("A", "S"))
+        assert hash(Card("A", "S", is_joker=True)) == hash(Card("A", "S"))
+        assert {Card("Q", "H"): 1}[Card("Q", "H")] == 1
 
     def test_can_sign_text(self):
         the_card = Card("A", "S")
@@ -188,7 +268,53 @@ class TestCard:
             _ = next(deck_iterator)
 
     def test_can_override_rank_order(self):
-        pass
+        the_card = Card("A", "S", rank_order=["A", "K"])
+        assert the_card.rank_order == ["A", "K"]
+        assert the_card.rank_value == 0
+        with pytest.raises(ValueError):
+            Card("2", "S", rank_order=["A", "K"])
 
     def test_can_override_suit_order(self):
-        pass
+        the_card = Card("A", "S", suit_order=["S", "H"])
+        assert the_card.suit_order == ["S", "H"]
+        assert the_card.suit_value == 0
+        with pytest.raises(ValueError):
+            Card("A", "C", suit_order=["S", "H"])
+
+    def test_cards_share_order_tables(self):
+        assert Card("A", "S").card_order is Card(2, "C").card_order
+        assert (
+            Card("A", "S", rank_order=["A", "K"]).card_order
+            is Card("K", "S", rank_order=("A", "K")).card_order
+        )
+        assert Card("A", "S").card_order is not Card("A", "S", rank_order=["A"]).card_order
+
+    def test_get_returns_interned_face(self):
+        assert Card.get("A", "S") is Card.get("A", "S")
+        assert Card.get(10, "H") is Card.get("10", "H")
+        assert Card("A", "S").face is Card.get("A", "S")
+        assert Card.get("A", "S") is not Card.get("A", "H")
+        assert Card.get("A", "S") == Card("A", "S")
+        assert hash(Card.get("A", "S")) == hash(Card("A", "S"))
+
+    def test_face_state_is_per_card(self):
+        card_one = Card("A", "S")
+        card_two = Card.from_face(Card.get("A", "S"))
+        card_one.turn_over()
+        card_one.sign(text_signature="Tammy")
+        assert card_two.orientation == FACE_UP
+        assert card_two.signature is None
+        assert card_one == card_two
+        assert len({card_one, card_two}) == 1
+
+    def test_pickled_card_keeps_face(self):
+        the_card = Card("Q", "D", orientation=FACE_DOWN)
+        new_card = pickle.loads(pickle.dumps(the_card))
+        assert new_card.face is the_card.face
+        assert new_card.orientation == FACE_DOWN
+
+    def test_can_override_value_order(self):
+        the_card = Card("A", "S")
+        the_card.value_order = ["", "AS", "*"]
+        assert int(the_card) == 1
+        assert int(Card("A", "S")) == 52
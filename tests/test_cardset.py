@@ -0,0 +1,74 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import Card, parse_cards
+from tmt_carddeck.cardset import CardSet
+from tmt_carddeck.deck import PackedDeck, standard_deck
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestCardSet:
+    """Unit tests for the CardSet class"""
+
+    def test_membership_and_size(self):
+        card_set = CardSet(parse_cards("AS KD 10H *"))
+        assert len(card_set) == 4
+        assert Card("A", "S") in card_set
+        assert Card("A", "H") not in card_set
+        assert Card("*", "*") in card_set
+        assert Card("*", "R") not in card_set
+        assert "AS" not in card_set
+        assert not CardSet()
+        assert len(CardSet.full()) == 52
+        assert len(CardSet.full(include_blank=True, include_joker=True)) == 54
+
+    def test_set_algebra(self):
+        spades = CardSet(parse_cards("AS KS QS"))
+        high = CardSet(parse_cards("AS AH KS"))
+        assert spades | high == CardSet(parse_cards("AS KS QS AH"))
+        assert spades & high == CardSet(parse_cards("AS KS"))
+        assert spades - high == CardSet(parse_cards("QS"))
+        assert spades ^ high == CardSet(parse_cards("QS AH"))
+        assert spades & high <= spades
+        assert spades >= CardSet(parse_cards("QS"))
+        assert (spades <= high) is False
+        assert spades - high != CardSet()
+        assert spades.isdisjoint(CardSet(parse_cards("2C")))
+        assert hash(spades) == hash(CardSet(parse_cards("QS KS AS")))
+
+    def test_iterates_in_value_order(self):
+        card_set = CardSet(parse_cards("AS * 2C NoneNone KD"))
+        assert list(card_set) == sorted(parse_cards("AS * 2C NoneNone KD"))
+        assert card_set.face_codes() == [0, 1, 25, 52, 53]
+        assert repr(CardSet(parse_cards("3C 2C"))) == "CardSet([2C, 3C])"
+
+    def test_deck_conversions(self):
+        the_deck = standard_deck()
+        the_deck.shuffle(seed=1)
+        seen = the_deck.pick_many(10)
+        remaining = CardSet.full(include_blank=True, include_joker=True) - CardSet(seen)
+        assert remaining == CardSet.from_deck(the_deck)
+        packed = standard_deck(packed=True)
+        assert CardSet.from_deck(packed) == CardSet.from_deck(standard_deck())
+        assert list(remaining.to_deck()) == sorted(the_deck)
+        assert isinstance(remaining.to_deck(packed=True), PackedDeck)
+        assert len(remaining.to_deck(packed=True)) == 44
+
+    def test_masks(self):
+        assert CardSet([1, 2]).mask == 0b110
+        assert CardSet.from_mask(0b110) == CardSet(parse_cards("2C 3C"))
+        with pytest.raises(ValueError):
+            CardSet.from_mask(1 << 54)
+        with pytest.raises(ValueError):
+            CardSet([Card("*", "R")])
+        with pytest.raises(ValueError):
+            CardSet([60])
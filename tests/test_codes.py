@@ -0,0 +1,59 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck import codes
+from tmt_carddeck.card import Card
+from tmt_carddeck.constants import FACE_DOWN, FACE_UP, ROTATION_90, ROTATION_270
+from tmt_carddeck.deck import standard_deck
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestCodes:
+    """Unit tests for the compact card codes"""
+
+    def test_face_codes_match_int_value(self):
+        for the_card in standard_deck():
+            assert the_card.face_code == int(the_card)
+        assert Card(None, None).face_code == codes.BLANK_CODE
+        assert Card("*", "*").face_code == codes.JOKER_CODE
+
+    def test_face_code_indices(self):
+        the_card = Card("Q", "H")
+        assert codes.face_rank_index(the_card.face_code) == the_card.rank_value
+        assert codes.face_suit_index(the_card.face_code) == the_card.suit_value
+        assert codes.encode_face(the_card.rank_value, the_card.suit_value) == the_card.face_code
+
+    def test_encode_decode(self):
+        card_code = codes.encode(12, FACE_DOWN, ROTATION_270)
+        assert codes.decode(card_code) == (12, FACE_DOWN, ROTATION_270)
+        assert codes.decode(codes.encode(12)) == (12, FACE_UP, 0)
+
+    def test_card_round_trip(self):
+        the_card = Card("10", "D", rotation=ROTATION_90, orientation=FACE_DOWN)
+        new_card = Card.from_code(the_card.code)
+        assert new_card == the_card
+        assert str(new_card) == "10D"
+        assert new_card.rotation == ROTATION_90
+        assert new_card.orientation == FACE_DOWN
+
+    def test_special_cards_round_trip(self):
+        assert str(Card.from_code(Card("*", "*").code)) == "*"
+        assert Card.from_code(Card(None, None).code) == Card(None, None)
+
+    def test_nonstandard_card_has_no_code(self):
+        with pytest.raises(ValueError):
+            _ = Card("*", "R").code
+        with pytest.raises(ValueError):
+            Card.from_code(codes.NUM_FACE_CODES)
+
+    def test_card_has_no_dict(self):
+        assert not hasattr(Card("A", "S"), "__dict__")
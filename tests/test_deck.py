@@ -9,16 +9,27 @@ CircuitPython  Card Deck Library
 # Disable Pylint "method could be a function" errors
 # pylint:disable=R0201, invalid-name
 
+import pickle
+import random
+import struct
+import threading
+
 import pytest  # noqa
 
 from tmt_carddeck.card import Card  # pytest:disable=unused-import
 from tmt_carddeck.constants import (
+    FACE_DOWN,
     DEFAULT_RANK_ORDER,
     DEFAULT_SUIT_ORDER,
+    SORT_BY_RANK,
 )
+from tmt_carddeck.shoe import Shoe
 from tmt_carddeck.deck import (
+    DEAL_BLOCK,
     Deck,
     DeckEmpty,
+    PackedDeck,
+    SERIAL_SIGNATURES,
     standard_deck,
 )  # noqa pylint:disable=unused-import
 
@@ -137,3 +148,329 @@ class TestDeck:
         assert len(only_playable_cards) == 52
         assert blank_card not in only_playable_cards
         assert joker_card not in only_playable_cards
+
+    def test_pick_order_and_locations(self) -> None:
+        the_deck = standard_deck(include_blank=False, include_joker=False)
+        assert the_deck.pick() == Card(2, "C")
+        assert the_deck.pick() == Card(3, "C")
+        assert the_deck[0] == Card(4, "C")
+        assert the_deck[-1] == Card("A", "S")
+        assert the_deck.pick(pick_location=1) == Card(5, "C")
+        assert the_deck.pick(pick_location=-1) == Card("A", "S")
+        assert len(the_deck) == 48
+        assert the_deck.cards[0] == Card(4, "C")
+        with pytest.raises(IndexError):
+            _ = the_deck[48]
+        with pytest.raises(IndexError):
+            _ = the_deck[-49]
+
+    def test_pick_many(self, starter_deck) -> None:
+        assert starter_deck.pick_many(2) == [Card(2, "S"), Card(3, "S")]
+        assert starter_deck.pick_many(3) == [Card(4, "S"), Card(5, "S"), Card(2, "S")]
+        assert len(starter_deck) == 3
+        with pytest.raises(DeckEmpty):
+            starter_deck.pick_many(4, reset_if_empty=False)
+        assert len(starter_deck) == 3
+        assert len(starter_deck.pick_many(10)) == 10
+
+    def test_negative_counts(self, starter_deck) -> None:
+        for the_deck in (starter_deck, standard_deck(packed=True), Shoe(num_decks=1, seed=1)):
+            remaining = len(the_deck)
+            with pytest.raises(ValueError):
+                the_deck.pick_many(-3)
+            with pytest.raises(ValueError):
+                the_deck.deal(2, -1)
+            with pytest.raises(ValueError):
+                the_deck.deal(-2, -3, pattern=DEAL_BLOCK)
+            assert len(the_deck) == remaining
+
+    def test_deal_round_robin(self) -> None:
+        the_deck = standard_deck(include_blank=False)
+        hands = the_deck.deal(4, 2)
+        assert hands == [
+            [Card(2, "C"), Card(6, "C")],
+            [Card(3, "C"), Card(7, "C")],
+            [Card(4, "C"), Card(8, "C")],
+            [Card(5, "C"), Card(9, "C")],
+        ]
+        assert the_deck[0] == Card(10, "C")
+
+    def test_deal_block(self) -> None:
+        the_deck = standard_deck(include_blank=False)
+        hands = the_deck.deal(2, 3, pattern=DEAL_BLOCK)
+        assert hands == [
+            [Card(2, "C"), Card(3, "C"), Card(4, "C")],
+            [Card(5, "C"), Card(6, "C"), Card(7, "C")],
+        ]
+        assert len(the_deck) == 47
+        assert the_deck.deal(2, 0, pattern=DEAL_BLOCK) == [[], []]
+        assert standard_deck(packed=True).deal(3, 0, pattern=DEAL_BLOCK) == [[], [], []]
+
+    def test_deal_compact(self) -> None:
+        hands = standard_deck(include_blank=False).deal(2, 2, compact=True)
+        assert hands == [bytes([1, 3]), bytes([2, 4])]
+        hands = standard_deck(include_blank=False, packed=True).deal(2, 2, compact=True)
+        assert hands == [bytes([1, 3]), bytes([2, 4])]
+
+    def test_deal_errors(self, starter_deck) -> None:
+        with pytest.raises(ValueError):
+            starter_deck.deal(2, 2, pattern="sideways")
+        with pytest.raises(DeckEmpty):
+            starter_deck.deal(3, 2, reset_if_empty=False)
+        assert len(starter_deck.deal(3, 2)[2]) == 2
+
+    def test_shuffle_is_reproducible(self) -> None:
+        deck_one = standard_deck()
+        deck_two = standard_deck()
+        deck_one.shuffle(seed=42)
+        deck_two.shuffle(seed=42)
+        assert list(deck_one) == list(deck_two)
+        assert list(deck_one) != list(standard_deck())
+        assert sorted(deck_one) == sorted(standard_deck())
+
+    def test_shuffle_with_rng(self) -> None:
+        deck_one = standard_deck(packed=True)
+        deck_two = standard_deck()
+        deck_one.shuffle(rng=random.Random(7))
+        deck_two.shuffle(rng=random.Random(7))
+        assert list(deck_one) == list(deck_two)
+
+    def test_shuffle_with_randrange_only(self) -> None:
+        class RandRangeOnly:  # pylint:disable=too-few-public-methods
+            def __init__(self, seed):
+                self._rng = random.Random(seed)
+
+            def randrange(self, stop):
+                return self._rng.randrange(stop)
+
+        the_deck = standard_deck()
+        the_deck.shuffle(rng=RandRangeOnly(3))
+        assert sorted(the_deck) == sorted(standard_deck())
+
+    def test_shuffle_is_uniform(self) -> None:
+        rng = random.Random(1)
+        counts = {}
+        for _ in range(6000):
+            the_deck = Deck(initial_cards=[Card(2, "S"), Card(3, "S"), Card(4, "S")])
+            the_deck.shuffle(rng=rng)
+            order = tuple(str(the_card) for the_card in the_deck)
+            counts[order] = counts.get(order, 0) + 1
+        assert len(counts) == 6
+        assert all(800 < count < 1200 for count in counts.values())
+
+    def test_sort(self) -> None:
+        the_deck = standard_deck()
+        the_deck.shuffle(seed=11)
+        the_deck.pick()
+        the_deck.sort()
+        assert list(the_deck) == sorted(the_deck)
+        the_deck.sort(reverse=True)
+        assert the_deck[0] == Card("*", "*")
+        the_deck.sort(by=SORT_BY_RANK)
+        assert the_deck[-5:] == [Card("A", suit) for suit in DEFAULT_SUIT_ORDER] + [Card("*", "*")]
+        with pytest.raises(ValueError):
+            the_deck.sort(by="color")
+
+    def test_sort_shoe_matches_packed(self) -> None:
+        cards = list(standard_deck()) * 8
+        random.Random(4).shuffle(cards)
+        the_deck = Deck(initial_cards=cards)
+        packed_deck = PackedDeck(cards)
+        for by in ("value", "rank", "suit"):
+            for reverse in (False, True):
+                the_deck.sort(by=by, reverse=reverse)
+                packed_deck.sort(by=by, reverse=reverse)
+                assert list(the_deck) == list(packed_deck)
+                assert len(packed_deck) == 432
+
+    def test_snapshot_and_restore(self) -> None:
+        the_deck = standard_deck()
+        the_deck.pick()
+        snapshot = the_deck.snapshot()
+        assert snapshot.top == 1
+        picked = the_deck.pick_many(3)
+        the_deck.shuffle(seed=1)
+        del the_deck[0]
+        the_deck[0] = Card("A", "S")
+        the_deck.restore(snapshot)
+        assert len(the_deck) == 53
+        assert the_deck.pick_many(3) == picked
+        the_deck.restore(snapshot)
+        assert list(the_deck) == list(standard_deck())[1:]
+
+    def test_snapshot_is_copy_on_write(self) -> None:
+        the_deck = standard_deck()
+        snapshot = the_deck.snapshot()
+        branch = standard_deck()
+        branch.restore(snapshot)
+        branch.pick()
+        assert branch.snapshot().cards is snapshot.cards
+        branch.sort(reverse=True)
+        assert branch.cards is not snapshot.cards
+        assert snapshot.cards[0] == Card(None, None)
+        the_deck.pick(pick_location=5)
+        assert len(snapshot.cards) == 54
+        with pytest.raises(ValueError):
+            PackedDeck().restore(snapshot)
+
+    def test_to_and_from_bytes(self) -> None:
+        the_deck = standard_deck()
+        the_deck.pick()
+        data = the_deck.to_bytes()
+        assert len(data) == 8 + 53
+        assert bytes(the_deck) == data
+        restored = Deck.from_bytes(data)
+        assert list(restored) == list(the_deck)
+        restored.pick_many(10)
+        restored.reset_deck()
+        assert len(restored) == 53
+
+    def test_bytes_keep_state_and_signatures(self) -> None:
+        the_deck = standard_deck()
+        the_deck[1].turn_over()
+        the_deck[2].rotate_by(180)
+        the_deck[3].sign(text_signature="Tammy")
+        the_deck[4].sign(graphic_signature="/sig.bmp")
+        data = the_deck.to_bytes(state=True, signatures=True)
+        restored = Deck.from_bytes(memoryview(bytearray(data)))
+        assert list(restored) == list(the_deck)
+        assert restored[1].orientation == FACE_DOWN
+        assert restored[2].rotation == 180
+        assert restored[3].signature == the_deck[3].signature
+        assert restored[4].signature.type == "graphic"
+        assert Deck.from_bytes(the_deck.to_bytes())[1].orientation != FACE_DOWN
+
+    def test_from_bytes_rejects_bad_data(self) -> None:
+        data = standard_deck().to_bytes(signatures=True)
+        for bad_data in (b"", b"XX" + data[2:], data[:20], data[:-1] + b"\xff"):
+            with pytest.raises(ValueError):
+                Deck.from_bytes(bad_data)
+        with pytest.raises(ValueError):
+            Deck.from_bytes(data[:8] + b"\x40" + data[9:])
+
+    def test_from_bytes_rejects_duplicate_signatures(self) -> None:
+        data = standard_deck().to_bytes()
+        signed = data[:3] + bytes((SERIAL_SIGNATURES,)) + data[4:]
+        entry = struct.pack("<IBI", 3, 0, 5) + b"Tammy"
+        assert Deck.from_bytes(signed + struct.pack("<I", 1) + entry)[3].signature.data == "Tammy"
+        with pytest.raises(ValueError):
+            Deck.from_bytes(signed + struct.pack("<I", 2) + entry + entry)
+
+    def test_nested_iteration(self, starter_deck) -> None:
+        starter_deck.pick()
+        pairs = [(first, second) for first in starter_deck for second in starter_deck]
+        assert len(pairs) == 9
+        assert iter(starter_deck) is not iter(starter_deck)
+
+    def test_thread_safe_picks(self) -> None:
+        the_deck = Deck(initial_cards=list(standard_deck()) * 40, thread_safe=True)
+        assert isinstance(the_deck, Deck)
+        assert the_deck.lock is not None
+        assert standard_deck().lock is None
+        picked = []
+
+        def dealer():
+            for _ in range(270):
+                picked.append(the_deck.pick(reset_if_empty=False))
+
+        threads = [threading.Thread(target=dealer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(the_deck) == 0
+        assert sorted(picked) == sorted(list(standard_deck()) * 40)
+
+    def test_thread_safe_subclasses(self) -> None:
+        the_deck = PackedDeck.from_bytes(standard_deck().to_bytes())
+        assert the_deck.lock is None
+        the_shoe = Shoe(num_decks=2, seed=1, thread_safe=True)
+        assert isinstance(the_shoe, Shoe)
+        with the_shoe.lock:
+            first = the_shoe.pick()
+            assert len(list(the_shoe)) == 103
+        assert isinstance(first, Card)
+        safe_deck = Deck(initial_cards=[Card(2, "S"), Card(3, "S")], thread_safe=True)
+        assert isinstance(safe_deck, Deck)
+        assert "pick" in vars(safe_deck) and "pick" not in vars(standard_deck())
+        assert safe_deck.cards is not safe_deck.cards
+        safe_deck.cards.clear()
+        assert len(safe_deck) == 2
+        packed = PackedDeck(initial_cards=[Card(2, "S")], thread_safe=True)
+        assert packed.face_codes is not packed.face_codes
+        assert list(packed) == [Card(2, "S")]
+        copy = pickle.loads(pickle.dumps(safe_deck))
+        assert copy.lock is not None and copy.lock is not safe_deck.lock
+        assert list(copy) == list(safe_deck)
+        assert (
+            "pick" in vars(copy)
+            and "pick" not in pickle.loads(pickle.dumps(standard_deck())).__dict__
+        )
+        assert copy.pick() == Card(2, "S") and len(safe_deck) == 2
+
+
+class TestPackedDeck:
+    """Unit tests for the PackedDeck class."""
+
+    def test_packed_std_deck(self) -> None:
+        the_deck = standard_deck(packed=True)
+        assert isinstance(the_deck, PackedDeck)
+        assert len(the_deck) == 54
+        assert list(the_deck) == list(standard_deck())
+        assert len(the_deck.face_codes) == 54
+        assert len(standard_deck(include_blank=False, include_joker=False, packed=True)) == 52
+
+    def test_packed_pick_and_reset(self) -> None:
+        the_deck = standard_deck(include_blank=False, packed=True)
+        assert the_deck.pick() == Card(2, "C")
+        assert the_deck.pick(pick_location=-1) == Card("*", "*")
+        assert len(the_deck) == 51
+        the_deck.reset_deck()
+        assert len(the_deck) == 53
+
+    def test_packed_pick_many(self) -> None:
+        the_deck = standard_deck(include_blank=False, packed=True)
+        the_deck.pick()
+        assert the_deck.pick_many(2) == [Card(3, "C"), Card(4, "C")]
+        assert the_deck[0] == Card(5, "C")
+
+    def test_packed_deal(self) -> None:
+        the_deck = standard_deck(include_blank=False, packed=True)
+        assert the_deck.deal(2, 1) == [[Card(2, "C")], [Card(3, "C")]]
+
+    def test_packed_sequence_methods(self) -> None:
+        the_deck = PackedDeck([Card("A", "S"), Card(2, "H"), 1])
+        assert the_deck[0] == Card("A", "S")
+        assert the_deck[1:] == [Card(2, "H"), Card(2, "C")]
+        the_deck[1] = Card("K", "D")
+        assert the_deck[1] == Card("K", "D")
+        the_deck[0:2] = [Card(3, "C")]
+        assert the_deck.cards == [Card(3, "C"), Card(2, "C")]
+        del the_deck[0]
+        assert Card(3, "C") not in the_deck
+        assert Card(2, "C") in the_deck
+        assert Card("*", "R") not in the_deck
+
+    def test_packed_snapshot(self) -> None:
+        the_deck = standard_deck(packed=True)
+        snapshot = the_deck.snapshot()
+        the_deck.face_codes[0] = 5
+        the_deck[1] = Card("A", "S")
+        assert snapshot.cards == standard_deck(packed=True).face_codes
+        the_deck.restore(snapshot)
+        assert list(the_deck) == list(standard_deck())
+
+    def test_packed_bytes(self) -> None:
+        the_deck = standard_deck(packed=True)
+        the_deck.shuffle(seed=3)
+        data = the_deck.to_bytes(state=True, signatures=True)
+        restored = PackedDeck.from_bytes(data)
+        assert restored.face_codes == the_deck.face_codes
+        assert PackedDeck.from_bytes(standard_deck().to_bytes()).face_codes == bytearray(range(54))
+        assert list(Deck.from_bytes(data)) == list(the_deck)
+
+    def test_packed_rejects_nonstandard_cards(self) -> None:
+        with pytest.raises(ValueError):
+            PackedDeck([Card("*", "R")])
+        with pytest.raises(ValueError):
+            PackedDeck([99])
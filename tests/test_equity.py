@@ -0,0 +1,76 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import Card
+from tmt_carddeck.equity import (
+    DEFAULT_NUM_CHUNKS,
+    MIN_CHUNK_SIZE,
+    _chunk_sizes,
+    simulate_equity,
+)
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestEquity:
+    """Unit tests for the equity simulator"""
+
+    def test_dominating_hand(self):
+        results = simulate_equity(
+            [[Card("A", "S"), Card("A", "H")], [Card(7, "C"), Card(2, "D")]],
+            trials=2000,
+            workers=1,
+            seed=1,
+        )
+        assert results[0].equity > 0.8
+        assert results[0].low <= results[0].equity <= results[0].high
+        assert results[0].trials == 2000
+        assert abs(results[0].equity + results[1].equity - 1.0) < 1e-9
+
+    def test_finished_board_is_certain(self):
+        board = [Card("A", "D"), Card("A", "C"), Card(9, "S"), Card(4, "H"), Card(2, "H")]
+        results = simulate_equity(
+            [[Card("A", "S"), Card("K", "H")], [Card("K", "S"), Card("Q", "H")]],
+            board=board,
+            trials=10,
+            workers=1,
+        )
+        assert results[0].equity == 1.0
+        assert results[0].wins == 10
+        assert results[1].wins == 0
+
+    def test_split_pot(self):
+        board = [Card("A", "D"), Card("K", "C"), Card("Q", "S"), Card("J", "H"), Card(10, "H")]
+        results = simulate_equity(
+            [[Card(2, "S"), Card(3, "H")], [Card(2, "D"), Card(4, "H")]],
+            board=board,
+            trials=10,
+            workers=1,
+        )
+        assert results[0].ties == 10
+        assert results[0].equity == 0.5
+
+    def test_seeded_runs_match_across_workers(self):
+        hands = [[Card("Q", "S"), Card("J", "S")], [Card(8, "D"), Card(8, "C")]]
+        in_process = simulate_equity(hands, trials=600, workers=1, seed=9, chunk_size=200)
+        pooled = simulate_equity(hands, trials=600, workers=2, seed=9, chunk_size=200)
+        assert in_process == pooled
+
+    def test_default_chunks(self):
+        chunks = _chunk_sizes(100000, None)  # pylint:disable=protected-access
+        assert len(chunks) == DEFAULT_NUM_CHUNKS
+        assert sum(chunks) == 100000
+        assert _chunk_sizes(1000, None) == [MIN_CHUNK_SIZE] * 4  # pylint:disable=protected-access
+        assert _chunk_sizes(0, None) == []  # pylint:disable=protected-access
+
+    def test_duplicate_cards(self):
+        with pytest.raises(ValueError):
+            simulate_equity([[Card("A", "S"), Card("A", "S")]], trials=1, workers=1)
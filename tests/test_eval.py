@@ -0,0 +1,105 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import random
+from itertools import combinations
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck import eval as hand_eval
+from tmt_carddeck.card import Card
+from tmt_carddeck.deck import standard_deck
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+def _hand(text):
+    return [Card(token[:-1], token[-1]) for token in text.split()]
+
+
+class TestHandEvaluator:
+    """Unit tests for the hand evaluator"""
+
+    def test_class_boundaries(self):
+        products, flushes = hand_eval.build_tables()
+        scores = set(products.values()) | {score for score in flushes if score}
+        assert scores == set(range(1, hand_eval.MAX_SCORE + 1))
+
+    def test_five_card_hands(self):
+        evaluate = hand_eval.evaluate
+        assert evaluate(_hand("AS KS QS JS 10S")) == hand_eval.MAX_SCORE
+        assert evaluate(_hand("7S 5H 4S 3S 2S")) == 1
+        assert hand_eval.hand_class_name(evaluate(_hand("AS 2H 3S 4S 5S"))) == "Straight"
+        assert hand_eval.hand_class(evaluate(_hand("AS 2S 3S 4S 5S"))) == hand_eval.STRAIGHT_FLUSH
+        assert hand_eval.hand_class(evaluate(_hand("9D 9S 9C 4H 4S"))) == hand_eval.FULL_HOUSE
+        assert hand_eval.hand_class(evaluate(_hand("9D 8S 9C 4H 4S"))) == hand_eval.TWO_PAIR
+        assert evaluate(_hand("9D 9S 9C 9H 2S")) > evaluate(_hand("8D 8S 8C 8H AS"))
+        assert evaluate(_hand("AS 2H 3S 4S 5S")) < evaluate(_hand("2S 3H 4S 5S 6S"))
+
+    def test_hand_class_range(self):
+        assert hand_eval.hand_class(1) == hand_eval.HIGH_CARD
+        assert hand_eval.hand_class(hand_eval.MAX_SCORE) == hand_eval.STRAIGHT_FLUSH
+        for score in (0, -1, hand_eval.MAX_SCORE + 1):
+            with pytest.raises(ValueError):
+                hand_eval.hand_class(score)
+            with pytest.raises(ValueError):
+                hand_eval.hand_class_name(score)
+
+    def test_face_codes_and_cards_agree(self):
+        the_hand = _hand("QD QS 2C 7H 9S")
+        assert hand_eval.evaluate(the_hand) == hand_eval.evaluate(
+            [the_card.face_code for the_card in the_hand]
+        )
+
+    def test_seven_cards_is_best_five(self):
+        rng = random.Random(5)
+        cards = list(standard_deck(include_blank=False, include_joker=False))
+        for _ in range(200):
+            for num_cards in (6, 7):
+                the_hand = rng.sample(cards, num_cards)
+                assert hand_eval.evaluate(the_hand) == max(
+                    hand_eval.evaluate(list(subset)) for subset in combinations(the_hand, 5)
+                )
+
+    def test_invalid_hands(self):
+        with pytest.raises(ValueError):
+            hand_eval.evaluate(_hand("AS KS QS JS"))
+        with pytest.raises(ValueError):
+            hand_eval.evaluate(_hand("AS KS QS JS") + [Card("*", "*")])
+
+    def test_cache_file(self, tmp_path):
+        cache_file = str(tmp_path / "tables.json")
+        evaluator = hand_eval.HandEvaluator(cache_file=cache_file)
+        assert (tmp_path / "tables.json").exists()
+        cached_evaluator = hand_eval.HandEvaluator(cache_file=cache_file)
+        the_hand = _hand("AS AD KC KH 2S 3S 9S")
+        assert cached_evaluator.evaluate(the_hand) == evaluator.evaluate(the_hand)
+
+    def test_malformed_cache_file_is_rebuilt(self, tmp_path):
+        cache_path = tmp_path / "tables.json"
+        the_hand = _hand("AS AD KC KH 2S 3S 9S")
+        expected = hand_eval.HandEvaluator().evaluate(the_hand)
+        for contents in ('{"version":1}', "[]", '{"version":1,"products":[1],"flushes":[]}'):
+            cache_path.write_text(contents, encoding="utf-8")
+            evaluator = hand_eval.HandEvaluator(cache_file=str(cache_path))
+            assert evaluator.evaluate(the_hand) == expected
+        assert hand_eval.HandEvaluator(cache_file=str(cache_path)).evaluate(the_hand) == expected
+        assert [path.name for path in tmp_path.iterdir()] == ["tables.json"]
+
+    def test_default_cache_file(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert hand_eval.default_cache_file().startswith(str(tmp_path))
+
+    def test_shared_evaluator_per_cache_file(self, tmp_path):
+        cache_file = str(tmp_path / "tables.json")
+        evaluator = hand_eval.get_evaluator(cache_file)
+        assert hand_eval.get_evaluator(cache_file) is evaluator
+        assert hand_eval.get_evaluator() is not evaluator
+        assert hand_eval.get_evaluator() is hand_eval.get_evaluator(hand_eval.default_cache_file())
+        assert (tmp_path / "tables.json").exists()
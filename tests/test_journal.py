@@ -0,0 +1,184 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import random
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import Card
+from tmt_carddeck.constants import FACE_DOWN, FACE_UP
+from tmt_carddeck.deck import Deck, standard_deck
+from tmt_carddeck.journal import Journal
+from tmt_carddeck.shoe import Shoe
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestJournal:
+    """Unit tests for the undo journal"""
+
+    def test_undo_deck_changes(self):
+        journal = Journal()
+        the_deck = standard_deck()
+        the_deck.journal = journal
+        expected = list(the_deck)
+
+        the_deck.pick()
+        the_deck.pick(pick_location=3)
+        the_deck[0] = Card("A", "S")
+        del the_deck[-1]
+        assert len(journal) == 4
+        journal.undo()
+        assert len(the_deck) == 52
+        journal.rollback()
+        assert list(the_deck) == expected
+        with pytest.raises(IndexError):
+            journal.undo()
+
+    def test_undo_negative_indexes(self):
+        for packed in (False, True):
+            journal = Journal()
+            the_deck = standard_deck(packed=packed)
+            the_deck.journal = journal
+            expected = list(the_deck)
+            the_deck.pick(pick_location=-1)
+            journal.undo()
+            assert list(the_deck) == expected
+            del the_deck[-2]
+            journal.undo()
+            assert list(the_deck) == expected
+
+    def test_rollback_to_mark(self):
+        journal = Journal()
+        the_deck = Deck(initial_cards=list(standard_deck()), journal=journal)
+        the_deck.pick_many(3)
+        mark = journal.mark()
+        after_mark = list(the_deck)
+        the_deck.shuffle(seed=1)
+        the_deck.pick()
+        the_deck.sort(by="rank")
+        the_deck[2:4] = []
+        the_deck.deal(3, 4)
+        the_deck.reset_deck()
+        the_deck.pick()
+        journal.rollback(mark)
+        assert list(the_deck) == after_mark
+        with pytest.raises(ValueError):
+            journal.rollback(mark + 1)
+
+    def test_undo_picks_across_compaction(self):
+        journal = Journal()
+        the_deck = standard_deck(packed=True)
+        the_deck.journal = journal
+        first = the_deck.pick()
+        assert the_deck.cards[0] == Card(2, "C")
+        the_deck.pick_many(60)
+        journal.rollback()
+        assert the_deck.pick() == first
+        assert len(the_deck) == 53
+
+    def test_random_operations_roll_back(self):
+        rng = random.Random(2)
+        for packed in (False, True):
+            journal = Journal()
+            the_deck = standard_deck(packed=packed)
+            the_deck.journal = journal
+            the_deck.shuffle(rng=rng)
+            mark = journal.mark()
+            expected = list(the_deck)
+            for _ in range(200):
+                operation = rng.randrange(5)
+                if operation == 0:
+                    the_deck.pick()
+                elif operation == 1 and len(the_deck) > 1:
+                    location = rng.randrange(1, len(the_deck))
+                    the_deck.pick(pick_location=rng.choice((location, -location)))
+                elif operation == 2 and len(the_deck):
+                    the_deck[rng.randrange(-len(the_deck), len(the_deck))] = Card(
+                        rng.choice("2345"), "H"
+                    )
+                elif operation == 3 and len(the_deck):
+                    del the_deck[rng.randrange(-len(the_deck), len(the_deck))]
+                else:
+                    the_deck.pick_many(rng.randrange(1, 10))
+            journal.rollback(mark)
+            assert list(the_deck) == expected
+
+    def test_rollback_across_restore(self):
+        for the_deck in (standard_deck(), standard_deck(packed=True), Shoe(num_decks=1, seed=2)):
+            journal = Journal()
+            the_deck.journal = journal
+            expected = list(the_deck)
+            saved = the_deck.snapshot()
+            the_deck.pick()
+            the_deck.pick()
+            del the_deck[0]
+            the_deck.restore(saved)
+            the_deck[5] = the_deck[6]
+            journal.rollback()
+            assert list(the_deck) == expected
+            assert len(journal) == 0
+
+    def test_shoe_rolls_back(self):
+        journal = Journal()
+        the_shoe = Shoe(num_decks=1, seed=3)
+        the_shoe.journal = journal
+        the_shoe.pick_many(40)
+        mark = journal.mark()
+        remaining = sorted(the_shoe)
+        the_shoe.pick_many(20)
+        the_shoe.reshuffle_if_needed()
+        the_shoe.pick()
+        journal.rollback(mark)
+        assert sorted(the_shoe) == remaining
+
+    def test_shoe_rollback_deals_the_same_cards(self):
+        journal = Journal()
+        the_shoe = Shoe(num_decks=1, seed=1)
+        the_shoe.journal = journal
+        mark = journal.mark()
+        first = the_shoe.pick_many(5)
+        journal.rollback(mark)
+        assert the_shoe.pick_many(5) == first
+
+        the_shoe.pick_many(30)
+        the_shoe.shuffle(seed=4)
+        mark = journal.mark()
+        single = the_shoe.pick()
+        more = the_shoe.pick_many(10)
+        the_shoe.shuffle(seed=5)
+        the_shoe.pick_many(3)
+        journal.rollback(mark)
+        assert the_shoe.pick() == single
+        assert the_shoe.pick_many(10) == more
+
+    def test_undo_card_changes(self):
+        journal = Journal()
+        the_card = Card("Q", "H")
+        the_card.journal = journal
+        the_card.turn_over()
+        the_card.rotate_by(90)
+        the_card.sign(text_signature="Tammy")
+        assert the_card.signature is not None
+        journal.undo()
+        assert the_card.signature is None
+        journal.rollback()
+        assert the_card.orientation == FACE_UP
+        assert the_card.rotation == 0
+
+    def test_cards_and_decks_share_a_journal(self):
+        journal = Journal()
+        the_deck = Deck(initial_cards=[Card(2, "S"), Card(3, "S")], journal=journal)
+        the_card = the_deck.pick()
+        the_card.journal = journal
+        the_card.turn_over()
+        assert the_card.orientation == FACE_DOWN
+        journal.rollback()
+        assert the_card.orientation == FACE_UP
+        assert len(the_deck) == 2
@@ -0,0 +1,99 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import Card
+from tmt_carddeck.constants import FACE_DOWN, FACE_UP, ROTATION_90, ROTATION_180, ROTATION_270
+from tmt_carddeck.render import CardBitmap, CardRenderer, FaceCache, rotate_bitmap
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestRender:
+    """Unit tests for card rendering and the face cache"""
+
+    def test_render_uses_the_cache(self):
+        renderer = CardRenderer()
+        the_card = Card("Q", "H")
+        first = renderer.render(the_card)
+        assert (first.width, first.height) == (36, 36)
+        assert max(first.pixels) >= 4
+        assert renderer.render(Card("Q", "H")) is first
+        assert (renderer.cache.hits, renderer.cache.misses) == (1, 1)
+        assert renderer.render(Card("Q", "D")) is not first
+
+    def test_face_down_cards_share_a_face(self):
+        renderer = CardRenderer()
+        hand = [Card("A", "S"), Card(7, "D"), Card("*", "*")]
+        for the_card in hand:
+            the_card.orientation = FACE_DOWN
+        backs = [renderer.render(the_card) for the_card in hand]
+        assert backs[0] is backs[1] is backs[2]
+        assert len(renderer.cache) == 1
+        assert max(renderer.render(Card("*", "*")).pixels) < 4
+
+    def test_rotation(self):
+        renderer = CardRenderer()
+        the_card = Card(10, "C")
+        upright = renderer.render(the_card)
+        the_card.rotate_by(ROTATION_90)
+        turned = renderer.render(the_card)
+        assert turned.pixel(upright.height - 1, 0) == upright.pixel(0, 0)
+        assert turned.pixel(upright.height - 1 - 9, 5) == upright.pixel(5, 9)
+        the_card.rotate_by(ROTATION_90)
+        assert renderer.render(the_card).pixels == upright.pixels[::-1]
+        the_card.rotate_by(-135)
+        tilted = renderer.render(the_card)
+        assert tilted.width > upright.width
+        assert renderer.face_key(10, "C", FACE_UP, 45, 12) in renderer.cache
+
+    def test_rotate_bitmap_quarter_turns(self):
+        bitmap = CardBitmap(3, 2, [0, 1], bytearray(range(6)))
+        turned = rotate_bitmap(bitmap, ROTATION_90)
+        assert (turned.width, turned.height) == (2, 3)
+        assert list(turned.pixels) == [3, 0, 4, 1, 5, 2]
+        assert list(rotate_bitmap(turned, 270).pixels) == list(range(6))
+        assert list(rotate_bitmap(bitmap, ROTATION_180).pixels) == [5, 4, 3, 2, 1, 0]
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = FaceCache(max_bytes=300)
+        for key in "abc":
+            cache.put(key, CardBitmap(10, 10, [0]))
+        assert cache.get("a") is not None
+        cache.put("d", CardBitmap(10, 10, [0]))
+        assert "b" not in cache
+        assert "a" in cache and "d" in cache
+        assert (cache.nbytes, cache.evictions) == (300, 1)
+        cache.put("huge", CardBitmap(20, 20, [0]))
+        assert "huge" not in cache
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+        with pytest.raises(ValueError):
+            FaceCache(max_bytes=-1)
+
+    def test_small_budget_still_renders(self):
+        renderer = CardRenderer(cache=FaceCache(max_bytes=0), sprite_size=24)
+        bitmap = renderer.render(Card("K", "S"))
+        assert (bitmap.width, bitmap.height) == (72, 72)
+        assert len(renderer.cache) == 0
+
+    def test_quarter_turns_match_rotated_faces(self):
+        renderer = CardRenderer()
+        for sprite_size in (12, 16):
+            for orientation in (FACE_UP, FACE_DOWN):
+                upright = renderer.render_face("J", "D", orientation, 0, sprite_size)
+                for rotation in (ROTATION_90, ROTATION_180, ROTATION_270):
+                    turned = renderer.render_face("J", "D", orientation, rotation, sprite_size)
+                    expected = rotate_bitmap(upright, rotation)
+                    assert (turned.width, turned.height) == (expected.width, expected.height)
+                    assert turned.pixels == expected.pixels
+                    assert turned.palette == upright.palette
@@ -0,0 +1,117 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import asyncio
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import parse_cards
+from tmt_carddeck.server import DealerClient, DealerService, start_server
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestDealerService:
+    """Unit tests for the dealer service"""
+
+    def test_tables_are_independent(self):
+        service = DealerService(seed=1)
+        assert service.handle({"op": "pick", "table": "a", "count": 2})["cards"] == ["2C", "3C"]
+        response = service.handle({"op": "pick", "table": "b", "id": 7})
+        assert response == {"id": 7, "cards": ["2C"], "remaining": 51, "ok": True}
+        assert service.num_tables == 2
+        service.handle({"op": "close", "table": "a"})
+        assert service.num_tables == 1
+
+    def test_table_limit(self):
+        service = DealerService(max_tables=2)
+        assert service.handle({"op": "pick", "table": "a"})["ok"]
+        assert service.handle({"op": "reset", "table": "b"})["ok"]
+        response = service.handle({"op": "pick", "table": "c", "id": 1})
+        assert response == {"id": 1, "ok": False, "error": "too many tables"}
+        assert service.num_tables == 2
+        assert service.handle({"op": "pick", "table": "a"})["cards"] == ["3C"]
+        service.handle({"op": "close", "table": "b"})
+        assert service.handle({"op": "pick", "table": "c"})["ok"]
+
+    def test_shuffle_deal_and_reset(self):
+        service = DealerService()
+        service.handle({"op": "shuffle", "table": "t", "seed": 3})
+        response = service.handle({"op": "deal", "table": "t", "hands": 4, "cards_per_hand": 2})
+        assert response["ok"]
+        assert response["remaining"] == 44
+        dealt = [the_card for hand in response["hands"] for the_card in parse_cards(" ".join(hand))]
+        assert len(set(dealt)) == 8
+        assert service.handle({"op": "reset", "table": "t"})["remaining"] == 52
+        other = DealerService()
+        other.handle({"op": "shuffle", "table": "t", "seed": 3})
+        assert (
+            other.handle({"op": "deal", "table": "t", "hands": 4, "cards_per_hand": 2}) == response
+        )
+
+    def test_batch_and_errors(self):
+        service = DealerService()
+        responses = service.handle(
+            [
+                {"op": "pick", "table": "t"},
+                {"op": "fold", "table": "t"},
+                {"op": "pick", "table": 3},
+                {"op": "pick", "table": "t", "count": -1},
+                {"op": "pick", "table": "t", "count": 60, "reset_if_empty": False},
+                {"op": "pick", "table": "t", "count": 100000},
+                "pick",
+                {"op": {}, "table": "t"},
+                {"op": ["pick"], "table": "t"},
+                {"op": "pick", "table": "t"},
+            ]
+        )
+        assert responses[0]["ok"]
+        assert [response["ok"] for response in responses[1:-1]] == [False] * 8
+        assert responses[1]["error"] == "unknown op"
+        assert responses[7]["error"] == "unknown op"
+        assert responses[-1]["remaining"] == 50
+
+
+class TestDealerServer:
+    """Tests of the dealer service over a local socket"""
+
+    def test_local_client(self):
+        async def session():
+            server = await start_server(DealerService(seed=5), port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                client = await DealerClient.connect(port=port)
+                picked = await client.request({"op": "pick", "table": "t", "count": 3})
+                batch = await client.request(
+                    [{"op": "pick", "table": "t"}, {"op": "reset", "table": "t"}]
+                )
+                client._writer.write(b"not json\n")  # pylint:disable=protected-access
+                bad = await client._reader.readline()  # pylint:disable=protected-access
+                await client.close()
+            return picked, batch, bad
+
+        picked, batch, bad = asyncio.run(session())
+        assert picked["cards"] == ["2C", "3C", "4C"]
+        assert batch[0]["cards"] == ["5C"]
+        assert batch[1]["remaining"] == 52
+        assert b"invalid JSON" in bad
+
+    def test_unix_socket(self, tmp_path):
+        async def session():
+            path = str(tmp_path / "dealer.sock")
+            server = await start_server(path=path)
+            async with server:
+                client = await DealerClient.connect(path=path)
+                response = await client.request(
+                    {"op": "deal", "table": "x", "hands": 2, "cards_per_hand": 1}
+                )
+                await client.close()
+            return response
+
+        assert asyncio.run(session())["hands"] == [["2C"], ["3C"]]
@@ -0,0 +1,144 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import random
+from collections import Counter
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck.card import Card
+from tmt_carddeck.deck import DeckEmpty, standard_deck
+from tmt_carddeck.shoe import Shoe
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+def _full_shoe_counts(num_decks):
+    return Counter(
+        the_card.face_code
+        for the_card in standard_deck(include_blank=False, include_joker=False)
+        for _ in range(num_decks)
+    )
+
+
+class TestShoe:
+    """Unit tests for the Shoe class"""
+
+    def test_shoe_holds_every_card(self):
+        the_shoe = Shoe(num_decks=6, seed=1)
+        assert len(the_shoe) == 312
+        assert the_shoe.num_decks == 6
+        assert Counter(the_shoe.face_codes) == _full_shoe_counts(6)
+        assert len(Shoe(num_decks=2, include_blank=True, include_joker=True)) == 108
+
+    def test_deals_every_card_once(self):
+        the_shoe = Shoe(num_decks=2, seed=2)
+        dealt = [the_shoe.pick(reset_if_empty=False).face_code for _ in range(104)]
+        assert Counter(dealt) == _full_shoe_counts(2)
+        with pytest.raises(DeckEmpty):
+            the_shoe.pick(reset_if_empty=False)
+
+    def test_seeded_shoes_match(self):
+        shoe_one = Shoe(num_decks=8, seed=3)
+        shoe_two = Shoe(num_decks=8, seed=3)
+        assert shoe_one.pick_many(20) == [shoe_two.pick() for _ in range(20)]
+        assert shoe_one.deal(3, 2) == shoe_two.deal(3, 2)
+        assert list(shoe_one) == list(shoe_two)
+        assert shoe_one.pick_many(5) != Shoe(num_decks=8, seed=4).pick_many(5)
+
+    def test_cut_card(self):
+        the_shoe = Shoe(num_decks=1, penetration=0.5, seed=5)
+        assert the_shoe.cut_position == 26
+        the_shoe.pick_many(25)
+        assert not the_shoe.cut_card_reached
+        assert not the_shoe.reshuffle_if_needed()
+        the_shoe.pick()
+        assert the_shoe.cut_card_reached
+        assert the_shoe.cards_dealt == 26
+        assert the_shoe.reshuffle_if_needed()
+        assert len(the_shoe) == 52
+        assert not the_shoe.cut_card_reached
+
+    def test_cut_position_overrides_penetration(self):
+        the_shoe = Shoe(num_decks=4, cut_position=52)
+        assert the_shoe.penetration == 0.25
+        the_shoe.penetration = 0.5
+        assert the_shoe.cut_position == 104
+        with pytest.raises(ValueError):
+            the_shoe.cut_position = 0
+        with pytest.raises(ValueError):
+            Shoe(penetration=1.5)
+        with pytest.raises(ValueError):
+            Shoe(num_decks=0)
+
+    def test_runs_out_and_reshuffles(self):
+        the_shoe = Shoe(num_decks=1, seed=6)
+        dealt = the_shoe.pick_many(60)
+        assert len(dealt) == 60
+        assert len(the_shoe) == 44
+        assert Counter(the_shoe.face_codes) + Counter(
+            the_card.face_code for the_card in dealt[52:]
+        ) == _full_shoe_counts(1)
+
+    def test_reshuffle_reuses_storage(self):
+        the_shoe = Shoe(num_decks=1, seed=7)
+        storage = the_shoe.face_codes
+        the_shoe.pick_many(30)
+        the_shoe.reset_deck()
+        assert the_shoe.face_codes is storage
+        assert len(the_shoe) == 52
+
+    def test_peeking_finishes_shuffle(self):
+        the_shoe = Shoe(num_decks=1, rng=random.Random(8))
+        the_shoe.pick()
+        upcoming = the_shoe[0]
+        assert the_shoe.pick() == upcoming
+        assert the_shoe[-1] == list(the_shoe)[-1]
+        assert isinstance(upcoming, Card)
+
+    def test_shuffle_is_uniform(self):
+        rng = random.Random(9)
+        the_shoe = Shoe(num_decks=1, rng=rng)
+        counts = Counter()
+        for _ in range(5200):
+            the_shoe.reshuffle()
+            counts[the_shoe.pick().face_code] += 1
+        assert len(counts) == 52
+        assert all(50 < count < 160 for count in counts.values())
+
+    def test_snapshot_deals_the_same_cards(self):
+        the_shoe = Shoe(num_decks=2, seed=10)
+        the_shoe.pick()
+        snapshot = the_shoe.snapshot()
+        first = the_shoe.pick_many(10)
+        the_shoe.reshuffle()
+        the_shoe.pick_many(5)
+        the_shoe.restore(snapshot)
+        assert the_shoe.pick_many(10) == first
+        assert snapshot.cards[snapshot.top : snapshot.top + 10] == bytes(
+            the_card.face_code for the_card in first
+        )
+
+    def test_serialization_round_trip(self):
+        the_shoe = Shoe(num_decks=3, include_joker=True, seed=6)
+        the_shoe.pick_many(40)
+        copy = Shoe.from_bytes(the_shoe.to_bytes())
+        assert isinstance(copy, Shoe)
+        assert (copy.num_decks, copy.cards_dealt) == (3, 40)
+        assert list(copy) == list(the_shoe)
+        assert copy.pick_many(20) == the_shoe.pick_many(20)
+        copy.reshuffle()
+        assert len(copy) == 3 * 53
+
+    def test_small_penetration_keeps_cut_card_inside(self):
+        the_shoe = Shoe(num_decks=1, penetration=0.01, seed=2)
+        assert the_shoe.cut_position == 1
+        assert not the_shoe.cut_card_reached
+        the_shoe.pick()
+        assert the_shoe.cut_card_reached
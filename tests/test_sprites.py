@@ -0,0 +1,147 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck import sprites
+from tmt_carddeck.card import Card
+from tmt_carddeck.constants import ROTATION_0, ROTATION_90, ROTATION_180, ROTATION_270
+from tmt_carddeck.render import CardRenderer
+from tmt_carddeck.sprites import (
+    COLOUR_BLACK,
+    COLOUR_RED,
+    SYMBOL_SIZES,
+    SYMBOL_TILES,
+    SpriteAtlas,
+    read_bmp_header,
+    rotate_tile,
+)
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+class TestSprites:
+    """Unit tests for the sprite atlas loader"""
+
+    def test_read_bmp_header(self):
+        atlas = SpriteAtlas()
+        with open(atlas.asset_dir + "/card_symbols_16x16.bmp", "rb") as bmp_file:
+            header = read_bmp_header(bmp_file)
+        assert (header.width, header.height, header.bits_per_pixel) == (160, 64, 4)
+        assert header.row_stride == 80
+        assert header.bottom_up
+        assert len(header.palette) == 4
+        with pytest.raises(ValueError):
+            read_bmp_header(io.BytesIO(b"GIF89a" + bytes(64)))
+
+    def test_assets_ship_with_the_package(self, tmp_path):
+        package_dir = os.path.dirname(os.path.abspath(sprites.__file__))
+        assert SpriteAtlas().asset_dir == package_dir.replace("\\", "/") + "/assets"
+        site_dir = tmp_path / "site-packages"
+        shutil.copytree(
+            package_dir,
+            site_dir / "tmt_carddeck",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        script = (
+            "from tmt_carddeck.sprites import SpriteAtlas\n"
+            "atlas = SpriteAtlas()\n"
+            "print(atlas.asset_dir)\n"
+            "print(len(atlas.symbols(12).tile_pixels(0)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=str(tmp_path),
+            env=dict(os.environ, PYTHONPATH=str(site_dir)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        asset_dir, tile_length = result.stdout.split()
+        assert asset_dir.startswith(str(site_dir).replace("\\", "/"))
+        assert tile_length == "144"
+
+    def test_symbol_sheets(self):
+        atlas = SpriteAtlas()
+        for size in SYMBOL_SIZES:
+            sheet = atlas.symbols(size)
+            assert sheet is atlas.symbols(size)
+            assert (sheet.columns, sheet.rows) == (10, 4)
+            tile = sheet.tile_pixels(0)
+            assert len(tile) == size * size
+            assert tile is sheet.tile_pixels(0)
+            assert max(tile) < len(sheet.palette)
+            assert any(tile)
+        assert atlas.fronts(12).num_tiles == 9
+        assert atlas.backs(24).num_tiles == 9
+        atlas.close()
+
+    def test_card_tiles(self):
+        atlas = SpriteAtlas()
+        tiles = atlas.card_tiles("A", "S", 12)
+        assert (tiles.rank_tile, tiles.suit_tile) == (0, 16)
+        tiles = atlas.card_tiles("10", "H", 24)
+        assert (tiles.rank_tile, tiles.suit_tile) == (29, 35)
+        assert tiles.sheet is atlas.symbols(24)
+        assert atlas.card_tiles("K", "D", 16, COLOUR_BLACK).rank_tile == 12
+        assert SYMBOL_TILES[("C", COLOUR_RED)] == 34
+        with pytest.raises(ValueError):
+            atlas.card_tiles("*", "*", 12)
+        atlas.close()
+
+    def test_red_and_black_tiles_differ(self):
+        atlas = SpriteAtlas()
+        sheet = atlas.symbols(12)
+        black = sheet.tile_pixels(SYMBOL_TILES[("H", COLOUR_BLACK)])
+        red = sheet.tile_pixels(SYMBOL_TILES[("H", COLOUR_RED)])
+        assert 2 in black and 3 not in black
+        assert 3 in red and 2 not in red
+        atlas.close()
+
+    def test_rotated_tiles(self):
+        tile = bytes(range(9))
+        assert rotate_tile(tile, 3, ROTATION_90) == bytes([6, 3, 0, 7, 4, 1, 8, 5, 2])
+        assert rotate_tile(tile, 3, ROTATION_270) == bytes([2, 5, 8, 1, 4, 7, 0, 3, 6])
+        assert rotate_tile(tile, 3, ROTATION_180) == tile[::-1]
+        with pytest.raises(ValueError):
+            rotate_tile(tile, 3, 45)
+
+        atlas = SpriteAtlas()
+        sheet = atlas.symbols(16)
+        upright = sheet.tile_pixels(13)
+        turned = sheet.rotated_tile_pixels(13, ROTATION_90)
+        assert turned == rotate_tile(upright, 16, ROTATION_90)
+        assert sheet.rotated_tile_pixels(13, ROTATION_90) is turned
+        assert sheet.rotated_tile_pixels(13, ROTATION_0) is upright
+        with pytest.raises(ValueError):
+            sheet.rotated_tile_pixels(13, 45)
+        with pytest.raises(IndexError):
+            sheet.rotated_tile_pixels(40, ROTATION_180)
+        atlas.close()
+
+    def test_tiles_without_mmap(self, monkeypatch):
+        atlas = SpriteAtlas()
+        expected = [atlas.symbols(24).tile_pixels(index) for index in range(40)]
+        frame = atlas.fronts(12).tile_pixels(4)
+        atlas.close()
+        monkeypatch.setattr(sprites, "mmap", None)
+        atlas = SpriteAtlas()
+        sheet = atlas.symbols(24)
+        assert [sheet.tile_pixels(index) for index in range(40)] == expected
+        assert atlas.fronts(12).tile_pixels(4) == frame
+        assert sheet.pixel(0, 0) == expected[0][0]
+        bitmap = CardRenderer(atlas=atlas).render(Card("Q", "S"), sprite_size=24)
+        assert max(bitmap.pixels) >= 4
+        atlas.close()
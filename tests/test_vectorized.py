@@ -0,0 +1,54 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+CircuitPython Card Deck Library
+"""
+
+import pytest  # pylint:disable=unused-import
+
+from tmt_carddeck import vectorized
+from tmt_carddeck.eval import get_evaluator
+
+
+# pylint:disable=no-self-use,missing-function-docstring
+
+
+@pytest.fixture(name="numpy_mode", params=[True, False], ids=["numpy", "fallback"])
+def fixture_numpy_mode(request, monkeypatch):
+    """Run a test with and without NumPy."""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vectorized, "HAVE_NUMPY", False)
+    return request.param
+
+
+class TestVectorized:
+    """Unit tests for batch shuffling and evaluation"""
+
+    def test_shuffle_batch(self, numpy_mode):  # pylint:disable=unused-argument
+        decks = vectorized.shuffle_batch(20, seed=4)
+        assert len(decks) == 20
+        for deck in decks:
+            assert sorted(int(face_code) for face_code in deck) == vectorized.STANDARD_FACE_CODES
+        assert [list(deck) for deck in vectorized.shuffle_batch(3, seed=4)] == [
+            list(deck) for deck in decks[:3]
+        ]
+
+    def test_evaluate_batch_matches_evaluator(self, numpy_mode):  # pylint:disable=unused-argument
+        evaluator = get_evaluator()
+        decks = vectorized.shuffle_batch(200, seed=8)
+        for num_cards in (5, 6, 7):
+            hands = [list(deck[:num_cards]) for deck in decks]
+            scores = vectorized.evaluate_batch(hands)
+            assert [int(score) for score in scores] == [
+                evaluator.evaluate_codes([int(face_code) for face_code in hand]) for hand in hands
+            ]
+
+    def test_evaluate_batch_rejects_bad_hands(self, numpy_mode):  # pylint:disable=unused-argument
+        with pytest.raises(ValueError):
+            vectorized.evaluate_batch([[1, 2, 3, 4, 53]])
+        with pytest.raises(ValueError):
+            vectorized.evaluate_batch([[1, 2, 3, 4]])
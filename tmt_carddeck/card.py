@@ -10,7 +10,7 @@ from collections import namedtuple
 
 
 try:
-    from typing import List, Optional, Union, Sequence  # noqa
+    from typing import Dict, List, Optional, Union, Sequence  # noqa
 except ImportError:
     pass
 
@@ -19,17 +19,350 @@ from tmt_carddeck.constants import (
     DEFAULT_SUIT_ORDER,
     ROTATION_0,
     FACE_UP,
+    SORT_BY_RANK,
+    SORT_BY_SUIT,
+    SORT_BY_VALUE,
 )
+from tmt_carddeck.order import CardOrder, DEFAULT_CARD_ORDER, get_card_order
+from tmt_carddeck.journal import Journal
+from tmt_carddeck import codes
 
 
 CardSignatureType = namedtuple("CardSignatureType", "type data")
 
+# Index of each sort field in CardFace.sort_keys.
+_SORT_KEY_INDEX: Dict[str, int] = {SORT_BY_VALUE: 0, SORT_BY_RANK: 1, SORT_BY_SUIT: 2}
+
+
+def _int_value_from_string(str_value: str) -> int:
+    """
+    Convert a string to an integer value.
+    """
+
+    int_val = 0
+    for val_char in str_value:
+        int_val += ord(val_char)
+    return int_val
+
+
+class CardFace:
+    """
+    The shared, immutable identity of a card: its rank, suit, joker flag and
+    ordering, plus the values derived from them.
+
+    Faces are interned, so there is exactly one face per distinct card and
+    ordering. Don't create them directly; use `Card.get()`. Treat all of the
+    attributes as read-only.
+    """
+
+    __slots__ = (
+        "rank",
+        "suit",
+        "is_joker",
+        "card_order",
+        "name",
+        "value",
+        "rank_value",
+        "suit_value",
+        "face_code",
+        "hash_code",
+        "sort_keys",
+    )
+
+    def __init__(
+        self,
+        rank: Union[int, str, None],
+        suit: Optional[str],
+        is_joker: bool,
+        card_order: CardOrder,
+    ) -> None:
+        """
+        Build a card face from an already-normalized rank and suit.
+        """
+
+        self.rank: Union[int, str, None] = rank
+        self.suit: Optional[str] = suit
+        self.is_joker: bool = is_joker
+        self.card_order: CardOrder = card_order
+        self.name: str = self._build_name()
+
+        if is_joker:
+            self.value: Optional[int] = card_order.value_index.get(self.name)
+            if self.value is None:
+                if self.name == "*":
+                    self.value = len(card_order.value_order) - 1
+                else:
+                    self.value = _int_value_from_string(self.name)
+            if (rank is None or rank == "*") and (suit is None or suit == "*"):
+                self.rank_value: Optional[int] = len(card_order.rank_order)
+                self.suit_value: Optional[int] = len(card_order.suit_order)
+                self.face_code: Optional[int] = codes.JOKER_CODE
+            else:
+                self.rank_value = _int_value_from_string(str(rank))
+                self.suit_value = _int_value_from_string(str(suit))
+                self.face_code = None
+        else:
+            self.value = card_order.pair_value.get((rank, suit))
+            self.rank_value = card_order.rank_index.get(rank)
+            self.suit_value = card_order.suit_index.get(suit)
+            self.face_code = DEFAULT_CARD_ORDER.pair_value.get((rank, suit))
+
+        self.hash_code: int = self._build_hash_code()
+        self.sort_keys: tuple = self._build_sort_keys()
+
+    def _build_hash_code(self) -> int:
+        """
+        Build the hash code of the face. Equality ignores the ordering, so
+        the standard cards, the blank card and the joker hash to their face
+        code in the default ordering (0-53), which never collide. Other
+        cards hash their rank and suit.
+        """
+
+        hash_code = DEFAULT_CARD_ORDER.pair_value.get((self.rank, self.suit))
+        if hash_code is not None:
+            return hash_code
+        if self.rank == "*" and self.suit == "*":
+            return codes.JOKER_CODE
+        return hash((self.rank, self.suit))
+
+    def _build_sort_keys(self) -> tuple:
+        """
+        Build the face's sort keys, by value, by rank then suit, and by suit
+        then rank. Unknown values sort first.
+        """
+
+        value = -1 if self.value is None else self.value
+        rank_value = -1 if self.rank_value is None else self.rank_value
+        suit_value = -1 if self.suit_value is None else self.suit_value
+        return (value, (rank_value, suit_value, value), (suit_value, rank_value, value))
+
+    def _build_name(self) -> str:
+        """
+        Build the string value of the face.
+        """
+
+        if self.is_joker:
+            joker_str = "*"
+            if self.rank is not None and self.rank != "*":
+                joker_str = joker_str + str(self.rank)
+            if self.suit is not None and self.suit != "*":
+                joker_str = joker_str + str(self.suit)
+            return joker_str
+        return f"{self.rank}{self.suit}"
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares two faces, or a face and a card (==)
+        """
+
+        return self is other or (self.suit == other.suit and self.rank == other.rank)
+
+    def __hash__(self) -> int:
+        """
+        Returns the precomputed hash code of the face (see
+        `_build_hash_code`).
+        """
+
+        return self.hash_code
+
+    def __str__(self) -> str:
+        """
+        Returns the string value of the face.
+        """
+
+        return self.name
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the face.
+        """
+
+        return self.name
+
+    def __reduce__(self):
+        """
+        Re-intern the face when it's unpickled.
+        """
+
+        card_order = self.card_order
+        value_order = card_order.value_order
+        if get_card_order(card_order.rank_order, card_order.suit_order) is card_order:
+            value_order = None
+        return (
+            _unpickle_face,
+            (
+                self.rank,
+                self.suit,
+                self.is_joker,
+                card_order.rank_order,
+                card_order.suit_order,
+                value_order,
+            ),
+        )
+
+
+_FACE_CACHE: Dict[tuple, CardFace] = {}
+_CODE_FACES: List[CardFace] = []
+_STRING_FACES: Dict[str, CardFace] = {}
+
+# The suits a joker's string value can name: the standard suits, plus red
+# and black.
+_JOKER_SUITS: tuple = tuple(DEFAULT_SUIT_ORDER) + ("R", "B")
+
+
+def _intern_face(
+    rank: Union[int, str, None],
+    suit: Optional[str],
+    is_joker: bool,
+    card_order: CardOrder,
+) -> CardFace:
+    """
+    Retrieve the shared face for a card, validating and normalizing the
+    rank and suit the first time a combination is seen.
+    """
+
+    raw_key = (rank, suit, is_joker, card_order)
+    face = _FACE_CACHE.get(raw_key)
+    if face is not None:
+        return face
+
+    if rank == "*" or suit == "*":
+        is_joker = True
+    else:
+        if rank and str(rank) not in card_order.rank_index and is_joker is False:
+            raise ValueError("rank not in rank_order list")
+        if suit and str(suit) not in card_order.suit_index and is_joker is False:
+            raise ValueError("suit not in suit_order list")
+
+        if isinstance(rank, int):
+            rank = str(rank)
+        elif rank is not None:
+            rank = str(rank).strip().upper()
+
+        if suit is not None:
+            suit = str(suit).strip().upper()
+
+    key = (rank, suit, is_joker, card_order)
+    face = _FACE_CACHE.get(key)
+    if face is None:
+        face = CardFace(rank, suit, is_joker, card_order)
+        _FACE_CACHE[key] = face
+    # Remember the combination as given too, unless it's a joker's rank and
+    # suit spelled differently: those aren't validated, so every spelling
+    # would add an entry.
+    if not is_joker or (rank, suit) == raw_key[:2]:
+        _FACE_CACHE[raw_key] = face
+    return face
+
+
+def _unpickle_face(
+    rank: Union[int, str, None],
+    suit: Optional[str],
+    is_joker: bool,
+    rank_order: Sequence[str],
+    suit_order: Sequence[str],
+    value_order: Optional[Sequence[str]],
+) -> CardFace:
+    """
+    Look up the shared face for a pickled face.
+    """
+
+    return _intern_face(rank, suit, is_joker, get_card_order(rank_order, suit_order, value_order))
+
+
+def _code_face(face_code: int) -> CardFace:
+    """
+    Look up the shared face for a face code.
+    """
+
+    if not _CODE_FACES:
+        for code_index in range(codes.NUM_FACE_CODES):
+            _CODE_FACES.append(
+                _intern_face(
+                    codes.FACE_RANKS[code_index],
+                    codes.FACE_SUITS[code_index],
+                    False,
+                    DEFAULT_CARD_ORDER,
+                )
+            )
+    return _CODE_FACES[face_code]
+
+
+def _string_faces() -> Dict[str, CardFace]:
+    """
+    Retrieve the table of card strings (see `Card.from_string`), building
+    it on first use. It holds only the upper-case string value of each
+    face code and of each joker `from_string` accepts.
+    """
+
+    if not _STRING_FACES:
+        for face_code in range(codes.NUM_FACE_CODES):
+            code_face = _code_face(face_code)
+            _STRING_FACES[code_face.name.upper()] = code_face
+        for suit in _JOKER_SUITS:
+            _STRING_FACES["*" + suit] = Card.get("*", suit)
+            for rank in DEFAULT_RANK_ORDER:
+                _STRING_FACES["*" + rank + suit] = Card.get(rank, suit, is_joker=True)
+    return _STRING_FACES
+
+
+def _string_face(card_string: str) -> CardFace:
+    """
+    Look up the shared face for a card string (see `Card.from_string`).
+    """
+
+    string_faces = _string_faces()
+    face = string_faces.get(card_string)
+    if face is None:
+        face = string_faces.get(card_string.strip().upper())
+        if face is None:
+            raise ValueError("invalid card string")
+    return face
+
+
+def parse_cards(text: str, separator: Optional[str] = None) -> List["Card"]:
+    """
+    Parse a line of card strings, such as ``"AS KD 10H *"``.
+
+    Args:
+        text (str): The card strings.
+        separator (Optional[str]): The separator between cards. Defaults to
+            any whitespace.
+
+    Returns:
+        A list of new cards.
+
+    Raises:
+        ValueError is raised if a card string isn't valid.
+    """
+
+    from_face = Card.from_face
+    string_faces = _string_faces()
+    the_cards = []
+    for token in text.split(separator):
+        face = string_faces.get(token)
+        if face is None:
+            face = _string_face(token)
+        the_cards.append(from_face(face))
+    return the_cards
+
 
 class Card:
     """
     Class to represent a playing card.
+
+    A card is a shared `CardFace` (its rank, suit and ordering) plus its own
+    orientation, rotation and signature.
     """
 
+    __slots__ = (
+        "_face",
+        "_rotation",
+        "_orientation",
+        "_signature",
+        "_journal",
+    )
+
     def __init__(
         self,
         rank: Union[int, str, None] = None,
@@ -63,58 +396,67 @@ class Card:
                 - The rotation is outside the range of 0-360 degrees.
         """
 
-        self._value_order: List[str] = []
-        self._rank_order = list(kwargs.get("rank_order", DEFAULT_RANK_ORDER))
-        self._suit_order = list(kwargs.get("suit_order", DEFAULT_SUIT_ORDER))
-        self._is_joker: bool = kwargs.get("is_joker", False)
+        self._face: CardFace = Card.get(rank, suit, **kwargs)
         self._rotation: int = rotation
         self._orientation: bool = orientation
+        self._signature: Optional[CardSignatureType] = None
+        self._journal: Optional[Journal] = None
 
-        self._build_value_order_list()
+    @staticmethod
+    def get(rank: Union[int, str, None] = None, suit: Optional[str] = None, **kwargs) -> CardFace:
+        """
+        Retrieve the shared, immutable face for a card. Faces are interned,
+        so equal faces with the same ordering are the same object.
 
-        self._signature: Optional[CardSignatureType] = None
-        self._rank: Optional[Union[int, str, None]] = None
-        self._suit: Optional[str] = None
+        Args:
+            rank (Union[int, str, None]): The rank of the card.
+            suit (Optional[str]): The suit of the card.
+            kwargs: rank_order, suit_order and is_joker, as for `Card()`.
 
-        if rank == "*" or suit == "*":
-            self._rank = rank
-            self._suit = suit
-            self._is_joker = True
+        Returns:
+            The shared `CardFace`.
+        """
+
+        if "rank_order" in kwargs or "suit_order" in kwargs:
+            card_order = get_card_order(
+                kwargs.get("rank_order", DEFAULT_RANK_ORDER),
+                kwargs.get("suit_order", DEFAULT_SUIT_ORDER),
+            )
         else:
-            if rank and str(rank) not in self._rank_order and self.is_joker is False:
-                raise ValueError("rank not in rank_order list")
-            if suit and str(suit) not in self._suit_order and self.is_joker is False:
-                raise ValueError("suit not in suit_order list")
+            card_order = DEFAULT_CARD_ORDER
+        return _intern_face(rank, suit, kwargs.get("is_joker", False), card_order)
 
-            if isinstance(rank, int):
-                self._rank = str(rank)
-            elif rank is not None:
-                self._rank = str(rank).strip().upper()
+    @classmethod
+    def from_face(
+        cls, face: CardFace, rotation: int = ROTATION_0, orientation: bool = FACE_UP
+    ) -> "Card":
+        """
+        Create a card from a shared face.
 
-            if suit is not None:
-                self._suit = str(suit).strip().upper()
+        Args:
+            face (CardFace): The face, from `Card.get()`.
+            rotation (int): The rotation of the card.
+            orientation (bool): The orientation of the card.
 
-    def _build_value_order_list(self) -> None:
-        """
-        Update the value order list from the rank order and suit order.
+        Returns:
+            The new card.
         """
 
-        self._value_order = [""]
-
-        for suit_iterator in self._suit_order:
-            if suit_iterator != "*":
-                for rank_iterator in self._rank_order:
-                    card_name: str = ""  # noqa
+        the_card = cls.__new__(cls)
+        the_card._face = face
+        the_card._rotation = rotation
+        the_card._orientation = orientation
+        the_card._signature = None
+        the_card._journal = None
+        return the_card
 
-                    if rank_iterator == "*" or suit_iterator == "*":
-                        card_name = "*"
-                    else:
-                        card_name = f"{rank_iterator}{suit_iterator}"
-                    if card_name not in self._value_order:
-                        self._value_order.append(card_name)
+    @property
+    def face(self) -> CardFace:
+        """
+        Retrieves the card's shared face.
+        """
 
-        if "*" not in self._value_order:
-            self._value_order.append("*")
+        return self._face
 
     @property
     def orientation(self) -> bool:
@@ -172,11 +514,50 @@ class Card:
             raise AttributeError("invalid rotation value")
         self._rotation = value
 
+    @property
+    def journal(self) -> Optional[Journal]:
+        """
+        Retrieves the journal the card records its changes in, if any.
+        """
+
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal: Optional[Journal]) -> None:
+        """
+        Sets the journal that `turn_over`, `rotate_by` and `sign` record
+        their changes in. None stops recording.
+        """
+
+        self._journal = journal
+
+    def _restore_state(self, rotation: int, orientation: bool, signature) -> None:
+        """
+        Put back the card's rotation, orientation and signature (journal
+        undo step).
+        """
+
+        self._rotation = rotation
+        self._orientation = orientation
+        self._signature = signature
+
+    def _record_state(self) -> None:
+        """
+        If the card has a journal, record its current rotation, orientation
+        and signature, before they're changed.
+        """
+
+        if self._journal is not None:
+            self._journal.record(
+                self._restore_state, self._rotation, self._orientation, self._signature
+            )
+
     def turn_over(self) -> None:
         """
         Turns the card over (face-up <-> face-down)
         """
 
+        self._record_state()
         self.orientation = not self.orientation
 
     def rotate_by(self, num_degrees) -> int:
@@ -192,6 +573,7 @@ class Card:
             The card's orientation after rotation.
         """
 
+        self._record_state()
         self.rotation = (self.rotation + num_degrees) % 360
         return self.rotation
 
@@ -201,7 +583,7 @@ class Card:
         Retrieves the card's rank.
         """
 
-        return self._rank
+        return self._face.rank
 
     @property
     def suit(self) -> Optional[str]:
@@ -209,7 +591,15 @@ class Card:
         Retrieves the card's suit.
         """
 
-        return self._suit
+        return self._face.suit
+
+    @property
+    def card_order(self) -> CardOrder:
+        """
+        Retrieves the shared ordering tables used by the card.
+        """
+
+        return self._face.card_order
 
     @property
     def rank_order(self) -> List[str]:
@@ -217,7 +607,7 @@ class Card:
         Retrieves the card's rank order.
         """
 
-        return list(self._rank_order)
+        return list(self._face.card_order.rank_order)
 
     @property
     def suit_order(self) -> List[str]:
@@ -225,7 +615,7 @@ class Card:
         Returns the card's suit order.
         """
 
-        return list(self._suit_order)
+        return list(self._face.card_order.suit_order)
 
     @property
     def value_order(self) -> List[str]:
@@ -233,7 +623,7 @@ class Card:
         Returns the card's value order.
         """
 
-        return list(self._value_order)
+        return list(self._face.card_order.value_order)
 
     @value_order.setter
     def value_order(self, new_order: Sequence) -> None:
@@ -241,7 +631,11 @@ class Card:
         Overrides the card's value order.
         """
 
-        self._value_order = list(new_order)
+        face = self._face
+        card_order = get_card_order(
+            face.card_order.rank_order, face.card_order.suit_order, value_order=new_order
+        )
+        self._face = _intern_face(face.rank, face.suit, face.is_joker, card_order)
 
     @property
     def is_joker(self) -> bool:
@@ -249,7 +643,7 @@ class Card:
         Returns True if the card is a joker.
         """
 
-        return self._is_joker
+        return self._face.is_joker
 
     @property
     def rank_value(self) -> int:
@@ -257,11 +651,10 @@ class Card:
         Retrieves the numeric rank value of the card.
         """
 
-        if self.is_joker:
-            if (self.rank is None or self.rank == "*") and (self.suit is None or self.suit == "*"):
-                return len(self._rank_order)
-            return self._int_value_from_string(str(self.rank))
-        return self._rank_order.index(self.rank)
+        rank_value = self._face.rank_value
+        if rank_value is None:
+            raise ValueError("rank not in rank_order list")
+        return rank_value
 
     @property
     def suit_value(self) -> int:
@@ -269,35 +662,115 @@ class Card:
         Retrieves the numeric suit value of the card.
         """
 
-        if self.is_joker:
-            if (self.rank is None or self.rank == "*") and (self.suit is None or self.suit == "*"):
-                return len(self._suit_order)
-            return self._int_value_from_string(str(self.suit))
-        return self._suit_order.index(self.suit)
+        suit_value = self._face.suit_value
+        if suit_value is None:
+            raise ValueError("suit not in suit_order list")
+        return suit_value
 
     def __int__(self) -> int:
         """
         Retrieves the numeric value of the card.
         """
 
-        if self.is_joker:
-            if str(self) in self._value_order:
-                return self._value_order.index(str(self))
-            if str(self) == "*":
-                return len(self._value_order) - 1
-            return self._int_value_from_string(str(self))
+        card_value = self._face.value
+        if card_value is None:
+            raise AttributeError("card value is unknown")
+        return card_value
+
+    @property
+    def face_code(self) -> int:
+        """
+        Retrieves the card's face code (see `tmt_carddeck.codes`).
 
-        if str(self) in self._value_order:
-            return self._value_order.index(str(self))
+        Raises:
+            ValueError is raised if the card isn't one of the standard
+            cards, the blank card or the joker.
+        """
 
-        raise AttributeError("card value is unknown")
+        face_code = self._face.face_code
+        if face_code is None:
+            raise ValueError("card has no compact code")
+        return face_code
+
+    @property
+    def code(self) -> int:
+        """
+        Retrieves the card's compact code: the face code plus the
+        orientation and rotation quadrant (see `tmt_carddeck.codes`).
+        """
+
+        return codes.encode(self.face_code, self._orientation, self._rotation)
+
+    @classmethod
+    def from_code(cls, card_code: int) -> "Card":
+        """
+        Create a card from a compact card code.
+
+        Args:
+            card_code (int): The card code.
+
+        Returns:
+            The new card.
+        """
+
+        face_code, orientation, rotation = codes.decode(card_code)
+        if face_code >= codes.NUM_FACE_CODES:
+            raise ValueError("invalid card code")
+        return cls.from_face(_code_face(face_code), rotation=rotation, orientation=orientation)
+
+    @classmethod
+    def from_string(cls, card_string: str) -> "Card":
+        """
+        Create a card from its string value (see `__str__`): "AS" or "10H"
+        for the standard cards, "*" for the joker, "*R" for a joker with a
+        suit, "*RS" for a joker with a rank and suit, and "NoneNone" for the
+        blank card. A joker's suit is a standard suit, "R" (red) or "B"
+        (black), and its rank a standard rank. Case and surrounding
+        whitespace are ignored.
+
+        Args:
+            card_string (str): The card's string value.
+
+        Returns:
+            The new card, face up and unrotated.
+
+        Raises:
+            ValueError is raised if the string isn't a valid card.
+        """
+
+        return cls.from_face(_string_face(card_string))
+
+    def sort_key(self, by: str = SORT_BY_VALUE):  # pylint: disable=invalid-name
+        """
+        Retrieve the card's precomputed sort key, so cards can be sorted
+        without comparing them one pair at a time. For example,
+        ``sorted(cards, key=Card.sort_key)``.
+
+        Args:
+            by (str): SORT_BY_VALUE, SORT_BY_RANK (rank, then suit) or
+                SORT_BY_SUIT (suit, then rank).
+
+        Returns:
+            The sort key. Cards whose value is unknown sort first.
+
+        Raises:
+            ValueError is raised if the sort field isn't known.
+        """
+
+        try:
+            return self._face.sort_keys[_SORT_KEY_INDEX[by]]
+        except KeyError as error:
+            raise ValueError("unknown sort field") from error
 
     def __eq__(self, other) -> bool:
         """
         Compares two cards (==)
         """
 
-        return self.suit == other.suit and self.rank == other.rank
+        face = self._face
+        if face is getattr(other, "_face", other):
+            return True
+        return face.suit == other.suit and face.rank == other.rank
 
     def __gt__(self, other) -> bool:
         """
@@ -317,21 +790,15 @@ class Card:
         """
         Returns the string value of a card.
         """
-        if self.is_joker:
-            joker_str = "*"
-            if self.rank is not None and self.rank != "*":
-                joker_str = joker_str + str(self.rank)
-            if self.suit is not None and self.suit != "*":
-                joker_str = joker_str + str(self.suit)
-            return joker_str
-        return f"{self.rank}{self.suit}"
+
+        return self._face.name
 
     def __repr__(self) -> str:
         """
         Returns a string representation of a card.
         """
 
-        return str(self)
+        return self._face.name
 
     def __hash__(self):
         """
@@ -341,24 +808,7 @@ class Card:
             int - the hash code of the card.
         """
 
-        hash_code = 0
-        if self.suit is not None:
-            hash_code += self._int_value_from_string(str(self.suit)) * 1024
-        if self.rank is not None:
-            hash_code += self._int_value_from_string(str(self.rank))
-
-        return hash_code
-
-    # pylint: disable=no-self-use
-    def _int_value_from_string(self, str_value: str) -> int:
-        """
-        Convert a string to an integer value.
-        """
-
-        int_val = 0
-        for val_char in str_value:
-            int_val += ord(val_char)
-        return int_val
+        return self._face.hash_code
 
     def sign(
         self,
@@ -388,6 +838,7 @@ class Card:
         if self._signature is not None:
             raise AttributeError("card is already signed")
 
+        self._record_state()
         if text_signature:
             self._signature = CardSignatureType(type="text", data=text_signature)
         elif graphic_signature:
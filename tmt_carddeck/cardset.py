@@ -0,0 +1,247 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+A set of cards stored as one integer bitmask.
+
+Bit n is set if the card with face code n (see `tmt_carddeck.codes`) is in
+the set, so a set can hold the blank card, the 52 standard cards and the
+joker. Set algebra is a single integer operation, and iteration yields the
+cards in value order (the default ordering).
+"""
+
+try:
+    from typing import Iterable, Iterator, List, Union  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck import codes
+from tmt_carddeck.card import Card
+from tmt_carddeck.deck import Deck, PackedDeck
+
+_STANDARD_MASK: int = ((1 << codes.JOKER_CODE) - 1) ^ (1 << codes.BLANK_CODE)
+
+
+def _face_code(the_card: Union[Card, int]) -> int:
+    """
+    Convert a card (or a face code) to a face code.
+    """
+
+    if isinstance(the_card, int):
+        if not 0 <= the_card < codes.NUM_FACE_CODES:
+            raise ValueError("invalid face code")
+        return the_card
+    return the_card.face_code
+
+
+def _popcount(mask: int) -> int:
+    """
+    Count the bits set in a mask.
+    """
+
+    try:
+        return mask.bit_count()
+    except AttributeError:
+        return bin(mask).count("1")
+
+
+class CardSet:
+    """
+    An immutable set of cards, stored as a bitmask of face codes.
+
+    Only the standard cards, the blank card and the joker can be members.
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, cards: Iterable[Union[Card, int]] = ()) -> None:
+        """
+        Create a set of cards.
+
+        Args:
+            cards (Iterable[Union[Card, int]]): The cards, as `Card` objects
+                or face codes.
+
+        Raises:
+            ValueError is raised if a card isn't one of the standard cards,
+            the blank card or the joker.
+        """
+
+        mask = 0
+        for the_card in cards:
+            mask |= 1 << _face_code(the_card)
+        self._mask: int = mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "CardSet":
+        """
+        Create a set from a bitmask of face codes.
+        """
+
+        if mask < 0 or mask >> codes.NUM_FACE_CODES:
+            raise ValueError("invalid card set mask")
+        card_set = cls.__new__(cls)
+        card_set._mask = mask
+        return card_set
+
+    @classmethod
+    def full(cls, include_blank: bool = False, include_joker: bool = False) -> "CardSet":
+        """
+        Create the set of all 52 standard cards, optionally with the blank
+        card and the joker.
+        """
+
+        mask = _STANDARD_MASK
+        if include_blank:
+            mask |= 1 << codes.BLANK_CODE
+        if include_joker:
+            mask |= 1 << codes.JOKER_CODE
+        return cls.from_mask(mask)
+
+    @classmethod
+    def from_deck(cls, the_deck: Deck) -> "CardSet":
+        """
+        Create the set of the cards in a deck.
+        """
+
+        if isinstance(the_deck, PackedDeck):
+            return cls(the_deck.face_codes)
+        return cls(the_deck)
+
+    @property
+    def mask(self) -> int:
+        """
+        Retrieve the set's bitmask of face codes.
+        """
+
+        return self._mask
+
+    def face_codes(self) -> List[int]:
+        """
+        Retrieve the face codes of the cards in the set, in value order.
+        """
+
+        result = []
+        mask = self._mask
+        while mask:
+            low_bit = mask & -mask
+            result.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return result
+
+    def to_deck(self, packed: bool = False) -> Deck:
+        """
+        Create a deck holding the cards in the set, in value order.
+
+        Args:
+            packed (bool): True to create a `PackedDeck`.
+        """
+
+        if packed:
+            return PackedDeck(bytes(self.face_codes()))
+        return Deck(initial_cards=list(self))
+
+    def isdisjoint(self, other: "CardSet") -> bool:
+        """
+        Returns True if the sets have no cards in common.
+        """
+
+        return not self._mask & other.mask
+
+    def __contains__(self, the_card) -> bool:
+        """
+        Check whether a card (or face code) is in the set.
+        """
+
+        try:
+            return bool(self._mask >> _face_code(the_card) & 1)
+        except (AttributeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Iterate over new `Card` objects for the cards in the set, in value
+        order.
+        """
+
+        return (Card.from_code(face_code) for face_code in self.face_codes())
+
+    def __len__(self) -> int:
+        """
+        Get the number of cards in the set.
+        """
+
+        return _popcount(self._mask)
+
+    def __bool__(self) -> bool:
+        """
+        Returns True if the set isn't empty.
+        """
+
+        return bool(self._mask)
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        """
+        Returns the union of two sets (|).
+        """
+
+        return CardSet.from_mask(self._mask | other.mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        """
+        Returns the intersection of two sets (&).
+        """
+
+        return CardSet.from_mask(self._mask & other.mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        """
+        Returns the cards in this set but not the other (-).
+        """
+
+        return CardSet.from_mask(self._mask & ~other.mask)
+
+    def __xor__(self, other: "CardSet") -> "CardSet":
+        """
+        Returns the cards in exactly one of the sets (^).
+        """
+
+        return CardSet.from_mask(self._mask ^ other.mask)
+
+    def __le__(self, other: "CardSet") -> bool:
+        """
+        Returns True if every card in this set is in the other (<=).
+        """
+
+        return not self._mask & ~other.mask
+
+    def __ge__(self, other: "CardSet") -> bool:
+        """
+        Returns True if every card in the other set is in this one (>=).
+        """
+
+        return not other.mask & ~self._mask
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares two sets (==)
+        """
+
+        return isinstance(other, CardSet) and self._mask == other.mask
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash code of the set's mask.
+        """
+
+        return hash(self._mask)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the set.
+        """
+
+        return "CardSet([" + ", ".join(str(the_card) for the_card in self) + "])"
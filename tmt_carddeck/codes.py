@@ -0,0 +1,122 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Compact integer card codes.
+
+A card code packs a card into a small integer:
+
+* bits 0-5 hold the face code: 0 is the blank card, 1-52 are the standard
+  cards in DEFAULT_SUIT_ORDER/DEFAULT_RANK_ORDER order (so the face code is
+  ``1 + suit_index * 13 + rank_index``, the same as ``int(card)`` with the
+  default ordering), and 53 is the joker;
+* bit 6 is set if the card is face down;
+* bits 7-8 hold the rotation quadrant (rotation // 90).
+
+Face codes fit in a single byte, so they can be stored in a ``bytearray``.
+"""
+
+from micropython import const  # type: ignore
+
+try:
+    from typing import Optional, Tuple  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck.constants import FACE_DOWN, FACE_UP
+from tmt_carddeck.order import DEFAULT_CARD_ORDER
+
+BLANK_CODE: int = const(0)
+JOKER_CODE: int = const(53)
+NUM_FACE_CODES: int = const(54)
+
+FACE_MASK: int = const(0x3F)
+FACE_DOWN_BIT: int = const(0x40)
+ROTATION_SHIFT: int = const(7)
+ROTATION_MASK: int = const(0x03)
+# A card code shifted right by STATE_SHIFT is its state: the face down bit
+# and the rotation quadrant, without the face.
+STATE_SHIFT: int = const(6)
+
+_NUM_RANKS: int = len(DEFAULT_CARD_ORDER.rank_order)
+
+FACE_RANKS: Tuple[Optional[str], ...] = (
+    (None,)
+    + tuple(rank for _ in DEFAULT_CARD_ORDER.suit_order for rank in DEFAULT_CARD_ORDER.rank_order)
+    + ("*",)
+)
+FACE_SUITS: Tuple[Optional[str], ...] = (
+    (None,)
+    + tuple(suit for suit in DEFAULT_CARD_ORDER.suit_order for _ in DEFAULT_CARD_ORDER.rank_order)
+    + ("*",)
+)
+
+
+def encode_face(rank_index: int, suit_index: int) -> int:
+    """
+    Build the face code for a standard card.
+
+    Args:
+        rank_index (int): The index of the rank in DEFAULT_RANK_ORDER.
+        suit_index (int): The index of the suit in DEFAULT_SUIT_ORDER.
+
+    Returns:
+        The face code (1-52).
+    """
+
+    return 1 + suit_index * _NUM_RANKS + rank_index
+
+
+def face_rank_index(face_code: int) -> int:
+    """
+    Retrieve the rank index of a standard card's face code.
+    """
+
+    return (face_code - 1) % _NUM_RANKS
+
+
+def face_suit_index(face_code: int) -> int:
+    """
+    Retrieve the suit index of a standard card's face code.
+    """
+
+    return (face_code - 1) // _NUM_RANKS
+
+
+def encode(face_code: int, orientation: bool = FACE_UP, rotation: int = 0) -> int:
+    """
+    Pack a face code, orientation and rotation into a card code. Only the
+    rotation quadrant is kept.
+
+    Args:
+        face_code (int): The face code (0-53).
+        orientation (bool): FACE_UP or FACE_DOWN.
+        rotation (int): The rotation in degrees.
+
+    Returns:
+        The card code.
+    """
+
+    card_code = face_code
+    if orientation == FACE_DOWN:
+        card_code |= FACE_DOWN_BIT
+    return card_code | (((rotation // 90) & ROTATION_MASK) << ROTATION_SHIFT)
+
+
+def decode(card_code: int) -> Tuple[int, bool, int]:
+    """
+    Unpack a card code.
+
+    Args:
+        card_code (int): The card code.
+
+    Returns:
+        A (face_code, orientation, rotation) tuple.
+    """
+
+    orientation = FACE_DOWN if card_code & FACE_DOWN_BIT else FACE_UP
+    rotation = ((card_code >> ROTATION_SHIFT) & ROTATION_MASK) * 90
+    return card_code & FACE_MASK, orientation, rotation
@@ -44,3 +44,7 @@ ROTATION_270: int = const(270)
 
 FACE_UP: bool = True
 FACE_DOWN: int = False
+
+SORT_BY_VALUE: str = "value"
+SORT_BY_RANK: str = "rank"
+SORT_BY_SUIT: str = "suit"
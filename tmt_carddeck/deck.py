@@ -6,37 +6,243 @@
 tmt_carddeck: CircuitPython Card Deck library.
 """
 
-from tmt_carddeck.card import Card  # noqa
-from tmt_carddeck.constants import DEFAULT_RANK_ORDER, DEFAULT_SUIT_ORDER
+# pylint: disable=too-many-lines
 
+import random
+import struct
+from collections import namedtuple
+
+from micropython import const  # type: ignore
 
 try:
-    from typing import List, Optional, Iterator  # noqa
+    import threading
+except ImportError:
+    threading = None  # pylint: disable=invalid-name
+
+from tmt_carddeck import codes
+from tmt_carddeck.card import Card, CardSignatureType, _SORT_KEY_INDEX  # noqa
+from tmt_carddeck.constants import DEFAULT_RANK_ORDER, DEFAULT_SUIT_ORDER, SORT_BY_VALUE
+from tmt_carddeck.journal import Journal
+
+
+try:
+    from typing import Dict, List, Optional, Iterator, Union  # noqa
 except ImportError:
     pass
 
 
+_RANDOM_BATCH_BITS: int = const(32)
+
+DEAL_ROUND_ROBIN: str = "round_robin"
+DEAL_BLOCK: str = "block"
+
+DeckSnapshot = namedtuple("DeckSnapshot", "cards top")
+
+# Serialized decks (see Deck.to_bytes) start with a header: magic bytes,
+# format version, flags and the number of cards.
+SERIAL_STATE: int = const(0x01)
+SERIAL_SIGNATURES: int = const(0x02)
+_SERIAL_MAGIC: bytes = b"TD"
+_SERIAL_VERSION: int = const(1)
+_SERIAL_HEADER: str = "<2sBBI"
+_SERIAL_HEADER_SIZE: int = struct.calcsize(_SERIAL_HEADER)
+_SERIAL_COUNT: str = "<I"
+_SERIAL_SIGNATURE: str = "<IBI"
+_SIGNATURE_TYPES: tuple = ("text", "graphic")
+
+# Face codes in sorted order, per sort field; built on first use.
+_PACKED_SORT_ORDERS: Dict[str, bytes] = {}
+
+
 class DeckEmpty(RuntimeWarning):
     """Raised when the deck is empty and reset_if_empty is false."""
 
 
+def _make_rng(seed: Optional[int] = None):
+    """
+    Return a random number generator, seeded if a seed is provided.
+    CircuitPython has no random.Random, so there the random module itself
+    is seeded and returned.
+    """
+    if seed is None:
+        return random
+    try:
+        return random.Random(seed)
+    except AttributeError:
+        random.seed(seed)
+        return random
+
+
+def _locked(lock, method):
+    """
+    Wrap a bound method so that it holds a lock while it runs.
+    """
+
+    def locked_method(*args, **kwargs):
+        with lock:
+            return method(*args, **kwargs)
+
+    return locked_method
+
+
 class Deck:
     """
     Represents a deck of cards.
     """
 
-    def __init__(self, initial_cards: Optional[List[Card]] = None) -> None:
+    # The methods a thread-safe deck runs while holding its lock; they're
+    # wrapped per instance, so decks that aren't thread-safe pay nothing.
+    # Special methods and properties can't be wrapped that way, so they
+    # check for the lock themselves.
+    _LOCKED_METHODS: tuple = (
+        "reset_deck",
+        "snapshot",
+        "restore",
+        "pick",
+        "_pick_storage",
+        "shuffle",
+        "sort",
+        "to_bytes",
+    )
+
+    def __init__(
+        self,
+        initial_cards: Optional[List[Card]] = None,
+        journal: Optional[Journal] = None,
+        thread_safe: bool = False,
+    ) -> None:
         """
         Initialize a new Deck
 
         Args:
             initial_cards (Optional[list[Card]]): The initial list of cards.
+            journal (Optional[Journal]): If provided, record changes to the
+                deck in this journal so they can be undone.
+            thread_safe (bool): If true, every pick, deal and other
+                operation on the deck holds the deck's lock (see `lock`),
+                so the deck can be shared between threads.
+
+        Raises:
+            `RuntimeError` is raised if thread_safe is true and threads
+            aren't supported.
         """
-        self._initial_cards: List[Card] = list(initial_cards) if initial_cards else []
-        self._cards: List[Card] = []
-        self._iter_index = 0
+        self._initial_cards = self._make_storage(initial_cards)
+        self._cards = self._initial_cards
+        # Cards before _top have already been picked from the top of the
+        # deck; they're dropped from _cards lazily by _compact().
+        self._top = 0
+        # True while _cards is shared with the initial cards or a snapshot;
+        # it's copied before it's changed (see _own()).
+        self._shared = True
+        self._journal: Optional[Journal] = journal
+        self._lock = None
+        if thread_safe:
+            if threading is None:
+                raise RuntimeError("threads aren't supported")
+            self._lock = threading.RLock()
+            self._bind_locked_methods()
 
-        self.reset_deck()
+    def _bind_locked_methods(self) -> None:
+        """
+        Replace each of the deck's _LOCKED_METHODS with one that holds the
+        deck's lock.
+        """
+        for name in self._LOCKED_METHODS:
+            setattr(self, name, _locked(self._lock, getattr(self, name)))
+
+    @staticmethod
+    def _make_storage(initial_cards) -> List[Card]:
+        """
+        Build the deck's storage from a sequence of cards.
+        """
+        return list(initial_cards) if initial_cards else []
+
+    @property
+    def lock(self):
+        """
+        Retrieve the deck's reentrant lock, or None if the deck isn't
+        thread-safe. Hold it to make several operations atomic.
+        """
+        return self._lock
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle the deck. A thread-safe deck's lock can't be pickled, so
+        only the fact that it has one is saved.
+        """
+        state = self.__dict__.copy()
+        state["_lock"] = self._lock is not None
+        for name in self._LOCKED_METHODS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Unpickle the deck, giving a thread-safe deck a new lock.
+        """
+        self.__dict__.update(state)
+        self._lock = None
+        if state["_lock"]:
+            self._lock = threading.RLock()
+            self._bind_locked_methods()
+
+    @property
+    def journal(self) -> Optional[Journal]:
+        """
+        Retrieve the journal the deck records its changes in, if any.
+        """
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal: Optional[Journal]) -> None:
+        """
+        Set the journal the deck records its changes in. None stops
+        recording.
+        """
+        self._journal = journal
+
+    def _record_restore_point(self) -> None:
+        """
+        If the deck has a journal, record a snapshot to restore, before a
+        change that's undone by restoring it.
+        """
+        if self._journal is not None:
+            self._journal.record(self._restore, self.snapshot())
+
+    def _record_picks(self, picked) -> None:
+        """
+        If the deck has a journal, record that some cards were picked from
+        the top of the deck.
+        """
+        if self._journal is not None and picked:
+            self._journal.record(self._unpick, tuple(picked))
+
+    def _unpick(self, picked) -> None:
+        """
+        Put cards picked from the top of the deck back on top (journal
+        undo step).
+        """
+        num_returned = len(picked) - self._top
+        if num_returned <= 0:
+            self._top -= len(picked)
+            return
+        self._top = 0
+        self._own()
+        self._cards[0:0] = picked[:num_returned]
+
+    def _restore_item(self, index: int, item) -> None:
+        """
+        Put back a replaced card (journal undo step).
+        """
+        self._own()
+        self._cards[self._top + index] = item
+
+    def _insert_item(self, index: int, item) -> None:
+        """
+        Put back a removed card (journal undo step).
+        """
+        self._own()
+        self._cards.insert(self._top + index, item)
 
     def reset_deck(self) -> None:
         """
@@ -44,17 +250,102 @@ class Deck:
         Returns:
 
         """
-        self._cards = list(self._initial_cards)  # type: ignore
+        self._record_restore_point()
+        self._cards = self._initial_cards
+        self._top = 0
+        self._shared = True
+
+    def _own(self) -> None:
+        """
+        Copy the deck's storage if it's shared with a snapshot, so that it
+        can be changed.
+        """
+        if self._shared:
+            self._cards = self._cards[:]
+            self._shared = False
+
+    def _compact(self) -> None:
+        """
+        Drop the cards that have been picked from the top of the deck.
+        """
+        if self._top:
+            if self._shared:
+                self._cards = self._cards[self._top :]
+                self._shared = False
+            else:
+                del self._cards[: self._top]
+            self._top = 0
+
+    def snapshot(self) -> DeckSnapshot:
+        """
+        Capture the deck's current contents so they can be restored later.
+        This doesn't copy anything: the deck and the snapshot share their
+        storage until the deck is changed, and only then is it copied.
+        Picking from the top of the deck doesn't count as a change.
+
+        Returns:
+            The snapshot, for `restore()`.
+        """
+        self._shared = True
+        return DeckSnapshot(self._cards, self._top)
+
+    def restore(self, snapshot: DeckSnapshot) -> None:
+        """
+        Return the deck to a snapshot's contents. A snapshot can be restored
+        any number of times, into any deck of the same type.
+
+        Args:
+            snapshot (DeckSnapshot): The snapshot, from `snapshot()`.
+
+        Raises:
+            `ValueError` is raised if the snapshot is from a different type
+            of deck.
+        """
+        if not isinstance(snapshot.cards, type(self._initial_cards)):
+            raise ValueError("snapshot is from a different type of deck")
+        self._record_restore_point()
+        self._restore(snapshot)
+
+    def _restore(self, snapshot: DeckSnapshot) -> None:
+        """
+        Return the deck to a snapshot's contents without recording it
+        (journal undo step).
+        """
+        self._cards = snapshot.cards
+        self._top = snapshot.top
+        self._shared = True
+
+    def _locate(self, key):
+        """
+        Translate an index or slice into the deck into one into _cards.
+        """
+        if isinstance(key, slice):
+            self._compact()
+            return key
+        num_cards = len(self._cards) - self._top
+        if key < 0:
+            key += num_cards
+        if not 0 <= key < num_cards:
+            raise IndexError("deck index out of range")
+        return key + self._top
 
     @property
     def cards(self) -> Optional[List[Card]]:
         """
         Retrieve a reference to the deck's cards. We return a reference so
-        the caller can modify the deck if desired.
+        the caller can modify the deck if desired. The reference is valid
+        until the next card is picked. A thread-safe deck returns a copy,
+        taken while holding its lock.
 
         Returns:
         A reference to the deck's current contents.
         """
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                return list(self._cards) if self._cards else None
+        self._compact()
+        self._own()
         return self._cards if self._cards else None
 
     def pick(self, **kwargs):
@@ -73,48 +364,690 @@ class Deck:
             `DeckEmpty` is raised if the deck is empty and reset_if_empty
             is False.
         """
-        reset_if_empty: bool = kwargs.get("reset_if_empty", True)
-        pick_location: int = kwargs.get("pick_location", 0)
-
-        if len(self._cards) == 0:
-            if reset_if_empty:
+        if self._top >= len(self._cards):
+            if kwargs.get("reset_if_empty", True):
                 self.reset_deck()
             else:
                 raise DeckEmpty("no cards in deck")
-        return self._cards.pop(pick_location)
+
+        pick_location: int = kwargs.get("pick_location", 0)
+        if pick_location == 0:
+            the_card = self._cards[self._top]
+            self._top += 1
+            if self._journal is not None:
+                self._journal.record(self._unpick, (the_card,))
+            return the_card
+
+        pick_location = self._locate(pick_location)
+        self._own()
+        the_card = self._cards[pick_location]
+        del self._cards[pick_location]
+        if self._journal is not None:
+            self._journal.record(self._insert_item, pick_location - self._top, the_card)
+        return the_card
+
+    def pick_many(self, num_cards: int, reset_if_empty: bool = True):
+        """
+        Pick several cards from the top of the deck.
+
+        Args:
+            num_cards (int): The number of cards to pick.
+            reset_if_empty (bool): True to reset the deck to its initial
+                state whenever it runs out of cards.
+
+        Returns:
+            A list of the selected cards, top card first.
+
+        Raises:
+            `DeckEmpty` is raised if there aren't enough cards in the deck
+            and reset_if_empty is False. No cards are picked in that case.
+            `ValueError` is raised if num_cards is negative.
+        """
+        return self._pick_storage(num_cards, reset_if_empty)
+
+    def _pick_storage(self, num_cards: int, reset_if_empty: bool):
+        """
+        Pick several cards from the top of the deck as a slice of _cards.
+        """
+        if num_cards < 0:
+            raise ValueError("can't pick a negative number of cards")
+        end = self._top + num_cards
+        if end <= len(self._cards):
+            picked = self._cards[self._top : end]
+            self._top = end
+            self._record_picks(picked)
+            return picked
+
+        if not reset_if_empty or not self._initial_cards:
+            raise DeckEmpty("not enough cards in deck")
+        picked = self._cards[self._top :]
+        self._top = len(self._cards)
+        self._record_picks(picked)
+        while len(picked) < num_cards:
+            self.reset_deck()
+            needed = min(num_cards - len(picked), len(self._cards))
+            segment = self._cards[:needed]
+            picked = picked + segment
+            self._top = needed
+            self._record_picks(segment)
+        return picked
+
+    def deal(
+        self,
+        num_hands: int,
+        cards_per_hand: int,
+        pattern: str = DEAL_ROUND_ROBIN,
+        compact: bool = False,
+        reset_if_empty: bool = True,
+    ) -> list:
+        """
+        Deal several hands from the top of the deck at once.
+
+        Args:
+            num_hands (int): The number of hands to deal.
+            cards_per_hand (int): The number of cards in each hand.
+            pattern (str): DEAL_ROUND_ROBIN to deal one card to each hand in
+                turn, or DEAL_BLOCK to deal each hand its cards in one go.
+            compact (bool): If true, each hand is returned as a bytes object
+                of face codes (see `tmt_carddeck.codes`) instead of a list of
+                cards.
+            reset_if_empty (bool): True to reset the deck to its initial
+                state whenever it runs out of cards.
+
+        Returns:
+            A list of the hands.
+
+        Raises:
+            `DeckEmpty` is raised if there aren't enough cards in the deck
+            and reset_if_empty is False.
+            `ValueError` is raised if the pattern isn't known, or if
+            num_hands or cards_per_hand is negative.
+        """
+        if pattern not in (DEAL_ROUND_ROBIN, DEAL_BLOCK):
+            raise ValueError("unknown deal pattern")
+        if num_hands < 0 or cards_per_hand < 0:
+            raise ValueError("can't deal a negative number of hands or cards")
+
+        dealt = self._pick_storage(num_hands * cards_per_hand, reset_if_empty)
+        if pattern == DEAL_ROUND_ROBIN:
+            hands = [dealt[hand_index::num_hands] for hand_index in range(num_hands)]
+        else:
+            hands = [
+                dealt[hand_index * cards_per_hand : (hand_index + 1) * cards_per_hand]
+                for hand_index in range(num_hands)
+            ]
+        return [self._hand_from_storage(hand, compact) for hand in hands]
+
+    @staticmethod
+    def _hand_from_storage(hand, compact: bool):
+        """
+        Convert a dealt slice of _cards into a hand.
+        """
+        if compact:
+            return bytes(the_card.face_code for the_card in hand)
+        return hand
+
+    def shuffle(self, rng=None, seed: Optional[int] = None) -> None:
+        """
+        Shuffle the deck in place (Fisher-Yates).
+
+        Args:
+            rng: The random number generator. Any object with a getrandbits()
+                or randrange() method will do. If not provided, the random
+                module is used.
+            seed (Optional[int]): If provided (and rng isn't), shuffle with a
+                new generator seeded with this value, so the result is
+                reproducible.
+        """
+        if rng is None:
+            rng = _make_rng(seed)
+        self._record_restore_point()
+        self._compact()
+        self._own()
+        the_cards = self._cards
+        last_index = len(the_cards) - 1
+
+        if not hasattr(rng, "getrandbits"):
+            randrange = rng.randrange
+            for i in range(last_index, 0, -1):
+                j = randrange(i + 1)
+                the_cards[i], the_cards[j] = the_cards[j], the_cards[i]
+            return
+
+        getrandbits = rng.getrandbits
+        # Draw random bits 32 at a time and spend only as many as each swap
+        # needs, rejecting values that are out of range.
+        width = 0
+        while (1 << width) <= last_index:
+            width += 1
+        mask = (1 << width) - 1
+        pool = 0
+        pool_bits = 0
+        for i in range(last_index, 0, -1):
+            if i <= (mask >> 1):
+                width -= 1
+                mask >>= 1
+            while True:
+                if pool_bits < width:
+                    pool = getrandbits(_RANDOM_BATCH_BITS)
+                    pool_bits = _RANDOM_BATCH_BITS
+                j = pool & mask
+                pool >>= width
+                pool_bits -= width
+                if j <= i:
+                    break
+            the_cards[i], the_cards[j] = the_cards[j], the_cards[i]
+
+    def sort(  # pylint: disable=invalid-name
+        self, by: str = SORT_BY_VALUE, reverse: bool = False
+    ) -> None:
+        """
+        Sort the deck in place, using each card's precomputed sort key (see
+        `Card.sort_key`). The sort is stable.
+
+        Args:
+            by (str): SORT_BY_VALUE, SORT_BY_RANK or SORT_BY_SUIT.
+            reverse (bool): True to sort from highest to lowest.
+
+        Raises:
+            `ValueError` is raised if the sort field isn't known.
+        """
+        key_index = _SORT_KEY_INDEX.get(by)
+        if key_index is None:
+            raise ValueError("unknown sort field")
+        self._record_restore_point()
+        self._compact()
+        self._own()
+        self._cards.sort(key=lambda the_card: the_card.face.sort_keys[key_index], reverse=reverse)
+
+    def to_bytes(self, state: bool = False, signatures: bool = False) -> bytes:
+        """
+        Serialize the deck's current cards.
+
+        The data is an 8-byte header (b"TD", the format version, the flags
+        and the number of cards as a little-endian uint32), then one face
+        code byte per card (see `tmt_carddeck.codes`). Optionally, it's
+        followed by one state byte per card (the face down bit and rotation
+        quadrant, ``card.code >> STATE_SHIFT``) and by a signature table: a
+        uint32 count, then per signed card its index (uint32), type (0 for
+        text, 1 for graphic), data length (uint32) and UTF-8 data.
+
+        Args:
+            state (bool): True to include each card's orientation and
+                rotation quadrant.
+            signatures (bool): True to include the cards' signatures.
+
+        Returns:
+            The serialized deck, for `from_bytes()`.
+
+        Raises:
+            `ValueError` is raised if a card isn't one of the standard
+            cards, the blank card or the joker.
+        """
+        self._compact()
+        the_cards = self._cards
+        flags = (SERIAL_STATE if state else 0) | (SERIAL_SIGNATURES if signatures else 0)
+        data = bytearray(
+            struct.pack(_SERIAL_HEADER, _SERIAL_MAGIC, _SERIAL_VERSION, flags, len(the_cards))
+        )
+        data += self._face_code_bytes(the_cards)
+        if state:
+            data += self._state_bytes(the_cards)
+        if signatures:
+            data += self._signature_table(the_cards)
+        return bytes(data)
+
+    def __bytes__(self) -> bytes:
+        """
+        Serialize the deck's current cards, without their state or
+        signatures (see `to_bytes`).
+        """
+        return self.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data) -> "Deck":
+        """
+        Create a deck from serialized data. Its initial cards are the
+        serialized cards.
+
+        Args:
+            data: The data from `to_bytes()`, as any bytes-like object
+                (bytes, bytearray or memoryview).
+
+        Returns:
+            The new deck.
+
+        Raises:
+            `ValueError` is raised if the data is truncated or isn't a
+            serialized deck.
+        """
+        view = memoryview(data)
+        if len(view) < _SERIAL_HEADER_SIZE:
+            raise ValueError("truncated deck data")
+        magic, version, flags, num_cards = struct.unpack_from(_SERIAL_HEADER, view)
+        if magic != _SERIAL_MAGIC or version != _SERIAL_VERSION:
+            raise ValueError("not serialized deck data")
+
+        offset = _SERIAL_HEADER_SIZE
+        face_codes = view[offset : offset + num_cards]
+        offset += num_cards
+        states = None
+        if flags & SERIAL_STATE:
+            states = view[offset : offset + num_cards]
+            offset += num_cards
+        signature_table = []
+        if flags & SERIAL_SIGNATURES:
+            signature_table = _read_signature_table(view, offset, num_cards)
+        if len(face_codes) < num_cards or (states is not None and len(states) < num_cards):
+            raise ValueError("truncated deck data")
+        if num_cards and max(face_codes) >= codes.NUM_FACE_CODES:
+            raise ValueError("invalid face code")
+        return cls._from_storage(cls._storage_from_bytes(face_codes, states, signature_table))
+
+    @classmethod
+    def _from_storage(cls, storage) -> "Deck":
+        """
+        Create a deck whose initial cards are deserialized storage.
+        Subclasses whose constructors take other arguments override this.
+        """
+        return cls(initial_cards=storage)
+
+    @staticmethod
+    def _face_code_bytes(the_cards) -> bytes:
+        """
+        Retrieve the face code of each card in a slice of _cards.
+        """
+        return bytes(the_card.face_code for the_card in the_cards)
+
+    @staticmethod
+    def _state_bytes(the_cards) -> bytes:
+        """
+        Retrieve the state (see `codes.STATE_SHIFT`) of each card in a slice
+        of _cards.
+        """
+        return bytes(the_card.code >> codes.STATE_SHIFT for the_card in the_cards)
+
+    @staticmethod
+    def _signature_table(the_cards) -> bytes:
+        """
+        Build the serialized signature table for a slice of _cards.
+        """
+        signed = [
+            (index, the_card.signature)
+            for index, the_card in enumerate(the_cards)
+            if the_card.signature is not None
+        ]
+        table = bytearray(struct.pack(_SERIAL_COUNT, len(signed)))
+        for index, signature in signed:
+            signature_data = str(signature.data).encode("utf-8")
+            table += struct.pack(
+                _SERIAL_SIGNATURE,
+                index,
+                _SIGNATURE_TYPES.index(signature.type),
+                len(signature_data),
+            )
+            table += signature_data
+        return bytes(table)
+
+    @staticmethod
+    def _storage_from_bytes(face_codes, states, signature_table) -> List[Card]:
+        """
+        Build the deck's initial cards from serialized face codes, states
+        and signatures.
+        """
+        if states is None:
+            the_cards = [Card.from_code(face_code) for face_code in face_codes]
+        else:
+            the_cards = [
+                Card.from_code(face_code | (state << codes.STATE_SHIFT))
+                for face_code, state in zip(face_codes, states)
+            ]
+        for index, signature in signature_table:
+            if signature.type == "text":
+                the_cards[index].sign(text_signature=signature.data)
+            else:
+                the_cards[index].sign(graphic_signature=signature.data)
+        return the_cards
 
     def __len__(self):
         """
         Get the number of cards in the deck.
         """
-        return len(list(self._cards)) if self._cards else 0
+        return len(self._cards) - self._top
 
     def __getitem__(self, item):
-        return self._cards[item]
+        if self._lock is not None:
+            with self._lock:
+                return self._get_item(item)
+        return self._get_item(item)
 
     def __setitem__(self, key, value):
-        self._cards[key] = value
+        if self._lock is not None:
+            with self._lock:
+                self._set_item(key, value)
+        else:
+            self._set_item(key, value)
 
     def __delitem__(self, key) -> None:
+        if self._lock is not None:
+            with self._lock:
+                self._del_item(key)
+        else:
+            self._del_item(key)
+
+    def _get_item(self, item):
+        """
+        Retrieve a card (or a list of cards) from the deck.
+        """
+        return self._cards[self._locate(item)]
+
+    def _set_item(self, key, value) -> None:
+        """
+        Replace a card (or a slice of cards) in the deck.
+        """
+        self._record_change(key)
+        key = self._locate(key)
+        self._own()
+        self._cards[key] = value
+
+    def _del_item(self, key) -> None:
+        """
+        Remove a card (or a slice of cards) from the deck.
+        """
+        key = self._locate(key)
+        if self._journal is not None:
+            if isinstance(key, slice):
+                self._record_restore_point()
+            else:
+                self._journal.record(self._insert_item, key - self._top, self._cards[key])
+        self._own()
         del self._cards[key]
 
+    def _record_change(self, key) -> None:
+        """
+        If the deck has a journal, record the card (or slice of cards) that
+        a change to key will replace.
+        """
+        if self._journal is None:
+            return
+        if isinstance(key, slice):
+            self._record_restore_point()
+            return
+        index = self._locate(key)
+        self._journal.record(self._restore_item, index - self._top, self._cards[index])
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterate over the cards in the deck. Each iterator is independent,
+        so iterations can be nested. A thread-safe deck iterates over a copy
+        of its cards, taken while holding its lock.
+        """
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                return iter(list(self._cards))
+        self._compact()
+        return iter(self._cards)
+
+
+class PackedDeck(Deck):
+    """
+    A deck that stores one byte per card (its face code, see
+    `tmt_carddeck.codes`) instead of a list of `Card` objects. Cards are
+    created when they're picked or read, face up and unrotated.
+
+    Only the standard cards, the blank card and the joker can be stored.
+    """
+
+    @classmethod
+    def _make_storage(cls, initial_cards) -> bytearray:
+        """
+        Build the deck's storage from a sequence of cards or face codes.
+        """
+        if isinstance(initial_cards, (bytes, bytearray, memoryview)):
+            if initial_cards and max(initial_cards) >= codes.NUM_FACE_CODES:
+                raise ValueError("invalid face code")
+            return bytearray(initial_cards)
+        return bytearray(cls._face_code(the_card) for the_card in initial_cards or ())
+
+    @staticmethod
+    def _face_code(the_card: Union[Card, int]) -> int:
+        """
+        Convert a card (or a face code) to a face code.
+        """
+        if isinstance(the_card, int):
+            if not 0 <= the_card < codes.NUM_FACE_CODES:
+                raise ValueError("invalid face code")
+            return the_card
+        return the_card.face_code
+
+    @property
+    def cards(self) -> Optional[List[Card]]:
+        """
+        Retrieve the deck's current contents as a list of new `Card`
+        objects. Use `face_codes` to modify the deck in place.
+
+        Returns:
+        The deck's current contents.
+        """
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                the_cards = bytes(self._cards)
+        else:
+            self._compact()
+            the_cards = self._cards
+        return [Card.from_code(face_code) for face_code in the_cards] if the_cards else None
+
+    @property
+    def face_codes(self) -> bytearray:
+        """
+        Retrieve a reference to the deck's face codes. The reference is
+        valid until the next card is picked. A thread-safe deck returns a
+        copy, taken while holding its lock.
+        """
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                return bytearray(self._cards)
+        self._compact()
+        self._own()
+        return self._cards
+
+    def pick(self, **kwargs):
+        """
+        Pick a card from the deck. Takes the same arguments as `Deck.pick`.
+        """
+        return Card.from_code(super().pick(**kwargs))
+
+    def pick_many(self, num_cards: int, reset_if_empty: bool = True):
+        """
+        Pick several cards from the top of the deck. Takes the same
+        arguments as `Deck.pick_many`.
+        """
+        return [
+            Card.from_code(face_code)
+            for face_code in self._pick_storage(num_cards, reset_if_empty=reset_if_empty)
+        ]
+
+    def sort(  # pylint: disable=invalid-name
+        self, by: str = SORT_BY_VALUE, reverse: bool = False
+    ) -> None:
+        """
+        Sort the deck in place. Takes the same arguments as `Deck.sort`.
+
+        There are only 54 face codes, so this is a counting sort: one pass
+        to count each code, then one to write them back in order.
+        """
+        sort_order = _packed_sort_order(by)
+        self._record_restore_point()
+        self._compact()
+        self._own()
+        counts = [0] * codes.NUM_FACE_CODES
+        for face_code in self._cards:
+            counts[face_code] += 1
+
+        sorted_codes = bytearray()
+        for face_code in reversed(sort_order) if reverse else sort_order:
+            if counts[face_code]:
+                sorted_codes += bytes((face_code,)) * counts[face_code]
+        self._cards[:] = sorted_codes
+
+    @staticmethod
+    def _face_code_bytes(the_cards) -> bytes:
+        """
+        Retrieve a slice of the deck's face codes.
+        """
+        return bytes(the_cards)
+
+    @staticmethod
+    def _state_bytes(the_cards) -> bytes:
+        """
+        Retrieve the card states; a packed deck's cards are always face up
+        and unrotated.
+        """
+        return bytes(len(the_cards))
+
+    @staticmethod
+    def _signature_table(the_cards) -> bytes:
+        """
+        Build the (empty) signature table; a packed deck's cards aren't
+        signed.
+        """
+        return struct.pack(_SERIAL_COUNT, 0)
+
+    @staticmethod
+    def _storage_from_bytes(face_codes, states, signature_table):
+        """
+        Use the serialized face codes as the deck's storage. Packed decks
+        don't keep card states or signatures, so those are ignored.
+        """
+        return face_codes
+
+    @staticmethod
+    def _hand_from_storage(hand, compact: bool):
+        """
+        Convert a dealt slice of face codes into a hand.
+        """
+        if compact:
+            return bytes(hand)
+        return [Card.from_code(face_code) for face_code in hand]
+
+    def _get_item(self, item):
+        """
+        Retrieve a new `Card` (or a list of them) from the deck.
+        """
+        item = self._locate(item)
+        if isinstance(item, slice):
+            return [Card.from_code(face_code) for face_code in self._cards[item]]
+        return Card.from_code(self._cards[item])
+
+    def _set_item(self, key, value) -> None:
+        """
+        Replace a card (or a slice of cards) in the deck, storing their
+        face codes.
+        """
+        self._record_change(key)
+        key = self._locate(key)
+        self._own()
+        if isinstance(key, slice):
+            self._cards[key] = bytearray(self._face_code(the_card) for the_card in value)
+        else:
+            self._cards[key] = self._face_code(value)
+
+    def __contains__(self, item) -> bool:
+        try:
+            face_code = self._face_code(item)
+        except (AttributeError, ValueError):
+            return False
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                return face_code in self._cards
+        self._compact()
+        return face_code in self._cards
+
     def __iter__(self) -> Iterator:
-        self._iter_index = 0
-        return self
+        if self._lock is not None:
+            with self._lock:
+                self._compact()
+                the_cards = bytes(self._cards)
+        else:
+            self._compact()
+            the_cards = self._cards
+        return (Card.from_code(face_code) for face_code in the_cards)
+
+
+def _read_signature_table(view: memoryview, offset: int, num_cards: int) -> list:
+    """
+    Read a serialized signature table (see `Deck.to_bytes`).
 
-    def __next__(self) -> Card:
-        if self._iter_index >= len(self._cards):
-            raise StopIteration
+    Returns:
+        A list of (card index, CardSignatureType) tuples.
 
-        selected_card = self._cards[self._iter_index]
-        self._iter_index += 1
-        return selected_card
+    Raises:
+        `ValueError` is raised if the table is truncated or malformed, or
+        signs a card more than once.
+    """
+    try:
+        (num_signatures,) = struct.unpack_from(_SERIAL_COUNT, view, offset)
+        offset += struct.calcsize(_SERIAL_COUNT)
+        signature_table = []
+        signed = set()
+        for _ in range(num_signatures):
+            index, type_index, length = struct.unpack_from(_SERIAL_SIGNATURE, view, offset)
+            offset += struct.calcsize(_SERIAL_SIGNATURE)
+            signature_data = bytes(view[offset : offset + length])
+            offset += length
+            if index >= num_cards or index in signed or len(signature_data) != length:
+                raise ValueError("invalid signature table")
+            signed.add(index)
+            signature_table.append(
+                (
+                    index,
+                    CardSignatureType(
+                        type=_SIGNATURE_TYPES[type_index], data=signature_data.decode("utf-8")
+                    ),
+                )
+            )
+    except (struct.error, IndexError, UnicodeError) as error:
+        raise ValueError("invalid signature table") from error
+    return signature_table
+
+
+def _packed_sort_order(sort_field: str) -> bytes:
+    """
+    Return every face code, in sorted order by the given sort field.
+    """
+    sort_order = _PACKED_SORT_ORDERS.get(sort_field)
+    if sort_order is None:
+        sort_order = bytes(
+            sorted(
+                range(codes.NUM_FACE_CODES),
+                key=lambda face_code: Card.from_code(face_code).sort_key(sort_field),
+            )
+        )
+        _PACKED_SORT_ORDERS[sort_field] = sort_order
+    return sort_order
 
 
 def standard_deck(
-    include_blank: Optional[bool] = True, include_joker: Optional[bool] = True
+    include_blank: Optional[bool] = True,
+    include_joker: Optional[bool] = True,
+    packed: Optional[bool] = False,
 ) -> Deck:
-    """Build and return a standard card deck."""
+    """
+    Build and return a standard card deck. If packed is true, the deck is a
+    `PackedDeck`.
+    """
+    if packed:
+        return PackedDeck(
+            range(
+                codes.BLANK_CODE if include_blank else codes.BLANK_CODE + 1,
+                codes.JOKER_CODE + 1 if include_joker else codes.JOKER_CODE,
+            )
+        )
+
     the_deck: List[Card] = []
 
     if include_blank:
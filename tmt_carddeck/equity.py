@@ -0,0 +1,204 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Monte Carlo hold'em equity simulator.
+
+Trials are split into chunks, and each chunk gets its own RNG seeded from
+the simulation's seed. The chunks are spread across a process pool. By
+default a simulation is split into up to DEFAULT_NUM_CHUNKS chunks (of at
+least MIN_CHUNK_SIZE trials), so that many workers can be kept busy.
+Because the chunking doesn't depend on the number of workers, a seeded
+simulation gives the same result on any machine.
+
+This module needs concurrent.futures, so it's for CPython only.
+"""
+
+import math
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from typing import List, Optional, Sequence, Tuple, Union  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck.card import Card
+from tmt_carddeck.cardset import CardSet
+from tmt_carddeck.eval import get_evaluator
+
+BOARD_SIZE: int = 5
+DEFAULT_NUM_CHUNKS: int = 256
+MIN_CHUNK_SIZE: int = 250
+
+EquityResult = namedtuple("EquityResult", "equity wins ties trials low high")
+
+
+def _face_codes(cards: Sequence[Union[Card, int]]) -> List[int]:
+    """
+    Convert cards (or face codes) to face codes.
+    """
+
+    return [the_card if isinstance(the_card, int) else the_card.face_code for the_card in cards]
+
+
+# The trial loop keeps everything it touches in locals for speed.
+# pylint: disable=too-many-locals
+def _run_trials(
+    hands: List[List[int]],
+    board: List[int],
+    remaining: List[int],
+    num_trials: int,
+    seed: int,
+    cache_file: Optional[str],
+) -> Tuple[List[int], List[int], List[float], List[float]]:
+    """
+    Run one chunk of trials.
+
+    Returns:
+        Per-player lists of wins, ties, equity sums and squared equity sums.
+    """
+
+    evaluate_codes = get_evaluator(cache_file).evaluate_codes
+    rng = random.Random(seed)
+    num_players = len(hands)
+    num_missing = BOARD_SIZE - len(board)
+    wins = [0] * num_players
+    ties = [0] * num_players
+    shares = [0.0] * num_players
+    shares_squared = [0.0] * num_players
+
+    for _ in range(num_trials):
+        full_board = board + rng.sample(remaining, num_missing)
+        scores = [evaluate_codes(hand + full_board) for hand in hands]
+        best = max(scores)
+        winners = [player for player in range(num_players) if scores[player] == best]
+        share = 1.0 / len(winners)
+        for player in winners:
+            if len(winners) == 1:
+                wins[player] += 1
+            else:
+                ties[player] += 1
+            shares[player] += share
+            shares_squared[player] += share * share
+
+    return wins, ties, shares, shares_squared
+
+
+# pylint: enable=too-many-locals
+
+
+def simulate_equity(
+    hole_cards: Sequence[Sequence[Union[Card, int]]],
+    board: Sequence[Union[Card, int]] = (),
+    trials: int = 100000,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    z_score: float = 1.96,
+    cache_file: Optional[str] = None,
+) -> List[EquityResult]:
+    """
+    Estimate each player's equity by dealing random run-outs of the board.
+
+    Args:
+        hole_cards (Sequence[Sequence[Union[Card, int]]]): Each player's
+            hole cards, as `Card` objects or face codes.
+        board (Sequence[Union[Card, int]]): The known board cards (0-5).
+        trials (int): The number of run-outs to deal.
+        workers (Optional[int]): The number of worker processes. None uses
+            one per CPU; 0 or 1 runs the trials in this process.
+        seed (Optional[int]): Seed for reproducible results.
+        chunk_size (Optional[int]): The number of trials in each chunk of
+            work. Defaults to splitting the trials into DEFAULT_NUM_CHUNKS
+            chunks of at least MIN_CHUNK_SIZE, so at most that many workers
+            run at once.
+        z_score (float): The z-score of the confidence interval (1.96 for
+            95%).
+        cache_file (Optional[str]): The evaluator table cache file (see
+            `tmt_carddeck.eval.HandEvaluator`). The evaluator is loaded
+            before the pool starts, so forked workers share its tables;
+            workers started another way load them from the cache.
+
+    Returns:
+        An `EquityResult` per player: the equity (wins plus split pots,
+        0-1), the number of outright wins and of ties, the number of
+        trials, and the low and high ends of the confidence interval.
+
+    Raises:
+        ValueError is raised if a card appears twice or the board has more
+        than five cards.
+    """
+    hands = [_face_codes(hand) for hand in hole_cards]
+    board_codes = _face_codes(board)
+    remaining = _remaining_codes(hands, board_codes)
+
+    seed_rng = random.Random(seed)
+    jobs = [
+        (hands, board_codes, remaining, chunk_trials, seed_rng.getrandbits(64), cache_file)
+        for chunk_trials in _chunk_sizes(trials, chunk_size)
+    ]
+
+    if workers is not None and workers <= 1:
+        chunk_results = [_run_trials(*job) for job in jobs]
+    else:
+        get_evaluator(cache_file)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(_run_trials, *zip(*jobs)))
+
+    return _merge_results(len(hands), trials, chunk_results, z_score)
+
+
+def _remaining_codes(hands: List[List[int]], board_codes: List[int]) -> List[int]:
+    """
+    Check the known cards and return the face codes of the rest of the deck.
+    """
+
+    known = board_codes + [face_code for hand in hands for face_code in hand]
+    known_set = CardSet(known)
+    if len(known_set) != len(known):
+        raise ValueError("a card appears more than once")
+    if len(board_codes) > BOARD_SIZE:
+        raise ValueError("board has too many cards")
+    return (CardSet.full() - known_set).face_codes()
+
+
+def _chunk_sizes(trials: int, chunk_size: Optional[int]) -> List[int]:
+    """
+    Split a number of trials into chunks.
+    """
+
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-trials // DEFAULT_NUM_CHUNKS))
+    return [min(chunk_size, trials - start) for start in range(0, trials, chunk_size)]
+
+
+def _merge_results(
+    num_players: int, trials: int, chunk_results: list, z_score: float
+) -> List[EquityResult]:
+    """
+    Combine the per-chunk tallies into one result per player.
+    """
+
+    results = []
+    for player in range(num_players):
+        wins = sum(chunk[0][player] for chunk in chunk_results)
+        ties = sum(chunk[1][player] for chunk in chunk_results)
+        shares = sum(chunk[2][player] for chunk in chunk_results)
+        shares_squared = sum(chunk[3][player] for chunk in chunk_results)
+        if not trials:
+            results.append(EquityResult(0.0, 0, 0, 0, 0.0, 1.0))
+            continue
+        equity = shares / trials
+        variance = max(shares_squared / trials - equity * equity, 0.0)
+        margin = z_score * math.sqrt(variance / trials)
+        results.append(
+            EquityResult(
+                equity, wins, ties, trials, max(equity - margin, 0.0), min(equity + margin, 1.0)
+            )
+        )
+    return results
@@ -0,0 +1,403 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Lookup-table poker hand evaluator for 5, 6 and 7 card hands.
+
+Each rank is assigned a prime, so the product of a hand's primes identifies
+its rank multiset. One dict maps those products to the score of the best
+five-card non-flush hand, and a second table maps a suit's 13-bit rank mask
+to the best flush (or straight flush) it holds. A hand's score is the larger
+of the two lookups. Scores run from 1 (7-5-4-3-2 offsuit) to 7462 (a royal
+flush); a higher score is a better hand.
+
+The tables hold about 75,000 entries, so this module is meant for CPython.
+Building them takes about a second; pass a cache_file to
+`HandEvaluator` to load them from disk instead. The shared evaluator
+(`get_evaluator()`, `evaluate()`) caches them in `default_cache_file()`.
+"""
+
+import json
+import os
+import tempfile
+from itertools import combinations, combinations_with_replacement
+
+try:
+    from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck import codes
+from tmt_carddeck.card import Card
+from tmt_carddeck.order import DEFAULT_CARD_ORDER
+
+HIGH_CARD: int = 0
+ONE_PAIR: int = 1
+TWO_PAIR: int = 2
+THREE_OF_A_KIND: int = 3
+STRAIGHT: int = 4
+FLUSH: int = 5
+FULL_HOUSE: int = 6
+FOUR_OF_A_KIND: int = 7
+STRAIGHT_FLUSH: int = 8
+
+HAND_CLASSES: Tuple[str, ...] = (
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+)
+
+# The lowest score in each hand class.
+HAND_CLASS_STARTS: Tuple[int, ...] = (1, 1278, 4138, 4996, 5854, 5864, 7141, 7297, 7453)
+
+MAX_SCORE: int = 7462
+
+RANK_PRIMES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_TABLE_VERSION: int = 1
+_NUM_RANKS: int = len(DEFAULT_CARD_ORDER.rank_order)
+_WHEEL: Tuple[int, ...] = (12, 3, 2, 1, 0)
+_SHAPE_CLASSES: Dict[tuple, int] = {
+    (4, 1): FOUR_OF_A_KIND,
+    (3, 2): FULL_HOUSE,
+    (3, 1, 1): THREE_OF_A_KIND,
+    (2, 2, 1): TWO_PAIR,
+    (2, 1, 1, 1): ONE_PAIR,
+}
+
+# Per face code: the rank's prime, the rank's bit and the suit index. The
+# blank card and the joker have no entry.
+_FACE_PRIMES: List[int] = [0] * codes.NUM_FACE_CODES
+_FACE_RANK_BITS: List[int] = [0] * codes.NUM_FACE_CODES
+_FACE_SUITS: List[int] = [0] * codes.NUM_FACE_CODES
+for _face_code in range(codes.BLANK_CODE + 1, codes.JOKER_CODE):
+    _FACE_PRIMES[_face_code] = RANK_PRIMES[codes.face_rank_index(_face_code)]
+    _FACE_RANK_BITS[_face_code] = 1 << codes.face_rank_index(_face_code)
+    _FACE_SUITS[_face_code] = codes.face_suit_index(_face_code)
+
+
+def _straight_high(ranks: Sequence[int]) -> Optional[int]:
+    """
+    Return the high rank of five distinct ranks (sorted high to low) if
+    they form a straight.
+    """
+
+    if tuple(ranks) == _WHEEL:
+        return 3
+    if ranks[0] - ranks[4] == 4:
+        return ranks[0]
+    return None
+
+
+def _five_card_key(ranks: Sequence[int], is_flush: bool) -> tuple:
+    """
+    Return a sort key for a five-card hand, given its ranks.
+    """
+
+    counts: Dict[int, int] = {}
+    for rank in ranks:
+        counts[rank] = counts.get(rank, 0) + 1
+    grouped = sorted(counts, key=lambda rank: (counts[rank], rank), reverse=True)
+
+    if len(counts) == 5:
+        straight_high = _straight_high(grouped)
+        if straight_high is not None:
+            return (STRAIGHT_FLUSH if is_flush else STRAIGHT, straight_high)
+        return (FLUSH if is_flush else HIGH_CARD,) + tuple(grouped)
+    shape = tuple(counts[rank] for rank in grouped)
+    return (_SHAPE_CLASSES[shape],) + tuple(grouped)
+
+
+def _rank_product(ranks: Iterable[int]) -> int:
+    """
+    Return the product of the primes for some ranks.
+    """
+
+    product = 1
+    for rank in ranks:
+        product *= RANK_PRIMES[rank]
+    return product
+
+
+def _rank_mask(ranks: Iterable[int]) -> int:
+    """
+    Return the rank bit mask for some distinct ranks.
+    """
+
+    mask = 0
+    for rank in ranks:
+        mask |= 1 << rank
+    return mask
+
+
+def build_tables() -> Tuple[Dict[int, int], List[int]]:
+    """
+    Build the evaluator's lookup tables.
+
+    Returns:
+        A (products, flushes) tuple. products maps the prime product of a
+        5, 6 or 7 card rank multiset to its best non-flush score; flushes
+        maps a 13-bit rank mask with five or more bits set to its best flush
+        score (0 for smaller masks).
+    """
+
+    # Rank every five-card equivalence class, worst first.
+    classes = []
+    for ranks in combinations_with_replacement(range(_NUM_RANKS - 1, -1, -1), 5):
+        if ranks[0] != ranks[4]:
+            classes.append((_five_card_key(ranks, False), ranks, False))
+    for ranks in combinations(range(_NUM_RANKS - 1, -1, -1), 5):
+        classes.append((_five_card_key(ranks, True), ranks, True))
+    classes.sort()
+
+    products: Dict[int, int] = {}
+    flushes: List[int] = [0] * (1 << _NUM_RANKS)
+    for score, (_, ranks, is_flush) in enumerate(classes, 1):
+        if is_flush:
+            flushes[_rank_mask(ranks)] = score
+        else:
+            products[_rank_product(ranks)] = score
+
+    _extend_products(products)
+    _extend_flushes(flushes)
+    return products, flushes
+
+
+def _extend_products(products: Dict[int, int]) -> None:
+    """
+    Add the six- and seven-card rank multisets to the products table. A
+    hand scores the same as its best subset with one card fewer.
+    """
+
+    for num_cards in (6, 7):
+        for ranks in combinations_with_replacement(range(_NUM_RANKS), num_cards):
+            if any(ranks[i] == ranks[i + 4] for i in range(num_cards - 4)):
+                continue
+            products[_rank_product(ranks)] = max(
+                products[_rank_product(ranks[:i] + ranks[i + 1 :])] for i in range(num_cards)
+            )
+
+
+def _extend_flushes(flushes: List[int]) -> None:
+    """
+    Fill in the flush table for masks with more than five ranks. Masks are
+    visited in increasing order, so every smaller mask has already been
+    filled in.
+    """
+
+    for mask in range(1 << _NUM_RANKS):
+        if flushes[mask]:
+            continue
+        best = 0
+        bit = 1
+        while bit <= mask:
+            if mask & bit:
+                best = max(best, flushes[mask ^ bit])
+            bit <<= 1
+        flushes[mask] = best
+
+
+class HandEvaluator:
+    """
+    Scores 5, 6 and 7 card poker hands with precomputed lookup tables.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None) -> None:
+        """
+        Load or build the lookup tables.
+
+        Args:
+            cache_file (Optional[str]): If provided, load the tables from
+                this JSON file, or build them and write them there if the
+                file doesn't exist or is out of date.
+        """
+        tables = None
+        if cache_file is not None:
+            tables = self._load_tables(cache_file)
+        if tables is None:
+            tables = build_tables()
+            if cache_file is not None:
+                self._save_tables(cache_file, tables)
+        self._products: Dict[int, int] = tables[0]
+        self._flushes: List[int] = tables[1]
+
+    @staticmethod
+    def _load_tables(cache_file: str) -> Optional[Tuple[Dict[int, int], List[int]]]:
+        """
+        Load the tables from a cache file. Returns None if the file is
+        missing, unreadable, malformed or from another table version.
+        """
+        try:
+            with open(cache_file, "r", encoding="utf-8") as table_file:
+                data = json.load(table_file)
+            if data["version"] != _TABLE_VERSION:
+                return None
+            products = dict(data["products"])
+            flushes = data["flushes"]
+        except (OSError, ValueError, TypeError, KeyError, IndexError):
+            return None
+        if not (
+            isinstance(flushes, list)
+            and len(flushes) == 1 << _NUM_RANKS
+            and all(isinstance(score, int) for score in flushes)
+            and all(
+                isinstance(product, int) and isinstance(score, int)
+                for product, score in products.items()
+            )
+        ):
+            return None
+        return products, flushes
+
+    @staticmethod
+    def _save_tables(cache_file: str, tables: Tuple[Dict[int, int], List[int]]) -> None:
+        """
+        Write the tables to a cache file. The file is written under a
+        temporary name and then renamed, so processes sharing the cache
+        never read a partly written file. Failures are ignored; the tables
+        will just be rebuilt next time.
+        """
+        data = {
+            "version": _TABLE_VERSION,
+            "products": list(tables[0].items()),
+            "flushes": tables[1],
+        }
+        cache_dir = os.path.dirname(os.path.abspath(cache_file))
+        temp_name = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(temp_fd, "w", encoding="utf-8") as table_file:
+                json.dump(data, table_file, separators=(",", ":"))
+            os.replace(temp_name, cache_file)
+        except OSError:
+            if temp_name is not None and os.path.exists(temp_name):
+                os.remove(temp_name)
+
+    @property
+    def tables(self) -> Tuple[Dict[int, int], List[int]]:
+        """
+        Retrieve the (products, flushes) lookup tables (see `build_tables`).
+        Don't modify them.
+        """
+        return self._products, self._flushes
+
+    def evaluate_codes(self, face_codes: Sequence[int]) -> int:
+        """
+        Score a hand given as face codes (see `tmt_carddeck.codes`).
+
+        Args:
+            face_codes (Sequence[int]): The face codes of 5, 6 or 7 standard
+                cards.
+
+        Returns:
+            The hand's score (1-7462, higher is better).
+
+        Raises:
+            ValueError is raised if the hand has the wrong number of cards
+            or includes a blank card or joker.
+        """
+        if not 5 <= len(face_codes) <= 7:
+            raise ValueError("hand must have 5, 6 or 7 cards")
+
+        product = 1
+        suit_masks = [0, 0, 0, 0]
+        try:
+            for face_code in face_codes:
+                product *= _FACE_PRIMES[face_code]
+                suit_masks[_FACE_SUITS[face_code]] |= _FACE_RANK_BITS[face_code]
+            score = self._products[product]
+        except (IndexError, KeyError) as error:
+            raise ValueError("hand can only contain standard cards") from error
+
+        flushes = self._flushes
+        for suit_mask in suit_masks:
+            flush_score = flushes[suit_mask]
+            if flush_score > score:
+                score = flush_score
+        return score
+
+    def evaluate(self, cards: Sequence[Union[Card, int]]) -> int:
+        """
+        Score a hand of 5, 6 or 7 cards.
+
+        Args:
+            cards (Sequence[Union[Card, int]]): The cards, as `Card` objects
+                or face codes.
+
+        Returns:
+            The hand's score (1-7462, higher is better).
+        """
+        return self.evaluate_codes(
+            [the_card if isinstance(the_card, int) else the_card.face_code for the_card in cards]
+        )
+
+
+def hand_class(score: int) -> int:
+    """
+    Return the hand class (HIGH_CARD ... STRAIGHT_FLUSH) of a score.
+
+    Raises:
+        ValueError is raised if the score isn't between 1 and MAX_SCORE.
+    """
+
+    if not 1 <= score <= MAX_SCORE:
+        raise ValueError("invalid hand score")
+    hand_class_index = len(HAND_CLASS_STARTS) - 1
+    while score < HAND_CLASS_STARTS[hand_class_index]:
+        hand_class_index -= 1
+    return hand_class_index
+
+
+def hand_class_name(score: int) -> str:
+    """
+    Return the name of the hand class of a score (see `hand_class`).
+    """
+
+    return HAND_CLASSES[hand_class(score)]
+
+
+# The shared evaluators, by the absolute path of their cache file.
+_SHARED_EVALUATORS: Dict[str, HandEvaluator] = {}
+
+
+def default_cache_file() -> str:
+    """
+    Return the table cache file used by the shared evaluator:
+    ``tmt_carddeck/eval_tables_v<version>.json`` in $XDG_CACHE_HOME
+    (default ``~/.cache``).
+    """
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "tmt_carddeck", f"eval_tables_v{_TABLE_VERSION}.json")
+
+
+def get_evaluator(cache_file: Optional[str] = None) -> HandEvaluator:
+    """
+    Return the shared evaluator for a table cache file, creating it on
+    first use. There's one per cache file; if cache_file isn't provided,
+    it's `default_cache_file()`.
+    """
+
+    cache_path = os.path.abspath(default_cache_file() if cache_file is None else cache_file)
+    evaluator = _SHARED_EVALUATORS.get(cache_path)
+    if evaluator is None:
+        evaluator = HandEvaluator(cache_path)
+        _SHARED_EVALUATORS[cache_path] = evaluator
+    return evaluator
+
+
+def evaluate(cards: Sequence[Union[Card, int]]) -> int:
+    """
+    Score a hand of 5, 6 or 7 cards with the shared evaluator.
+    """
+
+    return get_evaluator().evaluate(cards)
@@ -0,0 +1,93 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+An undo journal for deck and card changes.
+
+Attach a `Journal` to any number of decks and cards (``the_deck.journal =
+journal``). Each change they make records how to undo it, so a search can
+make moves in place and then roll them back instead of copying the deck.
+"""
+
+try:
+    from typing import Callable, List, Tuple  # noqa
+except ImportError:
+    pass
+
+
+class Journal:
+    """
+    A stack of undo steps, shared by the decks and cards that record into
+    it.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty journal.
+        """
+        self._entries: List[Tuple[Callable, tuple]] = []
+
+    def record(self, undo: Callable, *args) -> None:
+        """
+        Record how to undo a change.
+
+        Args:
+            undo (Callable): Called with args to undo the change. It must not
+                record anything itself.
+            args: The arguments for undo.
+        """
+        self._entries.append((undo, args))
+
+    def mark(self) -> int:
+        """
+        Mark the current point in the journal, to roll back to later.
+
+        Returns:
+            The mark, for `rollback()`.
+        """
+        return len(self._entries)
+
+    def undo(self) -> None:
+        """
+        Undo the most recent change.
+
+        Raises:
+            IndexError is raised if there's nothing to undo.
+        """
+        if not self._entries:
+            raise IndexError("nothing to undo")
+        undo, args = self._entries.pop()
+        undo(*args)
+
+    def rollback(self, to_mark: int = 0) -> None:
+        """
+        Undo every change made since a mark, most recent first.
+
+        Args:
+            to_mark (int): The mark, from `mark()`. Defaults to undoing
+                everything.
+
+        Raises:
+            ValueError is raised if the mark is past the end of the journal.
+        """
+        if not 0 <= to_mark <= len(self._entries):
+            raise ValueError("invalid journal mark")
+        entries = self._entries
+        while len(entries) > to_mark:
+            undo, args = entries.pop()
+            undo(*args)
+
+    def clear(self) -> None:
+        """
+        Forget every recorded change, so it can no longer be undone.
+        """
+        self._entries = []
+
+    def __len__(self) -> int:
+        """
+        Get the number of changes that can be undone.
+        """
+        return len(self._entries)
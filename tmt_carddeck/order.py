@@ -0,0 +1,138 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+"""
+
+try:
+    from typing import Dict, Optional, Sequence, Tuple  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck.constants import DEFAULT_RANK_ORDER, DEFAULT_SUIT_ORDER
+
+
+class CardOrder:
+    """
+    An immutable rank/suit/value ordering shared by every card that uses it.
+
+    Don't create these directly; use `get_card_order()` so that cards with
+    the same ordering share one instance.
+    """
+
+    def __init__(
+        self,
+        rank_order: Sequence[str],
+        suit_order: Sequence[str],
+        value_order: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Build the ordering tables.
+
+        Args:
+            rank_order (Sequence[str]): The rank ordering, lowest first.
+            suit_order (Sequence[str]): The suit ordering, lowest first.
+            value_order (Optional[Sequence[str]]): An explicit value ordering.
+                If not provided, it's derived from the rank and suit orders.
+        """
+        self.rank_order: Tuple[str, ...] = tuple(rank_order)
+        self.suit_order: Tuple[str, ...] = tuple(suit_order)
+        if value_order is None:
+            self.value_order: Tuple[str, ...] = self._build_value_order()
+        else:
+            self.value_order = tuple(value_order)
+
+        self.rank_index: Dict[str, int] = {rank: idx for idx, rank in enumerate(self.rank_order)}
+        self.suit_index: Dict[str, int] = {suit: idx for idx, suit in enumerate(self.suit_order)}
+        self.value_index: Dict[str, int] = {}
+        for idx, card_name in enumerate(self.value_order):
+            if card_name not in self.value_index:
+                self.value_index[card_name] = idx
+        self.pair_value: Dict[tuple, int] = self._build_pair_values()
+
+    def _build_value_order(self) -> Tuple[str, ...]:
+        """
+        Build the value order from the rank order and suit order.
+        """
+
+        value_order = [""]
+        seen = {""}
+
+        for suit_iterator in self.suit_order:
+            if suit_iterator != "*":
+                for rank_iterator in self.rank_order:
+                    if rank_iterator == "*":
+                        card_name = "*"
+                    else:
+                        card_name = f"{rank_iterator}{suit_iterator}"
+                    if card_name not in seen:
+                        seen.add(card_name)
+                        value_order.append(card_name)
+
+        if "*" not in seen:
+            value_order.append("*")
+
+        return tuple(value_order)
+
+    def _build_pair_values(self) -> Dict[tuple, int]:
+        """
+        Map each (rank, suit) pair of a non-joker card to its value, so that
+        looking up a card's value doesn't need to format its name.
+        """
+
+        pair_value = {}
+        for suit in self.suit_order:
+            for rank in self.rank_order:
+                card_value = self.value_index.get(f"{rank}{suit}")
+                if card_value is not None:
+                    pair_value[(rank, suit)] = card_value
+        if "" in self.value_index:
+            pair_value[(None, None)] = self.value_index[""]
+        return pair_value
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the ordering.
+        """
+
+        return f"CardOrder({list(self.rank_order)!r}, {list(self.suit_order)!r})"
+
+
+_ORDER_REGISTRY: Dict[tuple, CardOrder] = {}
+
+
+def get_card_order(
+    rank_order: Optional[Sequence[str]] = None,
+    suit_order: Optional[Sequence[str]] = None,
+    value_order: Optional[Sequence[str]] = None,
+) -> CardOrder:
+    """
+    Retrieve the shared `CardOrder` for a rank/suit (and optionally value)
+    ordering, building and registering it on first use.
+
+    Args:
+        rank_order (Optional[Sequence[str]]): The rank ordering. Defaults to
+            DEFAULT_RANK_ORDER.
+        suit_order (Optional[Sequence[str]]): The suit ordering. Defaults to
+            DEFAULT_SUIT_ORDER.
+        value_order (Optional[Sequence[str]]): An explicit value ordering.
+
+    Returns:
+        The shared `CardOrder` instance.
+    """
+
+    key = (
+        tuple(DEFAULT_RANK_ORDER if rank_order is None else rank_order),
+        tuple(DEFAULT_SUIT_ORDER if suit_order is None else suit_order),
+        None if value_order is None else tuple(value_order),
+    )
+    card_order = _ORDER_REGISTRY.get(key)
+    if card_order is None:
+        card_order = CardOrder(key[0], key[1], key[2])
+        _ORDER_REGISTRY[key] = card_order
+    return card_order
+
+
+DEFAULT_CARD_ORDER: CardOrder = get_card_order()
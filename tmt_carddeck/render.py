@@ -0,0 +1,513 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Card face rendering from the bundled sprite sheets.
+
+A card is drawn as the front (or back) sheet of a `SpriteAtlas`, with the
+rank and suit symbols in the top left corner and again, upside down, in
+the bottom right. Composed faces are kept in a `FaceCache`, a
+least-recently-used cache with a byte budget, so redrawing a card costs a
+dictionary lookup.
+
+Cards turned by a quarter turn are composed from the sheets' turned tiles
+(see `SpriteSheet.rotated_tile_pixels`), so they're plain copies. Other
+angles are rotated from the cached upright face, once, and cached too.
+"""
+
+import math
+from collections import OrderedDict
+
+try:
+    from typing import Hashable, List, Optional, Tuple  # noqa
+except ImportError:
+    pass
+
+try:
+    import displayio
+except ImportError:
+    displayio = None  # pylint: disable=invalid-name
+
+from tmt_carddeck.constants import (
+    FACE_DOWN,
+    FACE_UP,
+    ROTATION_0,
+    ROTATION_90,
+    ROTATION_180,
+    ROTATION_270,
+)
+from tmt_carddeck.sprites import FRAME_SIZES, SUIT_COLOURS, CardTiles, SpriteAtlas, SpriteSheet
+
+DEFAULT_SPRITE_SIZE: int = 12
+DEFAULT_FACE_CACHE_BYTES: int = 32 * 1024
+
+# Composed faces use the frame sheet's colours at palette indexes 0-3. The
+# symbol sheet's (non-transparent) colour n goes at SYMBOL_PALETTE_OFFSET + n - 1.
+SYMBOL_PALETTE_OFFSET: int = 4
+
+FaceKey = Tuple[Optional[str], Optional[str], bool, int, int]
+
+
+class CardBitmap:
+    """
+    A composed card image: one palette index per pixel, row by row from the
+    top. Palette index 0 is transparent.
+    """
+
+    __slots__ = ("width", "height", "palette", "pixels")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        palette: List[int],
+        pixels: Optional[bytearray] = None,
+    ) -> None:
+        """
+        Create a bitmap.
+
+        Args:
+            width (int): The width, in pixels.
+            height (int): The height, in pixels.
+            palette (List[int]): The colours, as 0xRRGGBB.
+            pixels (Optional[bytearray]): The palette indexes. Defaults to
+                all transparent.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.palette: List[int] = palette
+        self.pixels: bytearray = bytearray(width * height) if pixels is None else pixels
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Retrieve the size of the pixel data, in bytes.
+        """
+        return len(self.pixels)
+
+    def pixel(self, x: int, y: int) -> int:
+        """
+        Retrieve the palette index of a pixel.
+        """
+        return self.pixels[y * self.width + x]
+
+    def blit(
+        self, source: bytes, source_width: int, x: int, y: int, palette_offset: int = 0
+    ) -> None:
+        """
+        Copy a sprite's pixels onto the bitmap, skipping transparent ones.
+
+        Args:
+            source (bytes): The sprite's palette indexes, row by row.
+            source_width (int): The sprite's width, in pixels.
+            x (int): Where the sprite's left edge goes.
+            y (int): Where the sprite's top edge goes.
+            palette_offset (int): Added to each of the sprite's palette
+                indexes.
+        """
+        pixels = self.pixels
+        width = self.width
+        for row in range(len(source) // source_width):
+            start = row * source_width
+            dest = (y + row) * width + x
+            for column in range(source_width):
+                value = source[start + column]
+                if value:
+                    pixels[dest + column] = value + palette_offset
+
+    def to_displayio(self):
+        """
+        Convert the bitmap to a ``displayio.Bitmap`` and ``displayio.Palette``,
+        with palette index 0 transparent.
+
+        Returns:
+            A (bitmap, palette) tuple, for a ``displayio.TileGrid``.
+        """
+        if displayio is None:
+            raise RuntimeError("displayio is not available")
+        bitmap = displayio.Bitmap(self.width, self.height, max(2, len(self.palette)))
+        for index, value in enumerate(self.pixels):
+            bitmap[index] = value
+        palette = displayio.Palette(len(self.palette))
+        for index, colour in enumerate(self.palette):
+            palette[index] = colour
+        palette.make_transparent(0)
+        return bitmap, palette
+
+
+def _rotate_quarter(bitmap: CardBitmap, degrees: int) -> CardBitmap:
+    """
+    Rotate a bitmap clockwise by 90 or 270 degrees.
+    """
+    width = bitmap.width
+    height = bitmap.height
+    source = bitmap.pixels
+    pixels = bytearray(width * height)
+    index = 0
+    for new_y in range(width):
+        for new_x in range(height):
+            if degrees == 90:
+                pixels[index] = source[(height - 1 - new_x) * width + new_y]
+            else:
+                pixels[index] = source[new_x * width + width - 1 - new_y]
+            index += 1
+    return CardBitmap(height, width, bitmap.palette, pixels)
+
+
+# pylint: disable=too-many-locals
+def _rotate_any(bitmap: CardBitmap, degrees: int) -> CardBitmap:
+    """
+    Rotate a bitmap clockwise by any angle, using the nearest source pixel,
+    on a canvas big enough for the rotated image.
+    """
+    width = bitmap.width
+    height = bitmap.height
+    radians = math.radians(degrees)
+    cos_a = math.cos(radians)
+    sin_a = math.sin(radians)
+    new_width = int(math.ceil(abs(width * cos_a) + abs(height * sin_a)))
+    new_height = int(math.ceil(abs(width * sin_a) + abs(height * cos_a)))
+    source = bitmap.pixels
+    pixels = bytearray(new_width * new_height)
+    centre_x = (width - 1) / 2
+    centre_y = (height - 1) / 2
+    index = 0
+    for new_y in range(new_height):
+        offset_y = new_y - (new_height - 1) / 2
+        for new_x in range(new_width):
+            offset_x = new_x - (new_width - 1) / 2
+            x = int(round(centre_x + offset_x * cos_a + offset_y * sin_a))
+            y = int(round(centre_y - offset_x * sin_a + offset_y * cos_a))
+            if 0 <= x < width and 0 <= y < height:
+                pixels[index] = source[y * width + x]
+            index += 1
+    return CardBitmap(new_width, new_height, bitmap.palette, pixels)
+
+
+# pylint: enable=too-many-locals
+
+
+def rotate_bitmap(bitmap: CardBitmap, degrees: int) -> CardBitmap:
+    """
+    Rotate a bitmap clockwise. Quarter turns are exact; other angles use
+    the nearest source pixel, on a canvas big enough for the rotated image.
+    """
+    degrees %= 360
+    if degrees == 0:
+        return CardBitmap(bitmap.width, bitmap.height, bitmap.palette, bytearray(bitmap.pixels))
+    if degrees == 180:
+        return CardBitmap(
+            bitmap.width, bitmap.height, bitmap.palette, bytearray(bitmap.pixels[::-1])
+        )
+    if degrees in (90, 270):
+        return _rotate_quarter(bitmap, degrees)
+    return _rotate_any(bitmap, degrees)
+
+
+class FaceCache:
+    """
+    A least-recently-used cache of composed card faces, bounded by the
+    total size of their pixel data.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_FACE_CACHE_BYTES) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_bytes (int): The most pixel data to keep, in bytes. The
+                least recently used faces are evicted to stay within it.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._nbytes: int = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Retrieve the size of the cached pixel data, in bytes.
+        """
+        return self._nbytes
+
+    def get(self, key: Hashable) -> Optional[CardBitmap]:
+        """
+        Look up a face, counting a hit or a miss.
+
+        Returns:
+            The cached bitmap, or None if it isn't cached.
+        """
+        bitmap = self._entries.pop(key, None)
+        if bitmap is None:
+            self.misses += 1
+            return None
+        self._entries[key] = bitmap
+        self.hits += 1
+        return bitmap
+
+    def put(self, key: Hashable, bitmap: CardBitmap) -> None:
+        """
+        Cache a face, evicting the least recently used faces if it doesn't
+        fit. A face bigger than the whole budget isn't cached.
+        """
+        entries = self._entries
+        old = entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= old.nbytes
+        if bitmap.nbytes > self.max_bytes:
+            return
+        while entries and self._nbytes + bitmap.nbytes > self.max_bytes:
+            _, evicted = entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+            self.evictions += 1
+        entries[key] = bitmap
+        self._nbytes += bitmap.nbytes
+
+    def clear(self) -> None:
+        """
+        Empty the cache. The counters are kept.
+        """
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether a face is cached, without counting a hit or a miss.
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached faces.
+        """
+        return len(self._entries)
+
+
+def _frame_size(sprite_size: int) -> int:
+    """
+    Pick the smallest frame sheet that fits two symbols side by side.
+    """
+    for frame_size in FRAME_SIZES:
+        if frame_size >= sprite_size:
+            return frame_size
+    return FRAME_SIZES[-1]
+
+
+# pylint: disable=too-many-arguments
+def _blit_turned(
+    bitmap: CardBitmap,
+    sheet: SpriteSheet,
+    tile_index: int,
+    x: int,
+    y: int,
+    rotation: int,
+    tile_rotation: Optional[int] = None,
+    palette_offset: int = 0,
+) -> None:
+    """
+    Copy a sheet's tile onto a bitmap turned by a quarter turn.
+
+    Args:
+        bitmap (CardBitmap): The turned bitmap.
+        sheet (SpriteSheet): The sheet holding the tile.
+        tile_index (int): The tile.
+        x (int): Where the tile's left edge goes on the upright bitmap.
+        y (int): Where the tile's top edge goes on the upright bitmap.
+        rotation (int): How far the bitmap is turned.
+        tile_rotation (Optional[int]): How far the tile is turned. Defaults
+            to the bitmap's rotation.
+        palette_offset (int): Added to each of the tile's palette indexes.
+    """
+    size = sheet.tile_size
+    if rotation == ROTATION_90:
+        x, y = bitmap.width - y - size, x
+    elif rotation == ROTATION_180:
+        x, y = bitmap.width - x - size, bitmap.height - y - size
+    elif rotation == ROTATION_270:
+        x, y = y, bitmap.height - x - size
+    if tile_rotation is None:
+        tile_rotation = rotation
+    bitmap.blit(sheet.rotated_tile_pixels(tile_index, tile_rotation), size, x, y, palette_offset)
+
+
+# pylint: enable=too-many-arguments
+
+
+def _turned_frame(frame: SpriteSheet, rotation: int) -> CardBitmap:
+    """
+    Copy a whole frame sheet into a new bitmap, turned by a quarter turn.
+    """
+    width = frame.header.width
+    height = frame.header.height
+    if rotation in (ROTATION_90, ROTATION_270):
+        width, height = height, width
+    bitmap = CardBitmap(width, height, list(frame.palette))
+    tile_size = frame.tile_size
+    for tile_index in range(frame.num_tiles):
+        _blit_turned(
+            bitmap,
+            frame,
+            tile_index,
+            (tile_index % frame.columns) * tile_size,
+            (tile_index // frame.columns) * tile_size,
+            rotation,
+        )
+    return bitmap
+
+
+def _draw_symbols(bitmap: CardBitmap, tiles: CardTiles, frame: SpriteSheet, rotation: int) -> None:
+    """
+    Draw a card's rank and suit in the top left corner, and upside down in
+    the bottom right, on a face turned by a quarter turn.
+    """
+    symbols = tiles.sheet
+    sprite_size = symbols.tile_size
+    bitmap.palette = bitmap.palette + symbols.palette[1:]
+    inset = frame.tile_size // 2
+    right = frame.header.width - inset - sprite_size
+    bottom = frame.header.height - inset - sprite_size
+    upside_down = (rotation + ROTATION_180) % 360
+    for tile_index, x, y, turn in (
+        (tiles.rank_tile, inset, inset, rotation),
+        (tiles.suit_tile, inset, inset + sprite_size, rotation),
+        (tiles.rank_tile, right, bottom, upside_down),
+        (tiles.suit_tile, right, bottom - sprite_size, upside_down),
+    ):
+        _blit_turned(bitmap, symbols, tile_index, x, y, rotation, turn, SYMBOL_PALETTE_OFFSET - 1)
+
+
+class CardRenderer:
+    """
+    Draws cards from a sprite atlas, caching the composed faces.
+    """
+
+    def __init__(
+        self,
+        atlas: Optional[SpriteAtlas] = None,
+        cache: Optional[FaceCache] = None,
+        sprite_size: int = DEFAULT_SPRITE_SIZE,
+    ) -> None:
+        """
+        Create a renderer.
+
+        Args:
+            atlas (Optional[SpriteAtlas]): The sprite sheets. Defaults to the
+                bundled ones.
+            cache (Optional[FaceCache]): The face cache. Defaults to a new one
+                with the default budget.
+            sprite_size (int): The default symbol size, in pixels.
+        """
+        self.atlas: SpriteAtlas = SpriteAtlas() if atlas is None else atlas
+        self.cache: FaceCache = FaceCache() if cache is None else cache
+        self.sprite_size: int = sprite_size
+
+    @staticmethod
+    def face_key(rank, suit, orientation: bool, rotation: int, sprite_size: int) -> FaceKey:
+        """
+        Build the cache key of a face. Every face-down card looks the same,
+        so they share a key.
+        """
+        if orientation == FACE_DOWN:
+            return (None, None, FACE_DOWN, rotation % 360, sprite_size)
+        return (
+            None if rank is None else str(rank),
+            None if suit is None else str(suit),
+            FACE_UP,
+            rotation % 360,
+            sprite_size,
+        )
+
+    def render(self, the_card, sprite_size: Optional[int] = None) -> CardBitmap:
+        """
+        Draw a card as it lies, using its orientation and rotation.
+
+        Args:
+            the_card (Card): The card.
+            sprite_size (Optional[int]): The symbol size, in pixels.
+                Defaults to the renderer's.
+
+        Returns:
+            The card's bitmap. It's shared with the cache, so don't change
+            it.
+        """
+        return self.render_face(
+            the_card.rank,
+            the_card.suit,
+            the_card.orientation,
+            the_card.rotation,
+            sprite_size,
+        )
+
+    def render_face(
+        self,
+        rank,
+        suit,
+        orientation: bool = FACE_UP,
+        rotation: int = ROTATION_0,
+        sprite_size: Optional[int] = None,
+    ) -> CardBitmap:
+        """
+        Draw a card face, from the cache if it's been drawn before.
+
+        Cards without rank and suit symbols (the blank card and jokers)
+        are drawn as a plain front. Quarter turns are composed from turned
+        tiles; other angles are rotated from the (cached) upright face.
+
+        Args:
+            rank: The card's rank.
+            suit: The card's suit.
+            orientation (bool): FACE_UP or FACE_DOWN.
+            rotation (int): The clockwise rotation, in degrees.
+            sprite_size (Optional[int]): The symbol size, in pixels.
+                Defaults to the renderer's.
+
+        Returns:
+            The face's bitmap. It's shared with the cache, so don't change
+            it.
+        """
+        if sprite_size is None:
+            sprite_size = self.sprite_size
+        key = self.face_key(rank, suit, orientation, rotation, sprite_size)
+        bitmap = self.cache.get(key)
+        if bitmap is None:
+            if key[3] % ROTATION_90:
+                upright = self.render_face(rank, suit, orientation, ROTATION_0, sprite_size)
+                bitmap = rotate_bitmap(upright, key[3])
+            else:
+                bitmap = self._compose(key[0], key[1], orientation, key[3], sprite_size)
+            self.cache.put(key, bitmap)
+        return bitmap
+
+    def _compose(
+        self,
+        rank: Optional[str],
+        suit: Optional[str],
+        orientation: bool,
+        rotation: int,
+        sprite_size: int,
+    ) -> CardBitmap:
+        """
+        Compose a face turned by a quarter turn, from the sheets' turned
+        tiles, so no pixel is transformed here.
+        """
+        frame_size = _frame_size(sprite_size)
+        if orientation == FACE_DOWN:
+            frame = self.atlas.backs(frame_size)
+        else:
+            frame = self.atlas.fronts(frame_size)
+        bitmap = _turned_frame(frame, rotation)
+        if orientation == FACE_DOWN or suit not in SUIT_COLOURS:
+            return bitmap
+        try:
+            tiles = self.atlas.card_tiles(rank, suit, sprite_size)
+        except ValueError:
+            return bitmap
+        _draw_symbols(bitmap, tiles, frame, rotation)
+        return bitmap
@@ -0,0 +1,371 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Asyncio dealer service hosting many tables, one `PackedDeck` per table.
+
+Clients connect over TCP or a Unix socket and send one JSON request per
+line; the service answers each line with one JSON line. A request is an
+object with an "op" and a "table" (any string; tables are created on first
+use, up to the service's max_tables), plus:
+
+* "shuffle": optional "seed".
+* "pick": optional "count" (default 1) and "reset_if_empty" (default true).
+* "deal": "hands", "cards_per_hand", optional "pattern" ("round_robin" or
+  "block") and "reset_if_empty".
+* "reset": no arguments. "close": drops the table.
+
+Cards are returned by name (see `Card.from_string`). A line holding a JSON
+array of requests is a batch, answered with an array of responses in one
+round trip. Every response has "ok" (and "error" if it's false), and
+echoes the request's "id" if it has one.
+
+Run it with ``python -m tmt_carddeck.server``. This module needs asyncio,
+so it's for CPython only.
+"""
+
+import argparse
+import asyncio
+import json
+
+try:
+    from typing import Dict, List, Optional, Union  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck import codes
+from tmt_carddeck.card import Card
+from tmt_carddeck.deck import DEAL_ROUND_ROBIN, DeckEmpty, PackedDeck, _make_rng, standard_deck
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 7654
+LINE_LIMIT: int = 1 << 20
+MAX_CARDS_PER_REQUEST: int = 4096
+MAX_TABLES: int = 65536
+
+# The name of each face code, to answer requests without creating cards.
+_FACE_NAMES: List[str] = [
+    str(Card.from_code(face_code)) for face_code in range(codes.NUM_FACE_CODES)
+]
+
+
+def _int_argument(request: dict, name: str, default: Optional[int] = None) -> int:
+    """
+    Retrieve a non-negative integer argument from a request.
+    """
+    value = request.get(name, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"{name} must be a non-negative integer")
+    return value
+
+
+class DealerService:
+    """
+    The tables and the request handling, independent of the network.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        include_blank: bool = False,
+        include_joker: bool = False,
+        max_tables: int = MAX_TABLES,
+    ) -> None:
+        """
+        Create a service with no tables.
+
+        Args:
+            seed (Optional[int]): Seed for the shuffles that don't have
+                their own.
+            include_blank (bool): True to put the blank card in new tables'
+                decks.
+            include_joker (bool): True to put the joker in new tables' decks.
+            max_tables (int): The most tables that can be open at once.
+        """
+        self._tables: Dict[str, PackedDeck] = {}
+        self._max_tables: int = max_tables
+        self._rng = _make_rng(seed)
+        self._deck_codes = bytes(
+            standard_deck(
+                include_blank=include_blank, include_joker=include_joker, packed=True
+            ).face_codes
+        )
+        self._commands = {
+            "shuffle": self._shuffle,
+            "pick": self._pick,
+            "deal": self._deal,
+            "reset": self._reset,
+            "close": self._close,
+        }
+
+    @property
+    def num_tables(self) -> int:
+        """
+        Retrieve the number of open tables.
+        """
+        return len(self._tables)
+
+    def table(self, table_id: str) -> PackedDeck:
+        """
+        Retrieve a table's deck, creating the table if it's new.
+
+        Raises:
+            `ValueError` is raised if the table is new and the service
+            already has max_tables tables open.
+        """
+        the_deck = self._tables.get(table_id)
+        if the_deck is None:
+            if len(self._tables) >= self._max_tables:
+                raise ValueError("too many tables")
+            the_deck = PackedDeck(self._deck_codes)
+            self._tables[table_id] = the_deck
+        return the_deck
+
+    def handle(self, request: Union[dict, list]) -> Union[dict, list]:
+        """
+        Handle a request, or a batch (list) of requests.
+
+        Returns:
+            The response, or a list of responses for a batch.
+        """
+        if isinstance(request, list):
+            return [self._handle_one(one_request) for one_request in request]
+        return self._handle_one(request)
+
+    @staticmethod
+    def _card_count(num_cards: int) -> int:
+        """
+        Check the number of cards a request asks for.
+        """
+        if num_cards > MAX_CARDS_PER_REQUEST:
+            raise ValueError("too many cards requested")
+        return num_cards
+
+    def _handle_one(self, request) -> dict:
+        """
+        Handle a single request.
+        """
+        response: dict = {}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("request must be an object")
+            if "id" in request:
+                response["id"] = request["id"]
+            op_name = request.get("op")
+            command = self._commands.get(op_name) if isinstance(op_name, str) else None
+            if command is None:
+                raise ValueError("unknown op")
+            table_id = request.get("table")
+            if not isinstance(table_id, str):
+                raise ValueError("table must be a string")
+            response.update(command(table_id, request))
+            response["ok"] = True
+        except (DeckEmpty, TypeError, ValueError) as error:
+            response["ok"] = False
+            response["error"] = str(error)
+        return response
+
+    def _shuffle(self, table_id: str, request: dict) -> dict:
+        """
+        Shuffle a table's deck.
+        """
+        the_deck = self.table(table_id)
+        seed = request.get("seed")
+        if seed is None:
+            the_deck.shuffle(rng=self._rng)
+        else:
+            the_deck.shuffle(seed=_int_argument(request, "seed"))
+        return {"remaining": len(the_deck)}
+
+    def _pick(self, table_id: str, request: dict) -> dict:
+        """
+        Pick cards from the top of a table's deck.
+        """
+        the_deck = self.table(table_id)
+        picked = the_deck.deal(
+            1,
+            self._card_count(_int_argument(request, "count", 1)),
+            compact=True,
+            reset_if_empty=bool(request.get("reset_if_empty", True)),
+        )[0]
+        return {
+            "cards": [_FACE_NAMES[face_code] for face_code in picked],
+            "remaining": len(the_deck),
+        }
+
+    def _deal(self, table_id: str, request: dict) -> dict:
+        """
+        Deal hands from a table's deck.
+        """
+        the_deck = self.table(table_id)
+        num_hands = _int_argument(request, "hands")
+        cards_per_hand = _int_argument(request, "cards_per_hand")
+        self._card_count(num_hands * cards_per_hand)
+        hands = the_deck.deal(
+            num_hands,
+            cards_per_hand,
+            pattern=request.get("pattern", DEAL_ROUND_ROBIN),
+            compact=True,
+            reset_if_empty=bool(request.get("reset_if_empty", True)),
+        )
+        return {
+            "hands": [[_FACE_NAMES[face_code] for face_code in hand] for hand in hands],
+            "remaining": len(the_deck),
+        }
+
+    def _reset(self, table_id: str, request: dict) -> dict:  # pylint: disable=unused-argument
+        """
+        Reset a table's deck.
+        """
+        the_deck = self.table(table_id)
+        the_deck.reset_deck()
+        return {"remaining": len(the_deck)}
+
+    def _close(self, table_id: str, request: dict) -> dict:  # pylint: disable=unused-argument
+        """
+        Drop a table.
+        """
+        self._tables.pop(table_id, None)
+        return {}
+
+
+async def _serve_client(
+    service: DealerService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """
+    Answer one client's requests until it disconnects.
+    """
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                break  # The line was longer than LINE_LIMIT.
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response: Union[dict, list] = {"ok": False, "error": "invalid JSON"}
+            else:
+                response = service.handle(request)
+            writer.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_server(
+    service: Optional[DealerService] = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: Optional[str] = None,
+):
+    """
+    Start serving a dealer service.
+
+    Args:
+        service (Optional[DealerService]): The service. Defaults to a new
+            one.
+        host (str): The address to listen on.
+        port (int): The TCP port to listen on (0 picks a free port).
+        path (Optional[str]): If provided, listen on this Unix socket
+            instead of TCP.
+
+    Returns:
+        The running `asyncio.Server`.
+    """
+    if service is None:
+        service = DealerService()
+
+    def client_connected(reader, writer):
+        return _serve_client(service, reader, writer)
+
+    if path is not None:
+        return await asyncio.start_unix_server(client_connected, path=path, limit=LINE_LIMIT)
+    return await asyncio.start_server(client_connected, host=host, port=port, limit=LINE_LIMIT)
+
+
+class DealerClient:
+    """
+    A minimal client for the dealer service.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Wrap an open connection. Use `connect()` to open one.
+        """
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(
+        cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: Optional[str] = None
+    ) -> "DealerClient":
+        """
+        Connect to a dealer service over TCP, or over a Unix socket if a
+        path is provided.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def request(self, request: Union[dict, list]) -> Union[dict, list]:
+        """
+        Send a request (or a batch, as a list) and wait for the response.
+        """
+        self._writer.write(json.dumps(request, separators=(",", ":")).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("dealer service closed the connection")
+        return json.loads(line)
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _serve_forever(host: str, port: int, path: Optional[str], seed: Optional[int]) -> None:
+    """
+    Run a dealer service until cancelled.
+    """
+    server = await start_server(DealerService(seed=seed), host=host, port=port, path=path)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Run the card dealer service.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--seed", type=int, help="seed for the shuffles")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.unix, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+A multi-deck dealing shoe with a cut card.
+
+The shoe stores one byte per card, like `PackedDeck`, and `Card` objects
+are only created as cards are dealt. Shuffling is incremental: reshuffling
+just marks the shoe as unshuffled, and each card dealt afterwards is drawn
+at random from the cards that are left (one step of a Fisher-Yates
+shuffle). Anything that needs to see the order of the undealt cards
+finishes the shuffle first.
+"""
+
+try:
+    from typing import Optional  # noqa
+except ImportError:
+    pass
+
+from tmt_carddeck import codes
+from tmt_carddeck.deck import DeckEmpty, DeckSnapshot, PackedDeck, _make_rng, standard_deck
+
+
+class Shoe(PackedDeck):
+    """
+    Several standard decks shuffled together, with a cut card.
+
+    Once the cut card is reached, `cut_card_reached` becomes true and
+    `reshuffle_if_needed()` (typically called between rounds) reshuffles
+    the whole shoe. Running out of cards also reshuffles it, unless
+    reset_if_empty is False.
+    """
+
+    _LOCKED_METHODS: tuple = PackedDeck._LOCKED_METHODS + ("reshuffle", "reshuffle_if_needed")
+
+    def __init__(
+        self,
+        num_decks: int = 6,
+        penetration: float = 0.75,
+        cut_position: Optional[int] = None,
+        include_blank: bool = False,
+        include_joker: bool = False,
+        rng=None,
+        seed: Optional[int] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        """
+        Create a new, shuffled shoe.
+
+        Args:
+            num_decks (int): The number of decks in the shoe.
+            penetration (float): The fraction of the shoe that's dealt before
+                the cut card is reached (0-1).
+            cut_position (Optional[int]): If provided, the number of cards
+                dealt before the cut card is reached. Overrides penetration.
+            include_blank (bool): True to include each deck's blank card.
+            include_joker (bool): True to include each deck's joker.
+            rng: The random number generator. Any object with a randrange()
+                method will do. If not provided, the random module is used.
+            seed (Optional[int]): If provided (and rng isn't), shuffle with a
+                new generator seeded with this value.
+            thread_safe (bool): If true, the shoe can be shared between
+                threads (see `Deck`).
+
+        Raises:
+            `ValueError` is raised if num_decks is less than 1 or the
+            penetration isn't between 0 and 1.
+        """
+        if num_decks < 1:
+            raise ValueError("shoe must have at least one deck")
+        one_deck = standard_deck(
+            include_blank=include_blank, include_joker=include_joker, packed=True
+        ).face_codes
+        super().__init__(bytes(one_deck) * num_decks, thread_safe=thread_safe)
+        self._num_decks: int = num_decks
+        self._rng = _make_rng(seed) if rng is None else rng
+        self._penetration: float = 0.0
+        self._cut_position: int = 0
+        self._shuffle_pending: bool = False
+        self.penetration = penetration
+        if cut_position is not None:
+            self.cut_position = cut_position
+        self.reshuffle()
+
+    @property
+    def num_decks(self) -> int:
+        """
+        Retrieve the number of decks in the shoe.
+        """
+        return self._num_decks
+
+    @property
+    def penetration(self) -> float:
+        """
+        Retrieve the fraction of the shoe dealt before the cut card.
+        """
+        return self._penetration
+
+    @penetration.setter
+    def penetration(self, penetration: float) -> None:
+        """
+        Set the fraction of the shoe dealt before the cut card. This also
+        moves the cut card, to at least one card into the shoe.
+        """
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be between 0 and 1")
+        self._penetration = penetration
+        # Always deal at least one card before the cut card.
+        self._cut_position = max(1, int(len(self._initial_cards) * penetration))
+
+    @property
+    def cut_position(self) -> int:
+        """
+        Retrieve the number of cards dealt before the cut card is reached.
+        """
+        return self._cut_position
+
+    @cut_position.setter
+    def cut_position(self, cut_position: int) -> None:
+        """
+        Move the cut card.
+        """
+        if not 0 < cut_position <= len(self._initial_cards):
+            raise ValueError("cut card must be inside the shoe")
+        self._cut_position = cut_position
+        self._penetration = cut_position / len(self._initial_cards)
+
+    @property
+    def cards_dealt(self) -> int:
+        """
+        Retrieve the number of cards taken from the shoe since it was last
+        shuffled.
+        """
+        return len(self._initial_cards) - len(self)
+
+    @property
+    def cut_card_reached(self) -> bool:
+        """
+        Returns True if the cut card has been reached.
+        """
+        return self.cards_dealt >= self._cut_position
+
+    @classmethod
+    def _from_storage(cls, storage) -> "Shoe":
+        """
+        Create a shoe holding the deserialized cards, in order, as its
+        undealt cards. The number of decks, and whether they include the
+        blank card and joker, are worked out from the cards; the rest of
+        the shoe counts as dealt.
+        """
+        counts = [0] * codes.NUM_FACE_CODES
+        for face_code in storage:
+            counts[face_code] += 1
+        the_shoe = cls(
+            num_decks=max(1, *counts),
+            include_blank=bool(counts[codes.BLANK_CODE]),
+            include_joker=bool(counts[codes.JOKER_CODE]),
+        )
+        the_shoe._cards = bytearray(storage)
+        the_shoe._shared = False
+        the_shoe._top = 0
+        the_shoe._shuffle_pending = False
+        return the_shoe
+
+    def reshuffle(self) -> None:
+        """
+        Put every card back in the shoe and reshuffle it. The cards are
+        copied back into the existing storage, and the shuffle itself is
+        done as the cards are dealt.
+        """
+        self._record_restore_point()
+        if self._shared:
+            self._cards = self._initial_cards[:]
+            self._shared = False
+        else:
+            self._cards[:] = self._initial_cards
+        self._top = 0
+        self._shuffle_pending = True
+
+    def reshuffle_if_needed(self) -> bool:
+        """
+        Reshuffle the shoe if the cut card has been reached.
+
+        Returns:
+            True if the shoe was reshuffled.
+        """
+        if not self.cut_card_reached:
+            return False
+        self.reshuffle()
+        return True
+
+    def reset_deck(self) -> None:
+        """
+        Put every card back in the shoe and reshuffle it. A shoe is always
+        shuffled, so this is the same as `reshuffle()`.
+        """
+        self.reshuffle()
+
+    def shuffle(self, rng=None, seed: Optional[int] = None) -> None:
+        """
+        Shuffle the cards left in the shoe. The cards that have been dealt
+        stay out of it.
+
+        Args:
+            rng: If provided, the random number generator to use from now
+                on.
+            seed (Optional[int]): If provided (and rng isn't), use a new
+                generator seeded with this value from now on.
+        """
+        self._record_restore_point()
+        if rng is not None:
+            self._rng = rng
+        elif seed is not None:
+            self._rng = _make_rng(seed)
+        self._shuffle_pending = True
+
+    def _shuffle_range(self, start: int, stop: int) -> None:
+        """
+        Run the steps of the pending shuffle that fill positions start to
+        stop (exclusive) of the storage.
+        """
+        self._own()
+        the_cards = self._cards
+        num_cards = len(the_cards)
+        stop = min(stop, num_cards - 1)
+        randrange = self._rng.randrange
+        for i in range(start, stop):
+            j = i + randrange(num_cards - i)
+            the_cards[i], the_cards[j] = the_cards[j], the_cards[i]
+        if stop >= num_cards - 1:
+            self._shuffle_pending = False
+
+    def _settle(self) -> None:
+        """
+        Finish the pending shuffle, if there is one.
+        """
+        if self._shuffle_pending:
+            self._shuffle_range(self._top, len(self._cards))
+
+    def _shuffle_ahead(self, stop: int) -> None:
+        """
+        Run the pending shuffle's steps up to position stop. If the shoe has
+        a journal, the whole shuffle is finished instead, so the swaps are
+        done before anything is recorded and a rollback deals the same
+        cards again.
+        """
+        if self._shuffle_pending:
+            if self._journal is None:
+                self._shuffle_range(self._top, stop)
+            else:
+                self._settle()
+
+    def snapshot(self) -> DeckSnapshot:
+        """
+        Capture the shoe's current contents. The pending shuffle is
+        finished first, so every restore deals the same cards.
+        """
+        self._settle()
+        return super().snapshot()
+
+    def _restore(self, snapshot: DeckSnapshot) -> None:
+        """
+        Return the shoe to a snapshot's contents (see `Deck.restore`). A
+        snapshot's shuffle is always finished.
+        """
+        super()._restore(snapshot)
+        self._shuffle_pending = False
+
+    def _compact(self) -> None:
+        """
+        Finish the pending shuffle, then drop the dealt cards.
+        """
+        self._settle()
+        super()._compact()
+
+    def _locate(self, key):
+        """
+        Finish the pending shuffle, then translate an index or slice.
+        """
+        self._settle()
+        return super()._locate(key)
+
+    def pick(self, **kwargs):
+        """
+        Deal a card from the shoe. Takes the same arguments as `Deck.pick`.
+        """
+        if not kwargs.get("pick_location", 0):
+            if self._top >= len(self._cards) and kwargs.get("reset_if_empty", True):
+                self.reset_deck()
+            self._shuffle_ahead(self._top + 1)
+        return super().pick(**kwargs)
+
+    def _pick_storage(self, num_cards: int, reset_if_empty: bool):
+        """
+        Deal several face codes from the shoe, reshuffling it whenever it
+        runs out.
+        """
+        if num_cards < 0:
+            raise ValueError("can't pick a negative number of cards")
+        if self._top + num_cards > len(self._cards) and (
+            not reset_if_empty or not self._initial_cards
+        ):
+            raise DeckEmpty("not enough cards in deck")
+
+        picked = bytearray()
+        while len(picked) < num_cards:
+            if self._top >= len(self._cards):
+                self.reset_deck()
+            end = min(self._top + num_cards - len(picked), len(self._cards))
+            self._shuffle_ahead(end)
+            segment = self._cards[self._top : end]
+            picked += segment
+            self._top = end
+            self._record_picks(segment)
+        return picked
@@ -0,0 +1,461 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Sprite sheet loading for the BMP assets bundled in the package's
+``assets`` directory.
+
+Each sheet's header is parsed once, and each tile is decoded once, on
+first use. On CPython, the tiles are decoded from a memory mapping (mmap)
+of the sheet; without mmap (CircuitPython), each tile row is read with a
+seek and a read. With displayio, `SpriteSheet.tile_grid()` can also show
+tiles straight from a shared ``displayio.OnDiskBitmap``.
+
+The symbol sheets (``card_symbols_NxN.bmp``) are laid out as described in
+``assets/card_symbols_layout.txt``: ten N x N tiles per row, with the
+black symbols in rows 0-1 and the red symbols in rows 2-3. Rows 0 and 2
+hold the ranks A-10; rows 1 and 3 hold J, Q, K and the suit symbols.
+"""
+
+import struct
+from collections import namedtuple
+
+try:
+    from typing import Dict, List, Optional, Tuple  # noqa
+except ImportError:
+    pass
+
+try:
+    import mmap
+except ImportError:
+    mmap = None  # pylint: disable=invalid-name
+
+try:
+    import displayio
+except ImportError:
+    displayio = None  # pylint: disable=invalid-name
+
+from tmt_carddeck.constants import ROTATION_0, ROTATION_90, ROTATION_180, ROTATION_270
+
+COLOUR_BLACK: int = 0
+COLOUR_RED: int = 1
+
+SUIT_COLOURS: Dict[str, int] = {
+    "C": COLOUR_BLACK,
+    "D": COLOUR_RED,
+    "H": COLOUR_RED,
+    "S": COLOUR_BLACK,
+}
+
+SYMBOL_COLUMNS: int = 10
+SYMBOL_SIZES: Tuple[int, ...] = (12, 16, 24)
+FRAME_SIZES: Tuple[int, ...] = (12, 24)
+
+# (row, column) of each symbol in the black half of a symbol sheet.
+_SYMBOL_CELLS: Dict[str, Tuple[int, int]] = {
+    "A": (0, 0),
+    "2": (0, 1),
+    "3": (0, 2),
+    "4": (0, 3),
+    "5": (0, 4),
+    "6": (0, 5),
+    "7": (0, 6),
+    "8": (0, 7),
+    "9": (0, 8),
+    "10": (0, 9),
+    "J": (1, 0),
+    "Q": (1, 1),
+    "K": (1, 2),
+    "D": (1, 3),
+    "C": (1, 4),
+    "H": (1, 5),
+    "S": (1, 6),
+}
+
+# Tile index of every (symbol, colour) pair.
+SYMBOL_TILES: Dict[Tuple[str, int], int] = {
+    (symbol, colour): (row + 2 * colour) * SYMBOL_COLUMNS + column
+    for symbol, (row, column) in _SYMBOL_CELLS.items()
+    for colour in (COLOUR_BLACK, COLOUR_RED)
+}
+
+BmpHeader = namedtuple(
+    "BmpHeader", "width height bits_per_pixel data_offset row_stride bottom_up palette"
+)
+CardTiles = namedtuple("CardTiles", "sheet rank_tile suit_tile")
+
+_FILE_HEADER: str = "<2sIHHI"
+_INFO_HEADER: str = "<IiiHHI"
+_FILE_HEADER_SIZE: int = struct.calcsize(_FILE_HEADER)
+
+
+def _default_asset_dir() -> str:
+    """
+    Return the assets directory inside the package, wherever the package
+    is installed.
+    """
+
+    module_path = __file__.replace("\\", "/")
+    return module_path.rsplit("/", 1)[0] + "/assets" if "/" in module_path else "assets"
+
+
+def rotate_tile(pixels: bytes, tile_size: int, rotation: int) -> bytes:
+    """
+    Rotate a square tile clockwise by a quarter turn.
+
+    Args:
+        pixels (bytes): The tile's palette indexes, row by row.
+        tile_size (int): The tile's width and height, in pixels.
+        rotation (int): ROTATION_0, ROTATION_90, ROTATION_180 or
+            ROTATION_270.
+
+    Raises:
+        ValueError is raised if the rotation isn't a quarter turn.
+    """
+
+    if rotation == ROTATION_0:
+        return pixels
+    if rotation == ROTATION_180:
+        return pixels[::-1]
+    last = tile_size - 1
+    if rotation == ROTATION_90:
+        return bytes(
+            pixels[(last - x) * tile_size + y] for y in range(tile_size) for x in range(tile_size)
+        )
+    if rotation == ROTATION_270:
+        return bytes(
+            pixels[x * tile_size + last - y] for y in range(tile_size) for x in range(tile_size)
+        )
+    raise ValueError("rotation must be a quarter turn")
+
+
+def read_bmp_header(bmp_file) -> BmpHeader:
+    """
+    Parse the header and palette of an uncompressed, indexed BMP file.
+
+    Args:
+        bmp_file: The file, opened in binary mode.
+
+    Returns:
+        The parsed header. palette is a list of 0xRRGGBB colours.
+
+    Raises:
+        ValueError is raised if the file isn't an uncompressed BMP with 1,
+        4 or 8 bits per pixel.
+    """
+
+    bmp_file.seek(0)
+    header = bmp_file.read(_FILE_HEADER_SIZE + struct.calcsize(_INFO_HEADER) + 16)
+    try:
+        signature, _, _, _, data_offset = struct.unpack_from(_FILE_HEADER, header)
+        info_size, width, height, _, bits_per_pixel, compression = struct.unpack_from(
+            _INFO_HEADER, header, _FILE_HEADER_SIZE
+        )
+        (colours_used,) = struct.unpack_from("<I", header, _FILE_HEADER_SIZE + 32)
+    except struct.error as error:
+        raise ValueError("truncated BMP header") from error
+    if signature != b"BM" or compression != 0 or bits_per_pixel not in (1, 4, 8):
+        raise ValueError("not an uncompressed indexed BMP file")
+
+    bmp_file.seek(_FILE_HEADER_SIZE + info_size)
+    num_colours = colours_used or 1 << bits_per_pixel
+    palette_data = bmp_file.read(4 * num_colours)
+    palette = [
+        palette_data[i + 2] << 16 | palette_data[i + 1] << 8 | palette_data[i]
+        for i in range(0, len(palette_data) - 3, 4)
+    ]
+    return BmpHeader(
+        width=width,
+        height=abs(height),
+        bits_per_pixel=bits_per_pixel,
+        data_offset=data_offset,
+        row_stride=((width * bits_per_pixel + 31) // 32) * 4,
+        bottom_up=height > 0,
+        palette=palette,
+    )
+
+
+class SpriteSheet:
+    """
+    A BMP sheet of square sprite tiles, numbered left to right and top to
+    bottom.
+    """
+
+    def __init__(self, path: str, tile_size: int) -> None:
+        """
+        Open a sprite sheet and parse its header.
+
+        Args:
+            path (str): The path of the BMP file.
+            tile_size (int): The width and height of each tile, in pixels.
+
+        Raises:
+            ValueError is raised if the file isn't an indexed BMP or isn't a
+            whole number of tiles.
+        """
+        self.path: str = path
+        self.tile_size: int = tile_size
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        self.header: BmpHeader = read_bmp_header(self._file)
+        if self.header.width % tile_size or self.header.height % tile_size:
+            raise ValueError("sheet isn't a whole number of tiles")
+        self.columns: int = self.header.width // tile_size
+        self.rows: int = self.header.height // tile_size
+        self._mapping = None
+        self._pixels: Optional[memoryview] = None
+        self._bitmap = None
+        self._tiles: Dict[int, bytes] = {}
+        self._variants: Dict[int, List[bytes]] = {}
+
+    @property
+    def num_tiles(self) -> int:
+        """
+        Retrieve the number of tiles in the sheet.
+        """
+        return self.columns * self.rows
+
+    @property
+    def palette(self) -> List[int]:
+        """
+        Retrieve the sheet's palette, as 0xRRGGBB colours. Index 0 is the
+        transparent colour.
+        """
+        return self.header.palette
+
+    def _read(self, offset: int, length: int):
+        """
+        Read bytes of the file. With mmap, the file is mapped into memory
+        the first time, and this is a slice of the mapping; without it
+        (CircuitPython), it's a seek and a read.
+        """
+        if mmap is None:
+            self._file.seek(offset)
+            return self._file.read(length)
+        if self._pixels is None:
+            self._mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._pixels = memoryview(self._mapping)
+        return self._pixels[offset : offset + length]
+
+    def _file_row(self, y: int) -> int:
+        """
+        Translate a row counted from the top into the row's file offset.
+        """
+        header = self.header
+        if header.bottom_up:
+            y = header.height - 1 - y
+        return header.data_offset + y * header.row_stride
+
+    def pixel(self, x: int, y: int) -> int:
+        """
+        Retrieve the palette index of a pixel, counting y from the top.
+        """
+        header = self.header
+        if not (0 <= x < header.width and 0 <= y < header.height):
+            raise IndexError("pixel out of range")
+        bits_per_pixel = header.bits_per_pixel
+        bit_offset = x * bits_per_pixel
+        pixel_byte = self._read(self._file_row(y) + (bit_offset >> 3), 1)[0]
+        shift = 8 - bits_per_pixel - (bit_offset & 7)
+        return (pixel_byte >> shift) & ((1 << bits_per_pixel) - 1)
+
+    def tile_pixels(self, tile_index: int) -> bytes:
+        """
+        Retrieve a tile's pixels, one palette index per byte, row by row
+        from the top. Each tile is decoded once and then kept.
+        """
+        tile = self._tiles.get(tile_index)
+        if tile is not None:
+            return tile
+        if not 0 <= tile_index < self.num_tiles:
+            raise IndexError("tile out of range")
+        tile_size = self.tile_size
+        bits_per_pixel = self.header.bits_per_pixel
+        mask = (1 << bits_per_pixel) - 1
+        first_bit = (tile_index % self.columns) * tile_size * bits_per_pixel
+        skip = first_bit & 7
+        span = (skip + tile_size * bits_per_pixel + 7) >> 3
+        top = (tile_index // self.columns) * tile_size
+        decoded = bytearray()
+        for y in range(tile_size):
+            row = self._read(self._file_row(top + y) + (first_bit >> 3), span)
+            for x in range(tile_size):
+                bit = skip + x * bits_per_pixel
+                decoded.append((row[bit >> 3] >> (8 - bits_per_pixel - (bit & 7))) & mask)
+        tile = bytes(decoded)
+        self._tiles[tile_index] = tile
+        return tile
+
+    def rotated_tile_pixels(self, tile_index: int, rotation: int) -> bytes:
+        """
+        Retrieve a tile's pixels turned clockwise by a quarter turn, so
+        drawing a rotated sprite is a plain copy.
+
+        The first request for a rotation turns every tile of the sheet
+        once; later requests are a list lookup.
+
+        Args:
+            tile_index (int): The tile.
+            rotation (int): ROTATION_0, ROTATION_90, ROTATION_180 or
+                ROTATION_270.
+
+        Raises:
+            ValueError is raised if the rotation isn't a quarter turn.
+        """
+        if rotation == ROTATION_0 or not 0 <= tile_index < self.num_tiles:
+            return self.tile_pixels(tile_index)
+        variant = self._variants.get(rotation)
+        if variant is None:
+            if rotation not in (ROTATION_90, ROTATION_180, ROTATION_270):
+                raise ValueError("rotation must be a quarter turn")
+            variant = [
+                rotate_tile(self.tile_pixels(index), self.tile_size, rotation)
+                for index in range(self.num_tiles)
+            ]
+            self._variants[rotation] = variant
+        return variant[tile_index]
+
+    @property
+    def bitmap(self):
+        """
+        Retrieve the sheet as a ``displayio.OnDiskBitmap``, created on first
+        use and then shared by every tile grid.
+        """
+        if self._bitmap is None:
+            if displayio is None:
+                raise RuntimeError("displayio is not available")
+            self._bitmap = displayio.OnDiskBitmap(self._file)
+        return self._bitmap
+
+    def tile_grid(self, tile_index: int, x: int = 0, y: int = 0):
+        """
+        Create a one-tile ``displayio.TileGrid`` showing a tile of the
+        sheet.
+
+        Args:
+            tile_index (int): The tile to show.
+            x (int): The grid's x position.
+            y (int): The grid's y position.
+        """
+        bitmap = self.bitmap
+        return displayio.TileGrid(
+            bitmap,
+            pixel_shader=bitmap.pixel_shader,
+            width=1,
+            height=1,
+            tile_width=self.tile_size,
+            tile_height=self.tile_size,
+            default_tile=tile_index,
+            x=x,
+            y=y,
+        )
+
+    def close(self) -> None:
+        """
+        Release the memory mapping and close the file.
+        """
+        if self._pixels is not None:
+            self._pixels.release()
+            self._pixels = None
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+        self._file.close()
+
+    def __enter__(self) -> "SpriteSheet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SpriteAtlas:
+    """
+    The bundled sprite sheets, opened on first use and then kept.
+    """
+
+    def __init__(self, asset_dir: Optional[str] = None) -> None:
+        """
+        Create an atlas.
+
+        Args:
+            asset_dir (Optional[str]): The directory holding the sheets.
+                Defaults to the package's ``assets`` directory.
+        """
+        self.asset_dir: str = _default_asset_dir() if asset_dir is None else asset_dir
+        self._sheets: Dict[Tuple[str, int], SpriteSheet] = {}
+
+    def sheet(self, kind: str, size: int) -> SpriteSheet:
+        """
+        Retrieve a sheet, opening it on first use.
+
+        Args:
+            kind (str): "card_symbols", "card_front_sprites" or
+                "card_back_sprites".
+            size (int): The tile size, in pixels.
+        """
+        key = (kind, size)
+        the_sheet = self._sheets.get(key)
+        if the_sheet is None:
+            the_sheet = SpriteSheet(f"{self.asset_dir}/{kind}_{size}x{size}.bmp", size)
+            self._sheets[key] = the_sheet
+        return the_sheet
+
+    def symbols(self, size: int) -> SpriteSheet:
+        """
+        Retrieve the symbol sheet with the given tile size.
+        """
+        return self.sheet("card_symbols", size)
+
+    def fronts(self, size: int) -> SpriteSheet:
+        """
+        Retrieve the card front frame sheet (3 x 3 tiles) with the given
+        tile size.
+        """
+        return self.sheet("card_front_sprites", size)
+
+    def backs(self, size: int) -> SpriteSheet:
+        """
+        Retrieve the card back frame sheet (3 x 3 tiles) with the given
+        tile size.
+        """
+        return self.sheet("card_back_sprites", size)
+
+    def card_tiles(
+        self, rank: str, suit: str, size: int, colour: Optional[int] = None
+    ) -> CardTiles:
+        """
+        Look up the symbol tiles for a card.
+
+        Args:
+            rank (str): The card's rank ("A", "2" ... "10", "J", "Q", "K").
+            suit (str): The card's suit ("C", "D", "H" or "S").
+            size (int): The symbol size, in pixels (see SYMBOL_SIZES).
+            colour (Optional[int]): COLOUR_BLACK or COLOUR_RED. Defaults to
+                the suit's colour.
+
+        Returns:
+            A CardTiles tuple: the symbol sheet and the tile indexes of the
+            rank and the suit.
+
+        Raises:
+            ValueError is raised if the rank or suit has no symbol.
+        """
+        suit = str(suit)
+        if colour is None:
+            colour = SUIT_COLOURS.get(suit, COLOUR_BLACK)
+        rank_tile = SYMBOL_TILES.get((str(rank), colour))
+        suit_tile = SYMBOL_TILES.get((suit, colour))
+        if rank_tile is None or suit_tile is None or suit not in SUIT_COLOURS:
+            raise ValueError("card has no symbol sprites")
+        return CardTiles(self.symbols(size), rank_tile, suit_tile)
+
+    def close(self) -> None:
+        """
+        Close every open sheet.
+        """
+        for the_sheet in self._sheets.values():
+            the_sheet.close()
+        self._sheets = {}
@@ -0,0 +1,169 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2022 Tammy Cravit
+#
+#  SPDX-License-Identifier: MIT
+
+"""
+tmt_carddeck: CircuitPython Card Deck library.
+
+Batch shuffling and hand evaluation over arrays of face codes.
+
+If NumPy is installed, the functions here work on whole ``(batch, n)``
+arrays at once. Without it (on CircuitPython, for instance) they fall
+back to looping in Python and return lists instead.
+"""
+
+try:
+    from typing import List, Optional, Sequence  # noqa
+except ImportError:
+    pass
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY: bool = True
+except ImportError:
+    np = None  # pylint: disable=invalid-name
+    HAVE_NUMPY = False
+
+from tmt_carddeck import codes
+from tmt_carddeck.constants import DEFAULT_SUIT_ORDER
+from tmt_carddeck.deck import PackedDeck, _make_rng
+
+STANDARD_FACE_CODES: List[int] = list(range(codes.BLANK_CODE + 1, codes.JOKER_CODE))
+
+_NUMPY_TABLES: dict = {}
+
+
+def shuffle_batch(
+    batch_size: int,
+    face_codes: Optional[Sequence[int]] = None,
+    rng=None,
+    seed: Optional[int] = None,
+):
+    """
+    Shuffle many copies of a deck at once.
+
+    With NumPy, each row is ordered by sorting a row of random keys
+    (argsort), so the whole batch is shuffled in a few array operations.
+
+    Args:
+        batch_size (int): The number of shuffled decks to produce.
+        face_codes (Optional[Sequence[int]]): The deck's face codes.
+            Defaults to the 52 standard cards.
+        rng: With NumPy, a numpy.random.Generator; otherwise, anything
+            `Deck.shuffle` accepts.
+        seed (Optional[int]): Seed for a new generator, if rng isn't given.
+
+    Returns:
+        A (batch_size, len(face_codes)) uint8 array, or a list of lists
+        without NumPy.
+    """
+    if face_codes is None:
+        face_codes = STANDARD_FACE_CODES
+
+    if HAVE_NUMPY:
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        deck = np.asarray(face_codes, dtype=np.uint8)
+        order = np.argsort(rng.random((batch_size, len(deck))), axis=1)
+        return deck[order]
+
+    if rng is None:
+        rng = _make_rng(seed)
+    the_deck = PackedDeck(face_codes)
+    shuffled = []
+    for _ in range(batch_size):
+        the_deck.reset_deck()
+        the_deck.shuffle(rng=rng)
+        shuffled.append(list(the_deck.face_codes))
+    return shuffled
+
+
+def _numpy_tables(evaluator) -> tuple:
+    """
+    Build (once per evaluator) the array versions of the evaluator's tables
+    and of the per-face-code prime, suit and rank bit lookups.
+    """
+    tables = _NUMPY_TABLES.get(id(evaluator))
+    if tables is not None and tables[0] is evaluator:
+        return tables[1]
+
+    # pylint: disable=import-outside-toplevel
+    from tmt_carddeck.eval import RANK_PRIMES
+
+    products, flushes = evaluator.tables
+    product_keys = np.array(sorted(products), dtype=np.int64)
+    product_scores = np.array([products[key] for key in product_keys.tolist()], dtype=np.int32)
+
+    face_primes = np.zeros(codes.NUM_FACE_CODES, dtype=np.int64)
+    face_suits = np.zeros(codes.NUM_FACE_CODES, dtype=np.int8)
+    face_rank_bits = np.zeros(codes.NUM_FACE_CODES, dtype=np.int32)
+    for face_code in STANDARD_FACE_CODES:
+        face_primes[face_code] = RANK_PRIMES[codes.face_rank_index(face_code)]
+        face_suits[face_code] = codes.face_suit_index(face_code)
+        face_rank_bits[face_code] = 1 << codes.face_rank_index(face_code)
+
+    array_tables = (
+        product_keys,
+        product_scores,
+        np.array(flushes, dtype=np.int32),
+        face_primes,
+        face_suits,
+        face_rank_bits,
+    )
+    _NUMPY_TABLES[id(evaluator)] = (evaluator, array_tables)
+    return array_tables
+
+
+def evaluate_batch(hands, evaluator=None):
+    """
+    Score many poker hands at once.
+
+    Args:
+        hands: A (batch, k) array or sequence of face codes, k = 5, 6 or 7.
+        evaluator: The `tmt_carddeck.eval.HandEvaluator` whose tables to
+            use. Defaults to the shared evaluator.
+
+    Returns:
+        A (batch,) int32 array of scores, or a list without NumPy.
+
+    Raises:
+        ValueError is raised if a hand has the wrong number of cards or
+        includes a blank card or joker.
+    """
+    if evaluator is None:
+        # pylint: disable=import-outside-toplevel
+        from tmt_carddeck.eval import get_evaluator
+
+        evaluator = get_evaluator()
+
+    if not HAVE_NUMPY:
+        return [evaluator.evaluate_codes(hand) for hand in hands]
+
+    hands = np.asarray(hands, dtype=np.intp)
+    if hands.ndim != 2 or not 5 <= hands.shape[1] <= 7:
+        raise ValueError("hands must be a (batch, 5-7) array")
+    if hands.size and (hands.min() <= codes.BLANK_CODE or hands.max() >= codes.JOKER_CODE):
+        raise ValueError("hand can only contain standard cards")
+    product_keys, product_scores, flushes, face_primes, face_suits, face_rank_bits = _numpy_tables(
+        evaluator
+    )
+
+    products = np.prod(face_primes[hands], axis=1)
+    positions = np.minimum(np.searchsorted(product_keys, products), len(product_keys) - 1)
+    if not np.array_equal(product_keys[positions], products):
+        raise ValueError("hand has more than four cards of one rank")
+    return np.maximum(
+        product_scores[positions], _flush_scores(face_suits[hands], face_rank_bits[hands], flushes)
+    )
+
+
+def _flush_scores(suits, rank_bits, flushes):
+    """
+    Return the best flush score of each hand (0 if it has no flush).
+    """
+    scores = np.zeros(len(suits), dtype=flushes.dtype)
+    for suit in range(len(DEFAULT_SUIT_ORDER)):
+        suit_masks = np.where(suits == suit, rank_bits, 0).sum(axis=1)
+        scores = np.maximum(scores, flushes[suit_masks])
+    return scores